@@ -0,0 +1,17 @@
+"""Timing helpers shared by the benchmark scripts."""
+import time
+
+
+def timed_result(func, *args, repeat=1, **kwargs):
+    """best wall time in seconds of `repeat` calls of func(*args, **kwargs), and the result of the last call"""
+    best, out = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def timed(func, *args, repeat=1, **kwargs):
+    """best wall time in seconds of `repeat` calls of func(*args, **kwargs)"""
+    return timed_result(func, *args, repeat=repeat, **kwargs)[0]
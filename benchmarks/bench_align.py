@@ -0,0 +1,33 @@
+"""Pairing two Series by index in ctable: the previous occurrence merge against _align_series.
+
+    python benchmarks/bench_align.py [n_rows]
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from summarytools.ctable import _align_series
+
+from _util import timed
+
+
+def merge_align(x, y):
+    # the previous pairing: Python lists of the index, two cumcounts and a merge
+    x_df = pd.DataFrame({'_index': list(x.index), '_x': x.to_numpy()})
+    y_df = pd.DataFrame({'_index': list(y.index), '_y': y.to_numpy()})
+    x_df['_occurrence'] = x_df.groupby('_index', sort=False, dropna=False).cumcount()
+    y_df['_occurrence'] = y_df.groupby('_index', sort=False, dropna=False).cumcount()
+    df = pd.merge(x_df, y_df, on=['_index', '_occurrence'], how='inner')
+    return df['_x'].to_numpy(), df['_y'].to_numpy()
+
+
+if __name__ == '__main__':
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    rng = np.random.default_rng(0)
+    x = pd.Series(rng.integers(0, 2_000, size=n_rows), name='zip')
+    y = pd.Series(rng.integers(0, 300, size=n_rows), name='product')
+    shuffled = y.sample(frac=1, random_state=0)
+    for label, other in [('same index', y), ('shuffled index', shuffled)]:
+        print(f'{label:>15}: merge {timed(merge_align, x, other):6.2f}s   '
+              f'_align_series {timed(_align_series, x, other):6.2f}s')
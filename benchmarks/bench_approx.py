@@ -0,0 +1,37 @@
+"""Speed and accuracy of dfSummary(approx=True) against exact mode.
+
+    python benchmarks/bench_approx.py [n_rows]
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from summarytools.summarytools import _summarize_col, _summarize_col_approx
+
+from _util import timed_result
+
+
+def make_frame(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'normal': rng.normal(size=n_rows),
+        'ids': rng.integers(0, n_rows // 2, size=n_rows).astype(float),
+        'zipf': rng.zipf(1.5, size=n_rows).astype(str),
+    })
+
+
+if __name__ == '__main__':
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    frame = make_frame(n_rows)
+    for col in frame.columns:
+        x = frame[col]
+        exact_t, _ = timed_result(_summarize_col, x, show_graph=False)
+        approx_t, out = timed_result(_summarize_col_approx, x, show_graph=False)
+        line = f'{col:>7}  exact: {exact_t:6.2f}s  approx: {approx_t:6.2f}s'
+        if x.dtype == float:
+            est = float(out['Freqs / (% of Valid)'].split()[0].strip('~').replace(',', ''))
+            line += f'  distinct err: {est / x.nunique() - 1:+.2%}'
+            med = float(out['Stats / Values'].split('~')[1].split()[0])
+            line += f'  median rank err: {(x < med).mean() - 0.5:+.3%}'
+        print(line)
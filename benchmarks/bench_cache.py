@@ -0,0 +1,29 @@
+"""dfSummary re-run on a frame where one column changed: no cache, cold cache, warm cache.
+
+    python benchmarks/bench_cache.py [n_rows] [n_cols]
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from summarytools import SummaryCache, dfSummary
+
+from _util import timed
+
+
+if __name__ == '__main__':
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_cols = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    rng = np.random.default_rng(0)
+    words = np.array([f'word {i}' for i in range(50)], dtype=object)
+    data = pd.DataFrame({f'c{i}': words[rng.integers(0, 50, size=n_rows)] if i % 2 else rng.normal(size=n_rows)
+                         for i in range(n_cols)})
+    cache = SummaryCache()
+    print(f'{n_rows:,} rows x {n_cols} columns')
+    print(f'  no cache:             {timed(dfSummary, data, name="data"):6.2f}s')
+    print(f'  cold cache:           {timed(dfSummary, data, name="data", cache=cache):6.2f}s')
+    print(f'  warm, unchanged:      {timed(dfSummary, data, name="data", cache=cache):6.2f}s')
+    data['c0'] = data['c0'] + 1
+    print(f'  warm, 1 column new:   {timed(dfSummary, data, name="data", cache=cache):6.2f}s')
+    print(f'  warm, no duplicates:  {timed(dfSummary, data, name="data", cache=cache, count_duplicates=False):6.2f}s')
@@ -0,0 +1,63 @@
+"""ctable on large inputs: the previous string groupby and per-cell loop against the current code.
+
+    python benchmarks/bench_ctable.py [n_rows] [n_x_levels] [n_y_levels]
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from summarytools import ctable
+from summarytools.ctable import _factorize_labels
+from summarytools.summarytools import _fmt_array, _fmt_freq, _fmt_pct
+
+from _util import timed
+
+
+def count_groupby(x, y):
+    # the previous counting: stringify every row, then group and unstack
+    df = pd.DataFrame({'_x': x.to_numpy(), '_y': y.to_numpy()})
+    df['_x'] = df['_x'].where(df['_x'].notna(), 'NaN')
+    df['_y'] = df['_y'].where(df['_y'].notna(), 'NaN')
+    df = df.astype({'_x': str, '_y': str})
+    return df.groupby(['_x', '_y']).size().unstack().fillna(0)
+
+
+def count_bincount(x, y):
+    x_codes, x_labels = _factorize_labels(x)
+    y_codes, y_labels = _factorize_labels(y)
+    counts = np.bincount(x_codes * len(y_labels) + y_codes, minlength=len(x_labels) * len(y_labels))
+    return counts.reshape(len(x_labels), len(y_labels))
+
+
+def format_loop(counts, pcts, digits=2):
+    # the previous per-cell rendering
+    out = pd.DataFrame(index=range(counts.shape[0]), columns=range(counts.shape[1]), dtype=object)
+    for i in range(counts.shape[0]):
+        for j in range(counts.shape[1]):
+            out.iat[i, j] = f'{_fmt_freq(counts[i, j])} ({_fmt_pct(pcts[i, j], digits=digits)})'
+    return out
+
+
+def format_vectorized(counts, pcts, digits=2):
+    cells = _fmt_array(counts, _fmt_freq)
+    cells = np.char.add(np.char.add(cells, ' ('), np.char.add(_fmt_array(pcts, lambda v: _fmt_pct(v, digits)), ')'))
+    return pd.DataFrame(cells, dtype=object)
+
+
+if __name__ == '__main__':
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    n_x = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    n_y = int(sys.argv[3]) if len(sys.argv) > 3 else 300
+    rng = np.random.default_rng(0)
+    counts = rng.poisson(n_rows / (n_x * n_y), size=(n_x, n_y)).astype(float)
+    pcts = counts / counts.sum(axis=1, keepdims=True) * 100
+    print(f'{n_x:,} x {n_y} cells')
+    print(f'  per-cell loop: {timed(format_loop, counts, pcts):7.2f}s')
+    print(f'     vectorized: {timed(format_vectorized, counts, pcts):7.2f}s')
+    x = pd.Series(rng.integers(0, n_x, size=n_rows), name='zip')
+    y = pd.Series(rng.integers(0, n_y, size=n_rows), name='product')
+    print(f'{n_rows:,} rows')
+    print(f'  groupby count: {timed(count_groupby, x, y):7.2f}s')
+    print(f' bincount count: {timed(count_bincount, x, y):7.2f}s')
+    print(f'   ctable total: {timed(ctable, x, y):7.2f}s')
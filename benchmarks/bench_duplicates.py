@@ -0,0 +1,40 @@
+"""Duplicate rows of a wide frame with object columns: DataFrame.duplicated against hashed row digests.
+
+    python benchmarks/bench_duplicates.py [n_rows] [n_cols]
+"""
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from summarytools.duplicates import _DuplicateCounter
+
+
+def measured(func, *args):
+    # timed and traced in separate runs, as tracing slows down allocation-heavy code
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 2 ** 20
+
+
+if __name__ == '__main__':
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_cols = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    rng = np.random.default_rng(0)
+    words = np.array([f'word {i}' for i in range(1_000)], dtype=object)
+    data = pd.DataFrame({f'c{i}': words[rng.integers(0, 1_000, size=n_rows)] if i % 2 else rng.integers(0, 100, size=n_rows)
+                         for i in range(n_cols)})
+    data = pd.concat([data, data.sample(n_rows // 10, random_state=0)], ignore_index=True)
+    print(f'{len(data):,} rows x {n_cols} columns, half object')
+    for name, func in [('duplicated', lambda d: int(d.duplicated().sum())),
+                       ('hashed', lambda d: _DuplicateCounter().update(d).n_dups),
+                       ('approx', lambda d: _DuplicateCounter(approx=True).update(d).n_dups)]:
+        n_dups, elapsed, peak = measured(func, data)
+        print(f'  {name:10s} {n_dups:>10,} duplicates {elapsed:6.2f}s  peak {peak:8.1f} MiB')
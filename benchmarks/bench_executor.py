@@ -0,0 +1,39 @@
+"""dfSummary(executor=...) wall time on a wide numeric frame.
+
+    python benchmarks/bench_executor.py [n_rows] [n_cols] [num_workers]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from summarytools import dfSummary
+
+
+def make_frame(n_rows, n_cols, seed=0):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({f'x{i}': rng.normal(size=n_rows) for i in range(n_cols)})
+    frame['label'] = rng.choice(['a', 'b', 'c'], size=n_rows)
+    return frame
+
+
+def best_of(repeat=3, **kwargs):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        dfSummary(frame, **kwargs)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == '__main__':
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_cols = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    num_workers = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count()
+    frame = make_frame(n_rows, n_cols)
+    dfSummary(frame.head(10), executor='process', num_workers=num_workers)  # start the pool once
+    print(f'{n_rows:,} rows x {n_cols + 1} columns, {num_workers} workers')
+    for executor in ('serial', 'thread', 'process', 'auto'):
+        print(f'{executor:>8}: {best_of(executor=executor, num_workers=num_workers):6.2f}s')
@@ -0,0 +1,33 @@
+"""freq on a large categorical column, unweighted and weighted, against the previous groupby counting.
+
+    python benchmarks/bench_freq.py [n_rows]
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from summarytools import freq
+
+from _util import timed
+
+
+def groupby_counts(s, w=None):
+    # the previous counting: a float64 ones vector grouped by value
+    w = pd.Series(np.ones(len(s)), index=s.index) if w is None else pd.Series(w, index=s.index)
+    is_na = s.isna()
+    return w[~is_na].groupby(s[~is_na]).sum()
+
+
+if __name__ == '__main__':
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000_000
+    rng = np.random.default_rng(0)
+    levels = np.array([f'region {i}' for i in range(50)], dtype=object)
+    s = pd.Series(pd.Categorical.from_codes(rng.integers(0, 50, size=n_rows), levels), name='region')
+    w = rng.gamma(2.0, size=n_rows)
+    for label, col in [('category', s), ('strings', s.astype(str))]:
+        print(f'{n_rows:,} rows, 50 levels, {label}')
+        print(f'  groupby, unweighted: {timed(groupby_counts, col, repeat=3):6.2f}s')
+        print(f'  freq, unweighted:    {timed(freq, col, repeat=3):6.2f}s')
+        print(f'  groupby, weighted:   {timed(groupby_counts, col, w, repeat=3):6.2f}s')
+        print(f'  freq, weighted:      {timed(freq, col, weights=w, repeat=3):6.2f}s')
@@ -0,0 +1,22 @@
+"""Frequency tables of many columns: a freq() loop against freq_many.
+
+    python benchmarks/bench_freq_many.py [n_rows] [n_cols]
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from summarytools import freq, freq_many
+
+from _util import timed
+
+
+if __name__ == '__main__':
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_cols = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({f'c{i}': rng.integers(0, 20, size=n_rows) for i in range(n_cols)})
+    print(f'{n_rows:,} rows x {n_cols} columns')
+    print(f'  freq loop: {timed(lambda: [freq(frame, var=c) for c in frame.columns]):6.2f}s')
+    print(f'  freq_many: {timed(freq_many, frame):6.2f}s')
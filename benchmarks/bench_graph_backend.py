@@ -0,0 +1,38 @@
+"""Compare dfSummary wall time with the svg and matplotlib graph backends on wide frames.
+
+    python benchmarks/bench_graph_backend.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from summarytools import dfSummary
+
+
+def make_frame(n_rows, n_cols, seed=0):
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i in range(n_cols):
+        if i % 2 == 0:
+            data[f'num_{i}'] = rng.normal(size=n_rows)
+        else:
+            data[f'cat_{i}'] = rng.choice(list('abcdefghijkl'), size=n_rows)
+    return pd.DataFrame(data)
+
+
+def bench(frame, graph_backend, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        dfSummary(frame, graph_backend=graph_backend).to_html()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == '__main__':
+    for n_cols in (50, 200, 400):
+        frame = make_frame(10_000, n_cols)
+        svg = bench(frame, 'svg')
+        mpl = bench(frame, 'matplotlib', repeat=1)
+        print(f'{n_cols:>4} cols  svg: {svg:7.2f}s  matplotlib: {mpl:7.2f}s  speedup: {mpl / svg:5.1f}x')
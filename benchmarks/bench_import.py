@@ -0,0 +1,28 @@
+"""Import cost of summarytools, measured in fresh interpreters with `python -X importtime`.
+
+    python benchmarks/bench_import.py
+"""
+import subprocess
+import sys
+
+STATEMENTS = [
+    'import summarytools',
+    'from summarytools import dfSummary',
+    'from summarytools import freq, ctable',
+    'import pandas',
+]
+
+
+def total_ms(statement: str) -> float:
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            capture_output=True, text=True, check=True)
+    # the cumulative column of top-level imports adds up to the whole statement
+    top = [line.split('|') for line in result.stderr.splitlines()
+           if line.startswith('import time:') and '|' in line and not line.split('|')[2].startswith('  ')]
+    return sum(int(cumulative) for _, cumulative, _ in top if cumulative.strip().isdigit()) / 1000
+
+
+if __name__ == '__main__':
+    for statement in STATEMENTS:
+        best = min(total_ms(statement) for _ in range(5))
+        print(f'  {statement:40s} {best:8.1f} ms')
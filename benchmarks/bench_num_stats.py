@@ -0,0 +1,31 @@
+"""Compare the batched numeric stats kernel with per-column pandas reductions.
+
+    python benchmarks/bench_num_stats.py
+"""
+
+import numpy as np
+import pandas as pd
+
+from summarytools.summarytools import _num_stats_frame
+
+from _util import timed
+
+
+def per_column(frame):
+    out = {}
+    for i, col in enumerate(frame.columns):
+        x = frame[col]
+        out[i] = (x.mean(), x.std(), x.min(), x.median(), x.max(), x.std(),
+                  x.quantile(0.75), x.quantile(0.25), x.nunique(),
+                  np.histogram(x[~x.isna()], bins=10))
+    return out
+
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(0)
+    for n_rows, n_cols in ((100_000, 50), (100_000, 400), (1_000_000, 50)):
+        frame = pd.DataFrame(rng.normal(size=(n_rows, n_cols)))
+        frame.iloc[::10, ::3] = np.nan
+        old = timed(per_column, frame)
+        new = timed(_num_stats_frame, frame)
+        print(f'{n_rows:>9,} x {n_cols:<4} per-column: {old:6.2f}s  kernel: {new:6.2f}s  speedup: {old / new:4.1f}x')
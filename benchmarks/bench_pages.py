@@ -0,0 +1,23 @@
+"""Time to the first rendered dfSummary page as the number of columns grows, against the full table.
+
+    python benchmarks/bench_pages.py [page_size]
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from summarytools import dfSummary
+
+from _util import timed
+
+
+if __name__ == '__main__':
+    page_size = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    rng = np.random.default_rng(0)
+    print(f'10,000 rows, pages of {page_size} columns, default options')
+    for n_cols in (300, 1_000, 3_000):
+        data = pd.DataFrame({f'c{i}': rng.normal(size=10_000) for i in range(n_cols)})
+        first = timed(dfSummary, data, name='data', page_size=page_size, output='html')
+        full = timed(dfSummary, data, name='data', output='html')
+        print(f'  {n_cols:6,} columns: first page {first:6.2f}s   full table {full:6.2f}s')
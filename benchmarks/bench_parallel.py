@@ -0,0 +1,46 @@
+"""dfSummary column stats: serial, a fresh mp.Pool per call, and the persistent shared-memory pool.
+
+    python benchmarks/bench_parallel.py [n_rows] [n_cols] [num_proc]
+"""
+import multiprocessing as mp
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from summarytools.summary import get_stats
+from summarytools.summarytools import _get_stats, _summarize_col
+
+
+def fresh_pool_stats(df, num_proc):
+    # the previous get_stats: pickle every column to a new pool
+    data = [(df[col], 10, 'df', i, False) for i, col in enumerate(df.columns)]
+    with mp.Pool(num_proc) as pool:
+        return pool.starmap(_summarize_col, data)
+
+
+def make_frame(n_rows, n_cols, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({f'x{i}': rng.normal(size=n_rows) for i in range(n_cols)})
+
+
+def best_of(func, *args, repeat=3, **kwargs):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == '__main__':
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_cols = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    num_proc = int(sys.argv[3]) if len(sys.argv) > 3 else mp.cpu_count()
+    frame = make_frame(n_rows, n_cols)
+    get_stats(frame.iloc[:10], num_proc, show_graph=False)  # start the pool once
+    print(f'{n_rows:,} rows x {n_cols} columns, {num_proc} processes')
+    print(f'          serial: {best_of(_get_stats, frame, 10, "df", False):6.2f}s')
+    print(f'   fresh mp.Pool: {best_of(fresh_pool_stats, frame, num_proc):6.2f}s')
+    print(f'persistent + shm: {best_of(get_stats, frame, num_proc, show_graph=False):6.2f}s')
@@ -0,0 +1,42 @@
+"""Column-type dispatch on a wide frame: per-column string comparisons against one summary_plan pass.
+
+    python benchmarks/bench_plan.py [n_cols]
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from summarytools import summary_plan
+
+from _util import timed
+
+
+def string_dispatch(data):
+    # the previous per-column checks, as in _is_categorical / _is_datetime / _is_bool / _is_numerical
+    kinds = []
+    for _, x in data.items():
+        try:
+            is_category = x.dtype == 'category'
+        except Exception:  # noqa
+            is_category = False
+        if is_category or x.dtype in ['object', 'str']:
+            kinds.append('categorical')
+        elif pd.api.types.is_datetime64_any_dtype(x):
+            kinds.append('datetime')
+        elif x.dtype == bool:
+            kinds.append('bool')
+        elif pd.api.types.is_numeric_dtype(x):
+            kinds.append('numeric')
+        else:
+            kinds.append('unsupported')
+    return kinds
+
+
+if __name__ == '__main__':
+    n_cols = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    dtypes = ['int64', 'int32', 'float32', 'float64', 'bool', 'object', 'datetime64[ns]']
+    data = pd.DataFrame({f'c{i}': np.zeros(10).astype(dtypes[i % len(dtypes)]) for i in range(n_cols)})
+    print(f'{n_cols:,} columns of {len(dtypes)} dtypes')
+    print(f'  string comparisons: {timed(string_dispatch, data, repeat=5) * 1e3:8.1f} ms')
+    print(f'  summary_plan:       {timed(summary_plan, data, repeat=5) * 1e3:8.1f} ms')
@@ -0,0 +1,29 @@
+"""Rendering a dfSummary, freq and ctable report: Styler.to_html() against output='html' and output='data'.
+
+    python benchmarks/bench_render.py [n_cols]
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from summarytools import ctable, dfSummary, freq
+
+from _util import timed
+
+
+def report(data, output):
+    if output == 'styler':
+        return [dfSummary(data, name='data').to_html(), freq(data, 'c0', name='data').to_html(),
+                ctable('c0', 'c1', data=data, name='data').to_html()]
+    return [dfSummary(data, name='data', output=output), freq(data, 'c0', name='data', output=output),
+            ctable('c0', 'c1', data=data, name='data', output=output)]
+
+
+if __name__ == '__main__':
+    n_cols = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({f'c{i}': rng.integers(0, 8 if i % 2 else 1000, 10_000) for i in range(n_cols)})
+    print(f'{len(data):,} rows x {n_cols:,} columns')
+    for output in ('styler', 'html', 'data'):
+        print(f'  {output:7s} {timed(lambda: report(data, output), repeat=3) * 1e3:8.1f} ms')
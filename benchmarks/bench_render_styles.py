@@ -0,0 +1,45 @@
+"""Rendering a wide dfSummary table: per-cell set_properties Styler, column-styled Styler and the direct renderer.
+
+    python benchmarks/bench_render_styles.py [n_cols]
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from summarytools.summary import _style_summary, _summary_caption, _summary_table
+from summarytools.summarytools import _get_stats
+
+from _util import timed_result
+
+
+def set_properties_styler(out, caption):
+    # the previous chained set_properties calls, which write one CSS rule per cell
+    return (out.style
+            .set_properties(**{'text-align': 'left', 'font-size': '12px', 'vertical-align': 'middle'})
+            .set_table_styles([{'selector': 'thead>tr>th', 'props': 'text-align : left'}])
+            .set_properties(subset=['No'], **{'width': '5%', 'max-width': '50px', 'min-width': '20px'})
+            .set_properties(subset=['Variable'], **{'width': '15%', 'max-width': '200px', 'min-width': '100px',
+                                                    'word-break': 'break-word'})
+            .set_properties(subset=['Stats / Values'], **{'width': '30%', 'min-width': '100px'})
+            .set_properties(subset=['Freqs / (% of Valid)'], **{'width': '25%', 'min-width': '100px'})
+            .set_properties(subset=['Missing'], width='10%')
+            .set_properties(subset=['Graph'], **{'width': '20%', 'min-width': '150px'})
+            .hide(axis='index')
+            .set_caption(caption)).to_html()
+
+
+if __name__ == '__main__':
+    n_cols = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({f'c{i}': rng.integers(0, 8 if i % 2 else 1000, 1_000) for i in range(n_cols)})
+    caption = _summary_caption('data', *data.shape)
+    out = _summary_table(data.columns, data.dtypes, _get_stats(data, 10, 'data', True), len(data))
+    print(f'rendering the summary of {n_cols:,} columns')
+    for label, render in [
+            ('set_properties Styler', lambda: set_properties_styler(out, caption)),
+            ('column-styled Styler', lambda: _style_summary(out, caption, 'data', True, False).to_html()),
+            ('direct HTML', lambda: _style_summary(out, caption, 'data', True, False, 'html'))]:
+        seconds, html = timed_result(render, repeat=3)
+        size = len(html.encode())
+        print(f'  {label:22s} {seconds * 1e3:8.1f} ms {size / 1e6:8.2f} MB')
@@ -0,0 +1,38 @@
+"""Daily partitions of a growing table: dfSummary of the concatenation every day against updating a SummaryState.
+
+    python benchmarks/bench_state.py [rows_per_day] [n_days]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from summarytools import dfSummary
+
+
+def day(rng, n_rows, i):
+    return pd.DataFrame({
+        'amount': rng.gamma(2.0, 50.0, size=n_rows).round(2),
+        'store': rng.integers(0, 40, size=n_rows),
+        'channel': rng.choice(['web', 'shop', 'phone'], size=n_rows),
+        'date': pd.Timestamp('2024-01-01') + pd.Timedelta(days=i),
+    })
+
+
+if __name__ == '__main__':
+    rows_per_day = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    n_days = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    rng = np.random.default_rng(0)
+    days = [day(rng, rows_per_day, i) for i in range(n_days)]
+    print(f'{n_days} days of {rows_per_day:,} rows; time to get the summary after each day')
+    state = None
+    for i in range(n_days):
+        start = time.perf_counter()
+        dfSummary(pd.concat(days[:i + 1], ignore_index=True), name='sales')
+        full = time.perf_counter() - start
+        start = time.perf_counter()
+        state = dfSummary(days[0], return_state=True, name='sales') if state is None else state.update(days[i])
+        state.render()
+        incremental = time.perf_counter() - start
+        print(f'  day {i + 1:2d}: full {full:6.2f}s   incremental {incremental:6.2f}s')
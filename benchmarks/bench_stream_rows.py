@@ -0,0 +1,44 @@
+"""dfSummary(stream=True): time to the first row and peak memory, against rendering the whole table at once.
+
+    python benchmarks/bench_stream_rows.py [n_cols]
+"""
+import sys
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from summarytools import dfSummary
+
+from _util import timed
+
+
+def whole(data):
+    return len(dfSummary(data, name='data', output='html', count_duplicates=False, graph_backend='matplotlib'))
+
+
+def streamed(data, first_only=False):
+    size = 0
+    for piece in dfSummary(data, name='data', stream=True, output='html', count_duplicates=False, graph_backend='matplotlib'):
+        size += len(piece)
+        if first_only and '<td' in piece:
+            break
+    return size
+
+
+def peak(func, *args):
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+if __name__ == '__main__':
+    n_cols = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({f'c{i}': rng.normal(size=10_000) for i in range(n_cols)})
+    print(f'10,000 rows x {n_cols} columns, PNG graphs')
+    print(f'  whole table: {timed(whole, data):6.2f}s  peak {peak(whole, data) / 1e6:6.1f} MB')
+    print(f'  first row:   {timed(streamed, data, True):6.2f}s')
+    print(f'  streamed:    {timed(streamed, data):6.2f}s  peak {peak(streamed, data) / 1e6:6.1f} MB')
@@ -0,0 +1,49 @@
+"""Time and peak Python memory of dfSummary_from_file against read_csv + dfSummary.
+
+    python benchmarks/bench_streaming.py [n_rows] [chunksize]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from summarytools import dfSummary, dfSummary_from_file
+
+
+def write_csv(path, n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    pd.DataFrame({
+        'normal': rng.normal(size=n_rows).round(3),
+        'ids': rng.integers(0, n_rows // 2, size=n_rows),
+        'level': rng.choice(['low', 'mid', 'high'], size=n_rows),
+        'zipf': rng.zipf(1.5, size=n_rows).astype(str),
+    }).to_csv(path, index=False)
+
+
+def measured(func, *args, **kwargs):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+if __name__ == '__main__':
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    chunksize = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.csv')
+        write_csv(path, n_rows)
+        in_memory = measured(lambda: dfSummary(pd.read_csv(path), show_graph=False))
+        streamed = measured(dfSummary_from_file, path, chunksize=chunksize, show_graph=False)
+        sketched = measured(dfSummary_from_file, path, chunksize=chunksize, show_graph=False, exact_limit=10_000)
+    for name, (elapsed, peak) in [('read_csv + dfSummary', in_memory),
+                                  ('dfSummary_from_file', streamed),
+                                  ('  exact_limit=10_000', sketched)]:
+        print(f'{name:>22}: {elapsed:6.2f}s  peak {peak:8.1f} MiB')
@@ -0,0 +1,31 @@
+"""max_level truncation of an ID-like column: a full sort of the counts against partial top-k selection.
+
+    python benchmarks/bench_top_k.py [n_rows]
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from summarytools import freq
+from summarytools.summarytools import _stats_cat_col, _top_k
+
+from _util import timed
+
+
+def full_sort(counts, k):
+    # the previous truncation: sort every count, then cut
+    ordered = counts.sort_values(ascending=False)
+    return ordered.iloc[:k], ordered.iloc[k:].sum()
+
+
+if __name__ == '__main__':
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    rng = np.random.default_rng(0)
+    ids = pd.Series(rng.integers(0, n_rows // 2, size=n_rows).astype(str), name='id')
+    counts = ids.value_counts(sort=False)
+    print(f'{n_rows:,} rows, {len(counts):,} distinct values, max_level=10')
+    print(f'  full sort of counts:  {timed(full_sort, counts, 10, repeat=3):6.2f}s')
+    print(f'  top-k selection:      {timed(_top_k, counts, 10, repeat=3):6.2f}s')
+    print(f'  dfSummary column:     {timed(_stats_cat_col, ids, 10, False, repeat=3):6.2f}s')
+    print(f'  freq(max_level=10):   {timed(freq, ids, max_level=10, repeat=3):6.2f}s')
@@ -0,0 +1,47 @@
+"""Level counts for dfSummary: strings of every row against counts on the native values.
+
+    python benchmarks/bench_value_counts.py [n_rows]
+"""
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from summarytools.summarytools import _stats_cat_col, _value_counts
+
+
+def string_counts(x):
+    # the previous counting: every row converted to a Python string first
+    return x.astype(str).value_counts(sort=False)
+
+
+def measured(func, *args):
+    # timed and traced in separate runs, as tracing slows down allocation-heavy code
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20
+
+
+if __name__ == '__main__':
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    rng = np.random.default_rng(0)
+    levels = np.array([f'region {i}' for i in range(50)], dtype=object)
+    columns = {
+        'category': pd.Series(pd.Categorical.from_codes(rng.integers(0, 50, size=n_rows), levels)),
+        'int': pd.Series(rng.integers(0, 8, size=n_rows)),
+        'bool': pd.Series(rng.random(n_rows) < 0.3),
+    }
+    print(f'{n_rows:,} rows')
+    for label, x in columns.items():
+        for name, func in [('astype(str)', string_counts), ('native', _value_counts)]:
+            elapsed, peak = measured(func, x)
+            print(f'  {label:8s} {name:12s} {elapsed:6.2f}s  peak {peak:8.1f} MiB')
+        elapsed, peak = measured(_stats_cat_col, x, 10, True)
+        print(f'  {label:8s} {"_stats_cat_col":12s} {elapsed:6.2f}s  peak {peak:8.1f} MiB')
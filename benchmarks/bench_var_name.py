@@ -0,0 +1,42 @@
+"""Call overhead of table-name lookup: inspect.stack() against a frame lookup and `name=`.
+
+    python benchmarks/bench_var_name.py [stack_depth]
+"""
+import inspect
+import sys
+import timeit
+
+import pandas as pd
+
+from summarytools.summarytools import _var_name
+
+
+def _var_name_stack(var):
+    # the previous implementation, kept here for comparison
+    lcls = inspect.stack()[2][0].f_locals
+    for name in lcls:
+        if id(var) == id(lcls[name]):
+            return name
+    return ""
+
+
+def entry_point(data, lookup, name=None):
+    return lookup(data) if name is None else name
+
+
+def nested(depth, func):
+    # mimic calls made from deep inside a framework
+    return func() if depth == 0 else nested(depth - 1, func)
+
+
+if __name__ == '__main__':
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    frame = pd.DataFrame({'a': [1]})
+    cases = {
+        'inspect.stack()': lambda: entry_point(frame, _var_name_stack),
+        'sys._getframe': lambda: entry_point(frame, _var_name),
+        'name=': lambda: entry_point(frame, _var_name, name='frame'),
+    }
+    for label, case in cases.items():
+        n, total = timeit.Timer(lambda: nested(depth, case)).autorange()
+        print(f'{label:>16}: {total / n * 1e6:9.1f} us per call at stack depth {depth}')
@@ -131,7 +131,7 @@ setup(
     # For an analysis of "install_requires" vs pip's requirements files see:
     # https://packaging.python.org/discussions/install-requires-vs-requirements/
     install_requires=[
-        "pandas>=1.4.0",
+        "pandas>=1.5.0",
         "ipython>=7.20.0",
         "numpy>=1.18.5",
         "matplotlib>=3.3.0",
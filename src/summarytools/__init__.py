@@ -1,18 +1,46 @@
-from .ctable import ctable
-from .freq import freq
-from .htmlwidgets import collapsible, tabset
-from .summary import dfSummary, get_stats
-from .summarytools import _summarize_col, _summarize_col_2
+import importlib
+from typing import TYPE_CHECKING
 
 __version__ = "0.4.0"
 
-__all__ = [
-    '_summarize_col',
-    '_summarize_col_2',
-    'collapsible',
-    'dfSummary',
-    'freq',
-    'ctable',
-    'get_stats',
-    'tabset',
-]
\ No newline at end of file
+# public name -> submodule defining it; submodules (and pandas with them) are only
+# imported when one of their names is first used (PEP 562)
+_LAZY = {
+    '_summarize_col': 'summarytools',
+    '_summarize_col_2': 'summarytools',
+    'SummaryCache': 'cache',
+    'SummaryPages': 'summary',
+    'SummaryState': 'streaming',
+    'collapsible': 'htmlwidgets',
+    'dfSummary': 'summary',
+    'dfSummary_from_file': 'streaming',
+    'freq': 'freq',
+    'freq_many': 'freq',
+    'ctable': 'ctable',
+    'get_stats': 'summary',
+    'summary_plan': 'summarytools',
+    'tabset': 'htmlwidgets',
+}
+
+__all__ = list(_LAZY)
+
+if TYPE_CHECKING:
+    from .cache import SummaryCache
+    from .ctable import ctable
+    from .freq import freq, freq_many
+    from .htmlwidgets import collapsible, tabset
+    from .streaming import SummaryState, dfSummary_from_file
+    from .summary import SummaryPages, dfSummary, get_stats
+    from .summarytools import _summarize_col, _summarize_col_2, summary_plan
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{_LAZY[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,120 @@
+"""Column summaries cached by content, so repeated dfSummary calls only recompute changed columns."""
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+
+import pandas as pd
+
+# bumped whenever the layout of a column summary changes, so stale entries on disk are never served
+_CACHE_VERSION = 2
+
+
+def _fingerprint(x: pd.Series) -> str:
+    """digest of a column's dtype, length and values; its name and index are ignored"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f'{x.dtype}|{len(x)}|'.encode())
+    digest.update(pd.util.hash_pandas_object(x, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class SummaryCache:
+    """LRU cache of column summaries, keyed by column content and summary options
+
+    Args:
+        maxsize (int, optional): [column summaries kept in memory]. Defaults to 1024.
+        path (str, optional): [directory where summaries are also written, so they outlive the session]. Defaults to None.
+
+    Examples:
+    ```
+    from summarytools import dfSummary, SummaryCache
+    cache = SummaryCache(path='.summary_cache')
+    dfSummary(data, cache=cache)
+    data['price'] *= 1.1
+    dfSummary(data, cache=cache)  # only 'price' is summarized again
+    ```
+    """
+
+    def __init__(self, maxsize: int = 1024, path: str = None):
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, x: pd.Series, *options) -> str:
+        return '-'.join([_fingerprint(x), str(_CACHE_VERSION), *map(str, options)])
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key + '.pkl')
+
+    def get(self, key: str):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        if self.path is not None and os.path.exists(self._file(key)):
+            with open(self._file(key), 'rb') as f:
+                value = pickle.load(f)
+            self._remember(key, value)
+            self.hits += 1
+            return value
+        self.misses += 1
+        return None
+
+    def put(self, key: str, value):
+        self._remember(key, value)
+        if self.path is not None:
+            # write then rename, so a concurrent reader never sees a partial file
+            tmp = self._file(key) + f'.{os.getpid()}.tmp'
+            with open(tmp, 'wb') as f:
+                pickle.dump(value, f)
+            os.replace(tmp, self._file(key))
+
+    def _remember(self, key: str, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """drop every entry, in memory and on disk"""
+        self._entries.clear()
+        if self.path is not None:
+            for name in os.listdir(self.path):
+                if name.endswith('.pkl'):
+                    os.remove(os.path.join(self.path, name))
+
+
+_DEFAULT_CACHE = SummaryCache()
+
+
+def _resolve_cache(cache):
+    """the cache to use for `cache` given as None/False, True (the shared in-memory cache) or a SummaryCache"""
+    if cache is None or cache is False:
+        return None
+    if cache is True:
+        return _DEFAULT_CACHE
+    if isinstance(cache, SummaryCache):
+        return cache
+    raise TypeError("`cache` must be a bool or a SummaryCache")
+
+
+def _cached_stats(data: pd.DataFrame, cache: SummaryCache, options: tuple, compute):
+    """column stats, served from `cache` where possible
+
+    `compute` summarizes a frame holding only the columns not found in the cache.
+    """
+    keys = [cache.key(data.iloc[:, i], *options) for i in range(data.shape[1])]
+    entries = [cache.get(key) for key in keys]
+    missing = [i for i, entry in enumerate(entries) if entry is None]
+    if missing:
+        for i, stats in zip(missing, compute(data.iloc[:, missing])):
+            entries[i] = stats
+            cache.put(keys[i], stats)
+    return entries
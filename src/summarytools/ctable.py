@@ -2,21 +2,77 @@ from typing import Literal
 
 import numpy as np
 import pandas as pd
-from IPython.display import HTML
 
-from .htmlwidgets import collapsible
-from .summarytools import _fmt_freq, _fmt_pct, _var_name
+from .render import _check_output, _reject_options, _render_table, _wrap_collapsible
+from .summarytools import _fmt_array, _fmt_freq, _fmt_pct, _var_name
+
+
+def _chi2():
+    """scipy's chi-square distribution, imported on first use; None without scipy"""
+    try:
+        from scipy.stats import chi2
+    except ImportError:
+        return None
+    return chi2
+
+
+def _occurrence(codes: np.ndarray) -> np.ndarray:
+    """0 for the first row of each code, 1 for the second, and so on"""
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(codes)]))
+    occurrence = np.empty(len(codes), dtype=np.int64)
+    occurrence[order] = np.arange(len(codes)) - group_start
+    return occurrence
+
+
+def _align_series(x: pd.Series, y: pd.Series):
+    """values of `x` and `y` paired by index label
+
+    Repeated labels are matched by occurrence rather than by a many-to-many
+    merge, which would multiply observations. Identical indexes, the usual
+    case, pair up by position without copying.
+    """
+    if x.index is y.index or x.index.equals(y.index):
+        return x.to_numpy(), y.to_numpy()
+    codes, _ = pd.factorize(x.index.append(y.index), use_na_sentinel=False)
+    x_codes, y_codes = codes[:len(x)], codes[len(x):]
+    width = max(len(x), len(y)) + 1
+    x_keys = x_codes.astype(np.int64) * width + _occurrence(x_codes)
+    y_keys = y_codes.astype(np.int64) * width + _occurrence(y_codes)
+    y_pos = pd.Index(y_keys).get_indexer(x_keys)
+    x_pos = np.flatnonzero(y_pos >= 0)
+    return x.to_numpy()[x_pos], y.to_numpy()[y_pos[x_pos]]
+
+
+def _factorize_labels(values: pd.Series):
+    """integer codes of `values` and their sorted string labels, missing values labelled 'NaN'
+
+    Only the distinct values are converted to strings; values whose strings
+    coincide share a code, as they would when grouping the strings.
+    """
+    codes, uniques = pd.factorize(values)
+    if values.dtype == object and pd.api.types.infer_dtype(uniques, skipna=True) not in ('string', 'empty'):
+        # mixed objects such as 1, 1.0 and True hash alike but print differently
+        return _factorize_labels(values.where(values.notna(), 'NaN').astype(str))
+    missing = codes < 0
+    # one original value per code, so the string conversion matches converting the whole column
+    first = np.empty(len(uniques), dtype=np.intp)
+    first[codes[~missing][::-1]] = np.flatnonzero(~missing)[::-1]
+    if missing.any():
+        first = np.append(first, np.flatnonzero(missing)[0])
+        codes = np.where(missing, len(uniques), codes)
+    reps = values.iloc[first].reset_index(drop=True)
+    strings = reps.where(reps.notna(), 'NaN').astype(str).fillna('NaN').to_numpy(dtype=object)
+    labels, remap = np.unique(strings, return_inverse=True)
+    return remap[codes], labels
 
-try:
-    from scipy.stats import chi2
-    _HAS_SCIPY = True
-except ImportError:
-    _HAS_SCIPY = False
 
 def ctable(x: pd.Series | str, y: pd.Series | str, data: pd.DataFrame=None,
          prop: Literal["row", "col", "tot", "none"]="row", digits: int=2,
          report_nans: bool=True, chisq: bool=True, totals: bool=True,
-         is_collapsible=False):
+         is_collapsible=False, name: str | None = None, output: str = 'styler'):
     """generate cross-tabulations (joint frequencies) for pairs of categorical variables
 
     Args:
@@ -29,10 +85,16 @@ def ctable(x: pd.Series | str, y: pd.Series | str, data: pd.DataFrame=None,
         chisq (bool, optional): [flag to display chi-square statistic along with p-value]. Defaults to True.
         totals (bool, optional): [flag to show totals]. Defaults to True.
         is_collapsible (bool, optional): [flag for collapsible page]. Defaults to False.
+        name (str, optional): [name of `data` in the table title; looked up from the caller's variables when None]. Defaults to None.
+        output (str, optional): ['styler', 'html' for an HTML string written without Styler or IPython,
+                                 or 'data' for the unformatted tables]. Defaults to 'styler'.
     
     Returns:
         [Pandas.Styler]: if is_collapsible = False
         [HTML]: if is_collapsible = True
+        [str]: if output = 'html'
+        [dict]: {'counts': pd.DataFrame, 'proportions': pd.DataFrame or None,
+                 'chisq': {'statistic', 'ddof', 'p_value'} or None} if output = 'data'
     
     Examples:
     ```
@@ -51,36 +113,35 @@ def ctable(x: pd.Series | str, y: pd.Series | str, data: pd.DataFrame=None,
     tabset({'tab1': tab1, 'tab2': tab2})
     ```
     """
-    # Resolve inputs into collision-proof internal columns. For Series, match
-    # repeated index labels by occurrence instead of performing a many-to-many
-    # merge, which would multiply observations.
+    _check_output(output)
+    if output == 'data':
+        _reject_options("output = 'data'", is_collapsible=is_collapsible)
+    # Resolve inputs into collision-proof internal columns.
     if isinstance(x, pd.Series) and isinstance(y, pd.Series):
         x_name, y_name = str(x.name), str(y.name)
         tbl_name = x_name + ' * ' + y_name
-        x_df = pd.DataFrame({'_index': list(x.index), '_x': x.to_numpy()})
-        y_df = pd.DataFrame({'_index': list(y.index), '_y': y.to_numpy()})
-        x_df['_occurrence'] = x_df.groupby('_index', sort=False, dropna=False).cumcount()
-        y_df['_occurrence'] = y_df.groupby('_index', sort=False, dropna=False).cumcount()
-        df = pd.merge(x_df, y_df, on=['_index', '_occurrence'], how='inner')[['_x', '_y']]
+        if name is not None:
+            tbl_name = name + ": " + tbl_name
+        x_values, y_values = _align_series(x, y)
+        df = pd.DataFrame({'_x': x_values, '_y': y_values})
     elif isinstance(x, str) and isinstance(y, str):
         if data is None:
             raise TypeError("`data` must be specified when `x`,`y` are str")
         x_name, y_name = x, y
-        tbl_name = _var_name(data) + ": " + x_name + ' * ' + y_name
+        tbl_name = (_var_name(data) if name is None else name) + ": " + x_name + ' * ' + y_name
         df = pd.DataFrame({'_x': data[x].to_numpy(), '_y': data[y].to_numpy()})
     else:
         raise TypeError("`x`,`y` must both be pd.Series or str")
 
-    if report_nans:
-        df['_x'] = df['_x'].where(df['_x'].notna(), 'NaN')
-        df['_y'] = df['_y'].where(df['_y'].notna(), 'NaN')
-    else:
+    if not report_nans:
         df = df.dropna(subset=['_x', '_y'])
 
-    df = df.astype({'_x': str, '_y': str})
-
     # build table
-    tbl = df.groupby(['_x', '_y']).size().unstack().fillna(0)
+    x_codes, x_labels = _factorize_labels(df['_x'])
+    y_codes, y_labels = _factorize_labels(df['_y'])
+    counts = np.bincount(x_codes * len(y_labels) + y_codes, minlength=len(x_labels) * len(y_labels))
+    tbl = pd.DataFrame(counts.reshape(len(x_labels), len(y_labels)).astype(float),
+                       index=pd.Index(x_labels), columns=pd.Index(y_labels))
     tbl.index.name = x_name
     tbl.columns.name = y_name
         
@@ -97,13 +158,16 @@ def ctable(x: pd.Series | str, y: pd.Series | str, data: pd.DataFrame=None,
     total_rows = tbl.sum(axis=0)
     total_cols = tbl.sum(axis=1)
 
+    chi2 = _chi2() if chisq else None
     chisq_note = None
-    if chisq and _HAS_SCIPY and total_all > 0 and n_rows > 1 and n_cols > 1:
+    chisq_result = None
+    if chi2 is not None and total_all > 0 and n_rows > 1 and n_cols > 1:
         chisq_ddof = (n_rows-1)*(n_cols-1)
         expected = np.outer(total_cols, total_rows) / total_all
         chisq_test = ((tbl - expected)**2 / expected).values.sum()
         chisq_pvalue = chi2.sf(chisq_test, chisq_ddof)
-    elif chisq and _HAS_SCIPY:
+        chisq_result = {'statistic': float(chisq_test), 'ddof': chisq_ddof, 'p_value': float(chisq_pvalue)}
+    elif chi2 is not None:
         chisq_note = "chi-square test requires at least two non-empty rows and columns"
             
     if totals:
@@ -130,39 +194,29 @@ def ctable(x: pd.Series | str, y: pd.Series | str, data: pd.DataFrame=None,
         pct_arr = None
     else:
         raise ValueError("`prop` must be one of 'row', 'col', 'tot', 'none'")
+
+    if output == 'data':
+        proportions = None if pct_arr is None else pd.DataFrame(pct_arr, index=tbl.index, columns=tbl.columns)
+        return {'counts': tbl, 'proportions': proportions, 'chisq': chisq_result}
     
     # styles
-    out = pd.DataFrame(index=tbl.index, columns=tbl.columns, dtype=object)
-    for i in range(counts_arr.shape[0]):
-        for j in range(counts_arr.shape[1]):
-            n_val = counts_arr[i, j]
-            p_val = pct_arr[i,j] if pct_arr is not None else None
-            out.iat[i,j] = _fmt_freq(n_val) if p_val is None else f'{_fmt_freq(n_val)} ({_fmt_pct(p_val, digits=digits)})'
+    cells = _fmt_array(counts_arr, _fmt_freq)
+    if pct_arr is not None:
+        pcts = _fmt_array(pct_arr, lambda v: _fmt_pct(v, digits=digits))
+        cells = np.char.add(np.char.add(cells, ' ('), np.char.add(pcts, ')'))
+    out = pd.DataFrame(cells, index=tbl.index, columns=tbl.columns, dtype=object)
 
     tbl_caption = f"<strong>Cross-Tabulation Table</strong><br>{tbl_name}"
     if chisq:
-        if not _HAS_SCIPY:
+        if chi2 is None:
             tbl_caption += "<br>(scipy not installed - chi-square test skipped)"
         elif chisq_note is not None:
             tbl_caption += f"<br>({chisq_note})"
         else:
             tbl_caption += f"<br>Chi-squared: {chisq_test:.4f} &nbsp; ddof={chisq_ddof:.0f} &nbsp; p-value={chisq_pvalue:,.4f}"
-    
-    out = (out.style
-           .set_properties(**{'text-align':'right',
-                              'font-size':'12px',
-                              'vertical-align':'middle'})
-           .set_table_styles([{'selector':'thead>tr>th',
-                               'props':'text-align: left'},
-                              {'selector':'table',
-                               'props':'min_width : 800px'},
-                              {'selector':'caption',
-                               'props':'white-space : nowrap'}])
-           .set_caption(tbl_caption))
-
-    if is_collapsible:
-        out = out.to_html()
-        out = collapsible(out, tbl_name)
-        return HTML(out)
-    
-    return out
+
+    out = _render_table(out, output, tbl_caption, 'text-align: right; font-size: 12px; vertical-align: middle',
+                        table_styles=[{'selector': 'thead>tr>th', 'props': 'text-align: left'},
+                                      {'selector': 'caption', 'props': 'white-space: nowrap'}],
+                        index=True)
+    return _wrap_collapsible(out, output, tbl_name) if is_collapsible else out
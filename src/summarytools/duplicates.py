@@ -0,0 +1,143 @@
+"""Duplicate-row counts from 64-bit row digests, for whole frames or frames seen in chunks."""
+import numpy as np
+import pandas as pd
+
+from .sketches import HyperLogLog, _hash64
+from .summarytools import _FLOAT_EXACT_INT, _is_num_kernel_dtype
+
+# FNV-1a 64-bit prime, used to fold the hash of each column into the row digest
+_FOLD = np.uint64(0x100000001B3)
+
+# distinct row digests kept for the exact count (8 bytes each) before falling back to HyperLogLog
+_EXACT_ROWS = 10_000_000
+
+
+def _hash_numbers(col: pd.Series) -> np.ndarray:
+    """64-bit hashes of a numeric column by value
+
+    Values are hashed as float64, so 1 and 1.0 agree, except integral values
+    of magnitude above 2**53, which float64 cannot tell apart: those are hashed
+    from their 64-bit integer, whether the column holds them as int or float.
+    """
+    # + 0.0 turns -0.0 into 0.0, which compare equal
+    floats = col.to_numpy(dtype=float, na_value=np.nan) + 0.0
+    hashes = pd.util.hash_array(floats)
+    if col.dtype.kind in 'iu':
+        ints = col.to_numpy(dtype=np.dtype(col.dtype.kind + '8'), na_value=0)
+        big = (ints > _FLOAT_EXACT_INT) | (ints < -_FLOAT_EXACT_INT)
+        ints = ints[big]
+    else:
+        big = (np.abs(floats) > _FLOAT_EXACT_INT) & (floats >= -2.0 ** 63) & (floats < 2.0 ** 64)
+        values = floats[big]
+        # past 2**63 only unsigned integers can hold the value
+        ints = np.where(values < 2.0 ** 63, values, 0).astype(np.int64).view(np.uint64)
+        ints[values >= 2.0 ** 63] = values[values >= 2.0 ** 63].astype(np.uint64)
+    hashes[big] = _hash64(ints.view(np.uint64))
+    return hashes
+
+
+def _row_hashes(data: pd.DataFrame, by_value: bool = False) -> np.ndarray:
+    """one 64-bit digest per row, folding in one column at a time
+
+    Columns are hashed through their factorized codes, so rows get equal
+    digests exactly when `DataFrame.duplicated` would call them equal. Codes
+    only mean something within one call: with `by_value`, columns are hashed
+    from their values instead (numeric ones through `_hash_numbers`), so
+    digests of different chunks of a file agree even when a column reads as
+    int in one chunk and float in another.
+    """
+    digest = np.zeros(len(data), dtype=np.uint64)
+    for _, col in data.items():
+        if not by_value:
+            hashes = _hash64(pd.factorize(col)[0])
+        elif _is_num_kernel_dtype(col.dtype):
+            hashes = _hash_numbers(col)
+        else:
+            hashes = pd.util.hash_pandas_object(col, index=False).to_numpy()
+        digest *= _FOLD
+        digest ^= hashes
+    return digest
+
+
+class _DuplicateCounter:
+    """count of repeated rows from their 64-bit row digests
+
+    The exact count keeps seen digests as sorted runs that are merged when
+    they reach a similar size, so each chunk is checked against O(log n)
+    runs. With `approx`, a HyperLogLog sketch estimates the number of
+    distinct rows instead, in fixed memory; an exact counter switches to it
+    once it holds more than `exact_limit` distinct rows.
+    """
+
+    def __init__(self, approx: bool = False, by_value: bool = False, exact_limit: int = _EXACT_ROWS):
+        self.approx = approx
+        self.by_value = by_value
+        self.exact_limit = exact_limit
+        self.n_rows = 0
+        self.runs = []
+        self.hll = HyperLogLog() if approx else None
+        self._n_dups = 0
+
+    @property
+    def n_dups(self) -> int:
+        if self.approx:
+            return max(0, self.n_rows - round(self.hll.count()))
+        return self._n_dups
+
+    def _seen(self, hashes: np.ndarray) -> np.ndarray:
+        seen = np.zeros(len(hashes), dtype=bool)
+        for run in self.runs:
+            pos = np.minimum(np.searchsorted(run, hashes), len(run) - 1)
+            seen |= run[pos] == hashes
+        return seen
+
+    def _add_run(self, run: np.ndarray):
+        self.runs.append(run)
+        while len(self.runs) > 1 and len(self.runs[-2]) <= 2 * len(self.runs[-1]):
+            last = self.runs.pop()
+            self.runs[-1] = np.sort(np.concatenate([self.runs[-1], last]))
+        if sum(len(run) for run in self.runs) > self.exact_limit:
+            self._to_approx()
+
+    def _to_approx(self):
+        """drop the seen digests for a HyperLogLog sketch of them"""
+        self.hll = HyperLogLog()
+        for run in self.runs:
+            self.hll.update_hashes(_hash64(run))
+        self.approx, self.runs = True, []
+
+    def update_hashes(self, hashes: np.ndarray):
+        self.n_rows += len(hashes)
+        if self.approx:
+            # folded digests are not uniform enough in their top bits for HyperLogLog: mix them again
+            self.hll.update_hashes(_hash64(hashes))
+            return self
+        unique = np.unique(hashes)
+        seen = self._seen(unique)
+        self._n_dups += len(hashes) - len(unique) + int(seen.sum())
+        if not seen.all():
+            self._add_run(unique[~seen])
+        return self
+
+    def update(self, chunk: pd.DataFrame):
+        return self.update_hashes(_row_hashes(chunk, self.by_value))
+
+    def merge(self, other: '_DuplicateCounter'):
+        if self.approx or other.approx:
+            if not self.approx:
+                self._to_approx()
+            self.n_rows += other.n_rows
+            if other.approx:
+                self.hll.merge(other.hll)
+            else:
+                for run in other.runs:
+                    self.hll.update_hashes(_hash64(run))
+            return self
+        self.n_rows += other.n_rows
+        self._n_dups += other._n_dups
+        for run in other.runs:
+            seen = self._seen(run)
+            self._n_dups += int(seen.sum())
+            if not seen.all():
+                self._add_run(run[~seen])
+        return self
@@ -1,81 +1,60 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
-from IPython.display import HTML
 
-from .summarytools import _var_name, _fmt_freq, _fmt_pct
-from .htmlwidgets import collapsible
+from .summarytools import _var_name, _fmt_freq, _fmt_pct, _top_k
+from .htmlwidgets import _tabset_html
+from .render import _check_output, _reject_options, _render_table, _wrap_collapsible
 
 
-def freq(data: pd.DataFrame, var: str | None = None,
-         max_level: int=10, digits: int=2, order: str='levels',
-         report_nans: bool=True, cumul: bool=True, totals: bool=True,
-         is_collapsible=False):
-    """generate HTML data frequency table
+def _weighted_counts(s: pd.Series, weights: np.ndarray = None):
+    """(weighted) count of each distinct value in sorted order, the total and the missing count
 
-    Args:
-        data (pd.DataFrame): [input dataframe]
-        var (str, optional): [column name when `data` is a DataFrame; ignored when `data` is a Series]
-        max_level (int, optional): [max level of categorical variable to be shown]. Defaults to 10.
-        digits (int, optional): [number of rounding digits]. Defaults to 2.
-        order (str, optional): [sort rows by values ('levels') or frequency ('freq')]. Defaults to 'levels'.
-        report_nans (bool, optional): [flag to show missing values]. Defaults to True.
-        cumul (bool, optional): [flag to show cumulative proportions]. Defaults to True.
-        totals (bool, optional): [flag to show totals]. Defaults to True.
-        is_collapsible (bool, optional): [flag for collapsible page]. Defaults to False.
-    
-    Returns:
-        [Pandas.Styler]: if is_collapsible = False
-        [HTML]: if is_collapsible = True
-
-    Examples:
-    ```
-    from summarytools import freq
-    import pandas as pd
-    data = pd.read_csv('./your-data-path.csv')
-    # default freq view
-    freq(data, var='var_name')
-    freq(data['var_name'])
-    # collapsible frequency table
-    freq(data, var='var_name', is_collapsible = True)
-    # tabbed frequency table
-    from summarytools import tabset
-    tab1 = freq(data['var1']).to_html()
-    tab2 = freq(data['var2']).to_html()
-    tabset({'tab1': tab1, 'tab2': tab2})
-    ```
+    Without weights the counts come from one bincount of the factorized codes,
+    so no weight vector is allocated.
     """
-    # resolve pd.DataFrame vs pd.Series
-    if isinstance(data, pd.DataFrame):
-        if var is None:
-            raise TypeError("`var` must be specified when `data` is a pd.DataFrame")
-        s = data[var].copy()
-        var_name = str(s.name)
-        tbl_name = _var_name(data) + ": " + var_name
-    elif isinstance(data, pd.Series):
-        s = data.copy()
-        var_name = str(s.name)
-        tbl_name = var_name
-    else:
-        raise TypeError("`data` must be a pd.Series or pd.DataFrame")
-    
-    # weights for frequency
-    w = pd.Series(np.ones(len(s)), index=s.index)
+    codes, uniques = pd.factorize(s, sort=True)
+    valid = codes >= 0
+    if not valid.all():
+        # missing values get their own bin at the end
+        codes = np.where(valid, codes, len(uniques))
+    counts = np.bincount(codes, weights=weights, minlength=len(uniques) + 1).astype(float)
+    n_total = float(len(s)) if weights is None else weights.sum()
+    n_missing = counts[-1]
+    counts = counts[:-1]
+    return pd.Series(counts, index=uniques), n_total, n_missing
 
-    n_total = w.sum()
-    is_na = s.isna()
-    n_missing = w[is_na].sum()
-    n_valid = n_total - n_missing
 
-    valid_s = s[~is_na]
-    valid_w = w[~is_na]
-    grouped = valid_w.groupby(valid_s).sum()
+def _resolve_weights(data, weights, n_rows: int):
+    """weights as a float array, and how the caption names them: their column name, 'custom' or None"""
+    weights_label = None
+    if isinstance(weights, str):
+        if not isinstance(data, pd.DataFrame):
+            raise TypeError("`weights` can only be a column name when `data` is a pd.DataFrame")
+        weights_label = weights
+        weights = data[weights]
+    if weights is not None:
+        weights = np.asarray(weights, dtype=float)
+        if weights.shape != (n_rows,):
+            raise ValueError("`weights` must have one value per row of `data`")
+        weights_label = weights_label or 'custom'
+    return weights, weights_label
+
+
+def _freq_table(counts: tuple, var_name: str, weights_label: str = None,
+                max_level: int = 10, digits: int = 2, order: str = 'levels',
+                report_nans: bool = True, cumul: bool = True, totals: bool = True, output: str = 'styler'):
+    """frequency table of one column from its `_weighted_counts`, as a Styler, an HTML string
+    or the unformatted table (see `output`); `weights_label` names the weights in the caption"""
+    grouped, n_total, n_missing = counts
+    n_valid = n_total - n_missing
 
     # max level of categorical variable to be shown
     other_sum = None
     if max_level is not None and len(grouped) > max_level:
-        grouped_sorted = grouped.sort_values(ascending=False)
-        grouped = grouped_sorted.iloc[:max_level]
-        other_sum = grouped_sorted.iloc[max_level:].sum()
+        grouped, other_sum = _top_k(grouped, max_level)
 
     # ordering of the table
     if order == 'freq':
@@ -142,31 +121,154 @@ def freq(data: pd.DataFrame, var: str | None = None,
     else:
         pct_cols = ['% Valid', '% Valid Cum.', '% Total', '% Total Cum.']
 
+    if output == 'data':
+        return out
 
     # styles
     tbl_caption = f"<strong>Frequency Table</strong><br>{var_name}"
+    if weights_label is not None:
+        tbl_caption += f"<br>Weights: {weights_label}"
     tbl_caption += f"<br>Valid: {n_valid:,.0f} &nbsp; Missing: {n_missing:,.0f} &nbsp; Total: {n_total:,.0f}"
 
-    out = (out.style
-           .format({'Freq': _fmt_freq, **{c: lambda x: _fmt_pct(x, digits) for c in pct_cols}})
-           .set_properties(**{'text-align':'left',
-                              'font-size':'12px',
-                              'vertical-align':'middle'})
-           .set_table_styles([{'selector':'thead>tr>th',
-                               'props':'text-align: left'}])
-           .set_properties(subset=[var_name], **{'width':'25%',
-                                                 'min-width':'100px',
-                                                 'word-break':'break-word'})
-           .set_properties(subset=['Freq'], **{'width':'10%',
-                                               'min-width':'60px'})
-           .set_properties(subset=pct_cols, **{'width':'16%',
-                                               'min-width':'80px'})
-           .hide(axis='index')
-           .set_caption(tbl_caption))
+    return _render_table(out, output, tbl_caption, 'text-align: left; font-size: 12px; vertical-align: middle',
+                         {var_name: 'width: 25%; min-width: 100px; word-break: break-word',
+                          'Freq': 'width: 10%; min-width: 60px',
+                          **{c: 'width: 16%; min-width: 80px' for c in pct_cols}},
+                         [{'selector': 'thead>tr>th', 'props': 'text-align: left'}],
+                         formatters={'Freq': _fmt_freq, **{c: lambda x: _fmt_pct(x, digits) for c in pct_cols}})
 
-    if is_collapsible:
-            out = out.to_html()
-            out = collapsible(out, tbl_name)
-            return HTML(out)
+
+def freq(data: pd.DataFrame, var: str | None = None,
+         max_level: int=10, digits: int=2, order: str='levels',
+         report_nans: bool=True, cumul: bool=True, totals: bool=True,
+         is_collapsible=False, name: str | None = None, weights=None, output: str = 'styler'):
+    """generate HTML data frequency table
+
+    Args:
+        data (pd.DataFrame): [input dataframe]
+        var (str, optional): [column name when `data` is a DataFrame; ignored when `data` is a Series]
+        max_level (int, optional): [max level of categorical variable to be shown]. Defaults to 10.
+        digits (int, optional): [number of rounding digits]. Defaults to 2.
+        order (str, optional): [sort rows by values ('levels') or frequency ('freq')]. Defaults to 'levels'.
+        report_nans (bool, optional): [flag to show missing values]. Defaults to True.
+        cumul (bool, optional): [flag to show cumulative proportions]. Defaults to True.
+        totals (bool, optional): [flag to show totals]. Defaults to True.
+        is_collapsible (bool, optional): [flag for collapsible page]. Defaults to False.
+        name (str, optional): [name of `data` in the table title; looked up from the caller's variables when None]. Defaults to None.
+        weights (str or array-like, optional): [column name in `data`, or one weight per row, e.g. survey weights]. Defaults to None.
+        output (str, optional): ['styler', 'html' for an HTML string written without Styler or IPython,
+                                 or 'data' for the unformatted table]. Defaults to 'styler'.
+    
+    Returns:
+        [Pandas.Styler]: if is_collapsible = False
+        [HTML]: if is_collapsible = True
+        [str]: if output = 'html'
+        [pd.DataFrame]: if output = 'data'
+
+    Examples:
+    ```
+    from summarytools import freq
+    import pandas as pd
+    data = pd.read_csv('./your-data-path.csv')
+    # default freq view
+    freq(data, var='var_name')
+    freq(data['var_name'])
+    # collapsible frequency table
+    freq(data, var='var_name', is_collapsible = True)
+    # tabbed frequency table
+    from summarytools import tabset
+    tab1 = freq(data['var1']).to_html()
+    tab2 = freq(data['var2']).to_html()
+    tabset({'tab1': tab1, 'tab2': tab2})
+    ```
+    """
+    _check_output(output)
+    if output == 'data':
+        _reject_options("output = 'data'", is_collapsible=is_collapsible)
+    # resolve pd.DataFrame vs pd.Series
+    if isinstance(data, pd.DataFrame):
+        if var is None:
+            raise TypeError("`var` must be specified when `data` is a pd.DataFrame")
+        s = data[var]
+        var_name = str(s.name)
+        tbl_name = (_var_name(data) if name is None else name) + ": " + var_name
+    elif isinstance(data, pd.Series):
+        s = data
+        var_name = str(s.name)
+        tbl_name = var_name if name is None else name + ": " + var_name
+    else:
+        raise TypeError("`data` must be a pd.Series or pd.DataFrame")
     
-    return out
\ No newline at end of file
+    weights, weights_label = _resolve_weights(data, weights, len(s))
+    out = _freq_table(_weighted_counts(s, weights), var_name, weights_label, max_level, digits, order,
+                      report_nans, cumul, totals, output)
+    if is_collapsible:
+        return _wrap_collapsible(out, output, tbl_name)
+    return out
+
+def freq_many(data: pd.DataFrame, vars: list | None = None,
+              max_level: int=10, digits: int=2, order: str='levels',
+              report_nans: bool=True, cumul: bool=True, totals: bool=True,
+              weights=None, as_tabset: bool=False, num_workers: int | None = None, output: str = 'styler'):
+    """generate HTML frequency tables of many columns in one call
+
+    Weights are resolved once, then every column is counted in one pass on a
+    thread pool, with one factorization and one bincount each; the tables
+    are built from those counts.
+
+    Args:
+        data (pd.DataFrame): [input dataframe]
+        vars (list, optional): [column names]. Defaults to None for every column except a named `weights` column.
+        max_level (int, optional): [max level of categorical variable to be shown]. Defaults to 10.
+        digits (int, optional): [number of rounding digits]. Defaults to 2.
+        order (str, optional): [sort rows by values ('levels') or frequency ('freq')]. Defaults to 'levels'.
+        report_nans (bool, optional): [flag to show missing values]. Defaults to True.
+        cumul (bool, optional): [flag to show cumulative proportions]. Defaults to True.
+        totals (bool, optional): [flag to show totals]. Defaults to True.
+        weights (str or array-like, optional): [column name in `data`, or one weight per row]. Defaults to None.
+        as_tabset (bool, optional): [return all tables as one tabbed HTML page]. Defaults to False.
+        num_workers (int, optional): [number of threads counting values]. Defaults to the number of CPUs.
+        output (str, optional): [type of each table, as in `freq`]. Defaults to 'styler'.
+
+    Returns:
+        [dict]: {column name: table} if as_tabset = False
+        [HTML]: if as_tabset = True
+        [str]: if as_tabset = True and output = 'html'
+
+    Examples:
+    ```
+    from summarytools import freq_many
+    import pandas as pd
+    data = pd.read_csv('./your-data-path.csv')
+    tables = freq_many(data, vars=['var1', 'var2'])
+    # tabbed frequency tables
+    freq_many(data, vars=['var1', 'var2'], as_tabset=True)
+    ```
+    """
+    _check_output(output)
+    if vars is None:
+        vars = [c for c in data.columns if not (isinstance(weights, str) and c == weights)]
+    weights, weights_label = _resolve_weights(data, weights, len(data))
+
+    def count(var):
+        return _weighted_counts(data[var], weights)
+
+    num_workers = min(len(vars), num_workers or os.cpu_count() or 1)
+    if num_workers > 1:
+        with ThreadPoolExecutor(num_workers) as pool:
+            counts = list(pool.map(count, vars))
+    else:
+        counts = [count(var) for var in vars]
+
+    table_output = 'data' if output == 'data' else 'html' if as_tabset else output
+    tables = {var: _freq_table(c, str(var), weights_label, max_level, digits, order,
+                               report_nans, cumul, totals, table_output)
+              for var, c in zip(vars, counts)}
+
+    if as_tabset and output != 'data':
+        html = _tabset_html({str(var): out for var, out in tables.items()})
+        if output == 'html':
+            return html
+        from IPython.display import HTML
+        return HTML(html)
+    return tables
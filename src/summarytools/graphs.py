@@ -0,0 +1,113 @@
+import base64
+import io
+
+import numpy as np
+
+_SVG_BAR_STYLE = 'fill="gray" fill-opacity="0.3" stroke="black" stroke-width="0.5"'
+
+
+def encode_img_base64(fig):
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight', pad_inches=0, transparent=True)
+    encoded_string = base64.b64encode(buf.getvalue()).decode()
+    src = f"data:image/png;base64, {encoded_string}"
+    return src
+
+
+def _svg_hist(counts, edges=None, width=150, height=75):
+    """histogram sparkline as an inline <svg> string from precomputed bin counts"""
+    counts = np.asarray(counts, dtype=float)
+    top = counts.max() if len(counts) > 0 else 0
+    heights = counts / top * height if top > 0 else np.zeros_like(counts)
+    bar_width = width / max(len(counts), 1)
+    bars = ''.join(
+        f'<rect x="{i * bar_width:.1f}" y="{height - h:.1f}" width="{bar_width:.1f}" height="{h:.1f}"/>'
+        for i, h in enumerate(heights))
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}"><g {_SVG_BAR_STYLE}>{bars}</g></svg>')
+
+
+def _svg_barh(pct, width=150, row_height=22):
+    """horizontal bar sparkline as an inline <svg> string, `pct` in [0, 1] listed top to bottom"""
+    pct = np.clip(np.asarray(pct, dtype=float), 0, 1)
+    height = row_height * len(pct)
+    bar_height = row_height * 0.8
+    bars = ''.join(
+        f'<rect x="0" y="{i * row_height + (row_height - bar_height) / 2:.1f}" '
+        f'width="{p * width:.1f}" height="{bar_height:.1f}"/>'
+        for i, p in enumerate(pct))
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}"><g {_SVG_BAR_STYLE}>{bars}</g></svg>')
+
+
+def _mpl_hist(counts, edges, figsize=(2, 1)):
+    from matplotlib import pyplot as plt
+    fig = plt.figure(figsize=figsize)
+    plt.hist(edges[:-1], bins=edges, weights=counts, color='gray', edgecolor='black', alpha=0.3)
+    plt.axis('off')
+    plt.tight_layout()
+    base64str = encode_img_base64(fig)
+    plt.close(fig)
+    return f'<img src = "{base64str}"></img>'
+
+
+def _mpl_barh(pct, figsize=None):
+    from matplotlib import pyplot as plt
+    if figsize is None:
+        figsize = (2, 0.3 * len(pct))
+    fig = plt.figure(figsize=figsize)
+    plt.barh(np.arange(len(pct)), pct, color='gray', alpha=0.3, edgecolor='black')
+    plt.gca().invert_yaxis()
+    plt.xlim(0, 1)
+    plt.axis('off')
+    base64str = encode_img_base64(fig)
+    plt.close(fig)
+    return f'<img src = "{base64str}"></img>'
+
+
+GRAPH_BACKENDS = {
+    'svg': {'hist': _svg_hist, 'barh': _svg_barh},
+    'matplotlib': {'hist': _mpl_hist, 'barh': _mpl_barh},
+}
+
+
+def _get_backend(graph_backend: str) -> dict:
+    try:
+        return GRAPH_BACKENDS[graph_backend]
+    except KeyError:
+        raise ValueError(f"`graph_backend` must be one of {', '.join(map(repr, GRAPH_BACKENDS))}") from None
+
+
+# pseudo-backend that records what to draw, so graphs can be rendered later on one thread
+_DEFERRED = 'deferred'
+
+
+class _DeferredGraph:
+    """a graph recorded by the deferred backend: the name of the backend function and its arguments"""
+
+    def __init__(self, kind: str, *args):
+        self.kind = kind
+        self.args = args
+
+    def render(self, graph_backend: str = 'svg') -> str:
+        return _get_backend(graph_backend)[self.kind](*self.args)
+
+
+def _render_hist(counts, edges, graph_backend: str = 'svg') -> 'str | _DeferredGraph':
+    if graph_backend == _DEFERRED:
+        return _DeferredGraph('hist', counts, edges)
+    return _get_backend(graph_backend)['hist'](counts, edges)
+
+
+def _render_barh(pct, graph_backend: str = 'svg') -> 'str | _DeferredGraph':
+    if graph_backend == _DEFERRED:
+        return _DeferredGraph('barh', pct)
+    return _get_backend(graph_backend)['barh'](pct)
+
+
+def _render_deferred(stats: list, graph_backend: str = 'svg') -> list:
+    """render the graphs recorded with the deferred backend in `_summarize_col` results"""
+    for out in stats:
+        if isinstance(out.get('Graph'), _DeferredGraph):
+            out['Graph'] = out['Graph'].render(graph_backend)
+    return stats
@@ -1,5 +1,4 @@
 import numpy as np
-from IPython.display import HTML, display
 
 
 class Tags:
@@ -37,12 +36,13 @@ def fun(x):
         x ([type]): [description]
     """
 
-def tabset(tabs: dict):
+def tabset(tabs: dict, display: bool = True):
     """tabbed summary
     Args:
         tabs ([dict]): {tab-name : tab-html}
+        display (bool): show the tabs in the notebook; when False, return their HTML instead, without IPython
     Returns:
-        rendered tabbed summary
+        rendered tabbed summary, or str: HTML if display = False
     Examples:
     ```
     html1 = "<h1>This is Tab1</h1>"
@@ -50,6 +50,14 @@ def tabset(tabs: dict):
     tabset({'tab1': html1, 'tab2':html2})
     ```
     """    
+    html = _tabset_html(tabs)
+    if not display:
+        return html
+    from IPython.display import HTML, display as show_html
+    return show_html(HTML(html))
+
+
+def _tabset_html(tabs: dict) -> str:
     id = str(int(np.random.random() * 10000))
     tags = Tags()
 
@@ -133,7 +141,7 @@ def tabset(tabs: dict):
     // Get the element with id="defaultOpen" and click on it
     document.getElementById("{defaultOpen}").click();
     </script>"""
-    return display(HTML(html + style + script))
+    return html + style + script
 
 
 
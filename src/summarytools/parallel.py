@@ -0,0 +1,156 @@
+"""Column summaries on several cores: a thread pool, or a process pool fed through shared memory."""
+import atexit
+import multiprocessing as mp
+import os
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from .graphs import _DEFERRED, _render_deferred
+from .summarytools import _num_stats_frame, _summarize_col, _summarize_col_approx, summary_plan
+
+EXECUTORS = ('auto', 'serial', 'thread', 'process')
+
+# below this many cells, starting workers costs more than it saves
+_MIN_PARALLEL_CELLS = 1_000_000
+
+_POOLS = {}
+
+
+def _get_pool(num_proc: int):
+    """a pool of `num_proc` workers, started once and reused by later calls"""
+    pool = _POOLS.get(num_proc)
+    if pool is None:
+        pool = _POOLS[num_proc] = mp.Pool(num_proc)
+    return pool
+
+
+@atexit.register
+def _close_pools():
+    while _POOLS:
+        _, pool = _POOLS.popitem()
+        pool.terminate()
+        pool.join()
+
+
+def _is_shareable(dtype) -> bool:
+    # plain NumPy columns whose buffer can be rebuilt from raw bytes
+    return isinstance(dtype, np.dtype) and dtype.kind in 'biufmM'
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no `track`
+        return shared_memory.SharedMemory(name=name)
+
+
+def _pack_columns(data: pd.DataFrame, positions: list):
+    """copy the columns at `positions` into one shared memory block
+
+    Returns the block and, per column, `(offset, dtype)` of its values.
+    """
+    layout, size = {}, 0
+    for i in positions:
+        dtype = data.dtypes.iloc[i]
+        size = -(-size // 8) * 8
+        layout[i] = (size, dtype.str)
+        size += dtype.itemsize * len(data)
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for i, (offset, dtype) in layout.items():
+        np.ndarray(len(data), dtype=dtype, buffer=shm.buf, offset=offset)[:] = data.iloc[:, i].to_numpy()
+    return shm, layout
+
+
+def _summarize_columns(columns: list, max_level: int, show_graph: bool, graph_backend: str, approx: bool) -> list:
+    if approx:
+        return [_summarize_col_approx(s, max_level, show_graph, graph_backend) for _, s in columns]
+    frame = pd.DataFrame({j: s for j, (_, s) in enumerate(columns)}, copy=False)
+    kinds = summary_plan(frame)['kind'].tolist()
+    num_stats = _num_stats_frame(frame, kinds=kinds)
+    return [_summarize_col(s, max_level, show_graph=show_graph, graph_backend=graph_backend,
+                           num_stats=num_stats.get(j), kind=kinds[j])
+            for j, (_, s) in enumerate(columns)]
+
+
+def _summarize_batch(shm_name, n_rows: int, shared: list, pickled: list, options: tuple) -> list:
+    """worker task: summarize a batch of columns, rebuilding shared ones as zero-copy views
+
+    `shared` holds `(position, name, offset, dtype)` and `pickled` holds
+    `(position, series)`, and `options` the remaining arguments of
+    `_summarize_columns`. Results come back in position order.
+    """
+    shm = _attach(shm_name) if shared else None
+    try:
+        columns = [(i, pd.Series(np.ndarray(n_rows, dtype=dtype, buffer=shm.buf, offset=offset),
+                                 name=name, copy=False))
+                   for i, name, offset, dtype in shared]
+        columns = sorted(columns + pickled, key=lambda c: c[0])
+        results = _summarize_columns(columns, *options)
+        del columns
+        return results
+    finally:
+        if shm is not None:
+            shm.close()
+
+
+def _get_stats_parallel(data: pd.DataFrame, num_proc: int, max_level: int, show_graph: bool,
+                        graph_backend: str = 'svg', approx: bool = False, batch_size: int = None) -> list:
+    """`_get_stats` on a reused process pool, sending columns in batches
+
+    Numeric, boolean and datetime columns are copied once into shared memory
+    instead of being pickled to the workers; other columns are pickled.
+    """
+    n_cols = data.shape[1]
+    if batch_size is None:
+        batch_size = max(1, -(-n_cols // (num_proc * 4)))
+    shareable = [i for i, dtype in enumerate(data.dtypes) if _is_shareable(dtype)]
+    options = (max_level, show_graph, graph_backend, approx)
+    shm, layout = _pack_columns(data, shareable) if shareable else (None, {})
+    try:
+        tasks = []
+        for start in range(0, n_cols, batch_size):
+            batch = range(start, min(start + batch_size, n_cols))
+            shared = [(i, data.columns[i], *layout[i]) for i in batch if i in layout]
+            pickled = [(i, data.iloc[:, i].reset_index(drop=True)) for i in batch if i not in layout]
+            tasks.append((shm.name if shared else None, len(data), shared, pickled, options))
+        results = _get_pool(num_proc).starmap(_summarize_batch, tasks)
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+    return [stats for batch in results for stats in batch]
+
+
+def _get_stats_threaded(data: pd.DataFrame, num_workers: int, max_level: int, show_graph: bool,
+                        graph_backend: str = 'svg', approx: bool = False) -> list:
+    """`_get_stats` over column batches on a thread pool
+
+    NumPy's sorts and reductions release the GIL, so numeric batches run in
+    parallel without copying any data. Graphs are recorded by the workers
+    and rendered afterwards on the calling thread, since pyplot is not
+    thread-safe.
+    """
+    n_cols = data.shape[1]
+    batch_size = max(1, -(-n_cols // (num_workers * 4)))
+    batches = [[(i, data.iloc[:, i]) for i in range(start, min(start + batch_size, n_cols))]
+               for start in range(0, n_cols, batch_size)]
+    with ThreadPoolExecutor(num_workers) as pool:
+        results = pool.map(lambda batch: _summarize_columns(batch, max_level, show_graph, _DEFERRED, approx),
+                           batches)
+        stats = [out for batch in results for out in batch]
+    return _render_deferred(stats, graph_backend)
+
+
+def _resolve_executor(data: pd.DataFrame, executor: str, num_workers: int):
+    """the executor and worker count to use; 'auto' picks threads for large multi-column frames"""
+    if executor not in EXECUTORS:
+        raise ValueError(f"`executor` must be one of {', '.join(map(repr, EXECUTORS))}")
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    if executor == 'auto':
+        big = data.shape[1] > 1 and data.size >= _MIN_PARALLEL_CELLS
+        executor = 'thread' if big and num_workers > 1 else 'serial'
+    return executor, num_workers
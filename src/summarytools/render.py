@@ -0,0 +1,142 @@
+"""HTML tables written straight from strings, for reports built without pandas Styler or IPython."""
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from .htmlwidgets import collapsible
+from .summarytools import _fmt_array
+
+OUTPUTS = ('styler', 'html', 'data')
+
+
+def _check_output(output: str):
+    if output not in OUTPUTS:
+        raise ValueError("`output` must be one of 'styler', 'html', 'data'")
+
+
+def _reject_options(context: str, **options):
+    """raise a ValueError naming the `options` set to True, which `context` does not take"""
+    names = [f'`{name}`' for name, is_set in options.items() if is_set]
+    if names:
+        raise ValueError(f"{context} does not take {', '.join(names)}")
+
+
+def _cell_strings(col: pd.Series) -> list:
+    """the cells of a column as strings, missing values left blank"""
+    values = col.to_numpy(dtype=object)
+    missing = col.isna().to_numpy()
+    return ['' if na else str(v) for v, na in zip(values, missing)]
+
+
+def _html_table(cells: pd.DataFrame, caption: str = '', cell_props: str = '', column_props: dict = None,
+                table_styles: list = None, index: bool = False) -> str:
+    """`cells` as one HTML table, without building a Styler
+
+    Cells are written as they are (HTML included), so they should already be
+    formatted. Styles are written once for the table and once per column,
+    whose cells carry a `colN` class, instead of once per cell.
+
+    Args:
+        cells (pd.DataFrame): [table content]
+        caption (str, optional): [table caption]. Defaults to ''.
+        cell_props (str, optional): [CSS of every data cell]. Defaults to ''.
+        column_props (dict, optional): [{column label: CSS} of the data cells of some columns]. Defaults to None.
+        table_styles (list, optional): [[{'selector': ..., 'props': ...}], as in Styler.set_table_styles]. Defaults to None.
+        index (bool, optional): [show the row labels and the index and column names]. Defaults to False.
+
+    Returns:
+        [str]: HTML
+    """
+    return (_html_head(cells.columns, caption, cell_props, column_props, table_styles,
+                       cells.index.name if index else None, index)
+            + _html_rows(cells, index) + _HTML_TAIL)
+
+
+def _html_head(columns: pd.Index, caption: str = '', cell_props: str = '', column_props: dict = None,
+               table_styles: list = None, index_name: str = None, index: bool = False) -> str:
+    """the styles, caption and header of `_html_table`, up to the opening of its body"""
+    table_id = 'T_st' + uuid.uuid4().hex[:8]
+    positions = {label: j for j, label in enumerate(columns)}
+
+    rules = [f'#{table_id} {style["selector"]} {{{style["props"]}}}' for style in table_styles or []]
+    if cell_props:
+        rules.append(f'#{table_id} td {{{cell_props}}}')
+    for label, props in (column_props or {}).items():
+        rules.append(f'#{table_id} td.col{positions[label]} {{{props}}}')
+    style = '<style type="text/css">\n' + '\n'.join(rules) + '\n</style>\n'
+
+    labels = [str(label) for label in columns]
+    header = ''.join(f'<th class="col_heading col{j}">{label}</th>' for j, label in enumerate(labels))
+    if index:
+        blank = '<th class="blank"></th>'
+        header = f'<th class="index_name">{columns.name or ""}</th>' + header
+        if index_name is not None:
+            header += f'</tr>\n<tr><th class="index_name">{index_name}</th>' + blank * len(labels)
+    head = f'<thead>\n<tr>{header}</tr>\n</thead>\n'
+
+    caption = f'<caption>{caption}</caption>\n' if caption else ''
+    return style + f'<table id="{table_id}">\n' + caption + head + '<tbody>\n'
+
+
+def _html_rows(cells: pd.DataFrame, index: bool = False) -> str:
+    """the body rows of `_html_table`, one line each"""
+    # one list of '<td>...</td>' strings per column, joined row by row
+    columns = [[f'<td class="col{j}">{v}</td>' for v in _cell_strings(cells.iloc[:, j])]
+               for j in range(cells.shape[1])]
+    if index:
+        columns.insert(0, [f'<th class="row_heading">{v}</th>' for v in cells.index.astype(str)])
+    return ''.join('<tr>' + ''.join(row) + '</tr>\n' for row in zip(*columns))
+
+
+_HTML_TAIL = '</tbody>\n</table>\n'
+
+
+def _styler(out: pd.DataFrame, caption: str = '', cell_props: str = '', column_props: dict = None,
+             table_styles: list = None, index: bool = False, formatters: dict = None):
+    """`out` as a Styler with the same styles as `_html_table`, set per table and per column
+
+    Styles go through `set_table_styles` rather than `set_properties`, so the
+    HTML gets one CSS rule per column instead of one per cell, and cells
+    carry no ids.
+    """
+    # imported here: Styler needs jinja2, which the other outputs do not
+    from pandas.io.formats.style import Styler
+    styler = Styler(out, cell_ids=False, caption=caption or None)
+    styles = list(table_styles or [])
+    if cell_props:
+        styles.append({'selector': 'td', 'props': cell_props})
+    styler = styler.set_table_styles(styles)
+    if column_props:
+        styler = styler.set_table_styles({col: [{'selector': 'td', 'props': props}]
+                                          for col, props in column_props.items()}, overwrite=False)
+    if formatters:
+        styler = styler.format(formatters)
+    return styler if index else styler.hide(axis='index')
+
+
+def _render_table(out: pd.DataFrame, output: str, caption: str = '', cell_props: str = '',
+                  column_props: dict = None, table_styles: list = None, index: bool = False,
+                  formatters: dict = None):
+    """`out` as a Styler if `output` is 'styler', else as an HTML string, formatting the `formatters` columns"""
+    if output == 'styler':
+        return _styler(out, caption, cell_props, column_props, table_styles, index, formatters)
+    cells = _fmt_columns(out, formatters) if formatters else out
+    return _html_table(cells, caption, cell_props, column_props, table_styles, index)
+
+
+def _fmt_columns(out: pd.DataFrame, formatters: dict) -> pd.DataFrame:
+    """copy of `out` with {column: formatter} applied to the values of some columns"""
+    out = out.copy()
+    for col, fmt in formatters.items():
+        out[col] = _fmt_array(np.asarray(out[col], dtype=float), fmt)
+    return out
+
+
+def _wrap_collapsible(out, output: str, tbl_name: str):
+    """a rendered table in a collapsible container: an HTML string for 'html' output, else IPython HTML"""
+    html = collapsible(out if output == 'html' else out.to_html(), tbl_name)
+    if output == 'html':
+        return html
+    from IPython.display import HTML
+    return HTML(html)
@@ -0,0 +1,308 @@
+"""Mergeable summaries used by the approximate and streaming summaries.
+
+Every class takes NumPy arrays in ``update`` and combines with another
+instance of the same class in ``merge``, so a column can be summarized in
+chunks, in parallel, or across data partitions, with memory that does not
+grow with the number of rows.
+"""
+import numpy as np
+import pandas as pd
+
+_FMIX_C1 = np.uint64(0xFF51AFD7ED558CCD)
+_FMIX_C2 = np.uint64(0xC4CEB9FE1A85EC53)
+
+
+def _hash64(values) -> np.ndarray:
+    """64-bit hash of every element of a 1-D array"""
+    values = np.asarray(values)
+    if values.dtype.kind == 'f':
+        bits = (values.astype(np.float64) + 0.0).view(np.uint64)
+    elif values.dtype.kind in 'iub':
+        bits = values.astype(np.int64).view(np.uint64)
+    elif values.dtype.kind in 'mM':
+        bits = values.view(np.int64).view(np.uint64)
+    else:
+        return pd.util.hash_array(values.astype(object))
+    # murmur3 fmix64 finalizer, in place on a fresh buffer
+    h = bits >> np.uint64(33)
+    h ^= bits
+    h *= _FMIX_C1
+    h ^= h >> np.uint64(33)
+    h *= _FMIX_C2
+    h ^= h >> np.uint64(33)
+    return h
+
+
+class HyperLogLog:
+    """HyperLogLog distinct counter with 2**p registers"""
+
+    def __init__(self, p: int = 14):
+        if not 11 <= p <= 18:
+            raise ValueError("`p` must be between 11 and 18")
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    def update(self, values):
+        self.update_hashes(_hash64(values))
+        return self
+
+    def update_hashes(self, hashes: np.ndarray):
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        q = 64 - self.p
+        idx = (hashes >> np.uint64(q)).astype(np.intp)
+        # position of the leftmost 1-bit in the low q bits; q <= 53 keeps the float conversion exact
+        bit_length = np.frexp((hashes & np.uint64((1 << q) - 1)).astype(np.float64))[1]
+        rank = (q + 1 - bit_length).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+        return self
+
+    def merge(self, other: 'HyperLogLog'):
+        if other.p != self.p:
+            raise ValueError("cannot merge HyperLogLog sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(int)))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros > 0:
+            # linear counting is more accurate for small cardinalities
+            estimate = m * np.log(m / zeros)
+        return float(estimate)
+
+    @property
+    def relative_error(self) -> float:
+        """standard error of `count` relative to the true distinct count"""
+        return 1.04 / np.sqrt(len(self.registers))
+
+
+class KLLSketch:
+    """KLL-style quantile sketch: a hierarchy of compactors holding at most `k` items per level
+
+    Level h items each stand for 2**h input values. A full level is sorted in
+    blocks of `k` and every other item (random offset per block) is promoted,
+    which shifts any rank by at most 2**h per block; those shifts are summed
+    into `rank_error`, a deterministic bound on the absolute rank error.
+    Quantiles are exact while fewer than `k` values have been seen.
+    """
+
+    def __init__(self, k: int = 2048, seed: int = 0):
+        if k < 2 or k % 2:
+            raise ValueError("`k` must be an even integer >= 2")
+        self.k = k
+        self.n = 0
+        self.rank_error = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values, weights=None):
+        """add `values`; integer `weights` are inserted exactly by their binary digits"""
+        values = np.asarray(values, dtype=float)
+        keep = ~np.isnan(values)
+        values = values[keep]
+        if len(values) == 0:
+            return self
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        if weights is None:
+            self.n += len(values)
+            self.levels[0] = np.concatenate([self.levels[0], values])
+        else:
+            weights = np.asarray(weights, dtype=np.int64)[keep]
+            self.n += int(weights.sum())
+            for h in range(int(weights.max()).bit_length()):
+                if h == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[h] = np.concatenate([self.levels[h], values[(weights >> h) & 1 == 1]])
+        self._compress()
+        return self
+
+    def merge(self, other: 'KLLSketch'):
+        self.n += other.n
+        self.rank_error += other.rank_error
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for h, items in enumerate(other.levels):
+            if h == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self._compress()
+        return self
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            items = self.levels[h]
+            if len(items) > self.k:
+                n_blocks = len(items) // self.k
+                blocks = np.sort(items[:n_blocks * self.k].reshape(n_blocks, self.k), axis=1)
+                offsets = self._rng.integers(0, 2, size=(n_blocks, 1))
+                promoted = np.take_along_axis(blocks, offsets + 2 * np.arange(self.k // 2), axis=1)
+                self.levels[h] = items[n_blocks * self.k:]
+                self.rank_error += n_blocks << h
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted.ravel()])
+            h += 1
+
+    def quantile(self, q):
+        """estimated quantile(s), linearly interpolated like pd.Series.quantile"""
+        if self.n == 0:
+            return np.full(np.shape(q), np.nan)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(v), 2.0 ** h) for h, v in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        items, cum = items[order], np.cumsum(weights[order])
+        # item holding each 0-based rank, interpolated between the two ranks around q * (n - 1)
+        pos = np.asarray(q, dtype=float) * (self.n - 1)
+        lo, hi = np.floor(pos), np.ceil(pos)
+        v_lo = items[np.minimum(np.searchsorted(cum, lo, side='right'), len(items) - 1)]
+        v_hi = items[np.minimum(np.searchsorted(cum, hi, side='right'), len(items) - 1)]
+        return np.clip(v_lo + (v_hi - v_lo) * (pos - lo), self.min, self.max)
+
+    @property
+    def relative_rank_error(self) -> float:
+        """upper bound on the rank error of `quantile`, as a fraction of n"""
+        return self.rank_error / self.n if self.n > 0 else 0.0
+
+
+class FrequentItems:
+    """Misra-Gries heavy hitters summary keeping at most `capacity` counters
+
+    Counts are lower bounds; every true count lies within `error` above the
+    reported one, and `error` never exceeds n / (capacity + 1).
+    """
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self.n = 0
+        self.error = 0
+        self.counts = pd.Series(dtype='int64')
+
+    def update(self, values):
+        batch = pd.Series(values).value_counts(dropna=False)
+        self.n += int(batch.sum())
+        return self._merge_counts(batch, 0)
+
+    def update_counts(self, counts: pd.Series):
+        """add pre-aggregated value counts"""
+        self.n += int(counts.sum())
+        return self._merge_counts(counts, 0)
+
+    def merge(self, other: 'FrequentItems'):
+        self.n += other.n
+        return self._merge_counts(other.counts, other.error)
+
+    def _merge_counts(self, counts: pd.Series, error: int):
+        merged = counts if len(self.counts) == 0 else self.counts.add(counts, fill_value=0)
+        merged = merged.astype('int64')
+        self.error += error
+        if len(merged) > self.capacity:
+            cut = int(np.partition(merged.to_numpy(), len(merged) - self.capacity - 1)[len(merged) - self.capacity - 1])
+            merged = merged - cut
+            merged = merged[merged > 0]
+            self.error += cut
+        self.counts = merged
+        return self
+
+    def top(self, k: int) -> pd.Series:
+        return self.counts.sort_values(ascending=False, kind='stable').head(k)
+
+
+class Moments:
+    """count, mean and sum of squared deviations, merged with Chan's parallel update"""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        other = Moments()
+        other.n = len(values)
+        other.mean = values.mean()
+        other.m2 = float(((values - other.mean) ** 2).sum())
+        return self.merge(other)
+
+    def merge(self, other: 'Moments'):
+        n = self.n + other.n
+        if n == 0:
+            return self
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+        return self
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.m2 / (self.n - 1))) if self.n > 1 else np.nan
+
+
+class Histogram:
+    """mergeable equal-width histogram of `n_bins` fine bins whose width doubles to cover new values"""
+
+    def __init__(self, n_bins: int = 1024):
+        self.n_bins = n_bins
+        self.lo = None
+        self.width = None
+        self.counts = np.zeros(n_bins, dtype=np.int64)
+
+    def update(self, values, weights=None):
+        values = np.asarray(values, dtype=float)
+        keep = np.isfinite(values)
+        values = values[keep]
+        if len(values) == 0:
+            return self
+        weights = np.ones(len(values), dtype=np.int64) if weights is None else np.asarray(weights, dtype=np.int64)[keep]
+        vmin, vmax = values.min(), values.max()
+        if self.width is None:
+            width = (vmax - vmin) / self.n_bins
+            self.width = width if width > 0 else (abs(vmin) * 2.0 ** -20 or 1.0)
+            self.lo = np.floor(vmin / self.width) * self.width
+        self._cover(vmin, vmax)
+        idx = np.clip(((values - self.lo) // self.width).astype(np.int64), 0, self.n_bins - 1)
+        self.counts += np.bincount(idx, weights=weights, minlength=self.n_bins).astype(np.int64)
+        return self
+
+    def _cover(self, vmin, vmax):
+        occupied = np.flatnonzero(self.counts)
+        if len(occupied) > 0:
+            vmin = min(vmin, self.lo + occupied[0] * self.width)
+            vmax = max(vmax, self.lo + (occupied[-1] + 0.5) * self.width)
+        width = self.width
+        while vmax >= np.floor(vmin / width) * width + self.n_bins * width:
+            width *= 2
+        lo = np.floor(vmin / width) * width
+        if lo != self.lo or width != self.width:
+            # lo stays a multiple of the width, so each old bin falls inside one new bin
+            idx = np.clip(((self.centers() - lo) // width).astype(np.int64), 0, self.n_bins - 1)
+            self.counts = np.bincount(idx, weights=self.counts, minlength=self.n_bins).astype(np.int64)
+            self.lo, self.width = lo, width
+
+    def centers(self) -> np.ndarray:
+        return self.lo + (np.arange(self.n_bins) + 0.5) * self.width
+
+    def merge(self, other: 'Histogram'):
+        if other.width is None:
+            return self
+        if self.width is None:
+            self.lo, self.width, self.counts = other.lo, other.width, other.counts.copy()
+            return self
+        centers = other.centers()[other.counts > 0]
+        return self.update(centers, other.counts[other.counts > 0])
+
+    def rebin(self, edges) -> np.ndarray:
+        """counts over coarser `edges`, assigning every fine bin by its centre"""
+        if self.width is None:
+            return np.zeros(len(edges) - 1, dtype=np.int64)
+        centers = np.clip(self.centers(), edges[0], edges[-1])
+        return np.histogram(centers, bins=edges, weights=self.counts)[0].astype(np.int64)
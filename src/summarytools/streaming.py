@@ -0,0 +1,427 @@
+"""dfSummary over data seen in chunks: mergeable summary states, and summaries of files larger than memory."""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .duplicates import _DuplicateCounter
+from .graphs import _get_backend
+from .render import _check_output
+from .sketches import FrequentItems, Histogram, HyperLogLog, KLLSketch, Moments
+from .summary import _style_summary, _summary_caption, _summary_table
+from .summarytools import (_QUANTILES, _fmt_cat_sketch, _fmt_date_stats, _fmt_distinct_sketch,
+                           _fmt_num_sketch, _is_bool, _is_categorical, _is_datetime,
+                           _is_num_kernel_dtype, _stats_cat_col, _stats_num_col, _summarize_col)
+
+_DAY_NS = 86_400 * 10**9
+
+
+def _column_kind(dtype) -> str:
+    if _is_num_kernel_dtype(dtype):
+        return 'num'
+    if _is_datetime(dtype):
+        return 'date'
+    probe = pd.Series([], dtype=dtype)
+    if _is_bool(probe) or _is_categorical(probe, np.inf, 0):
+        return 'cat'
+    return 'other'
+
+
+def _promote(a, b):
+    """common dtype of a column seen with dtypes `a` and `b` in different chunks"""
+    if a == b:
+        return a
+    if isinstance(a, pd.CategoricalDtype) and isinstance(b, pd.CategoricalDtype):
+        return pd.CategoricalDtype()
+    if _is_num_kernel_dtype(a) and _is_num_kernel_dtype(b):
+        try:
+            return np.result_type(a, b)
+        except TypeError:
+            return np.dtype(float)
+    # a reader given the whole column would have parsed mixed text and numbers as text
+    for dtype in (a, b):
+        if isinstance(dtype, pd.StringDtype):
+            return dtype
+    return np.dtype(object)
+
+
+def _date_ns(s: pd.Series) -> np.ndarray:
+    if getattr(s.dt, 'tz', None) is not None:
+        s = s.dt.tz_localize(None)
+    return s.dropna().to_numpy().astype('datetime64[ns]').view(np.int64)
+
+
+def _add_counts(counts: dict, batch: pd.Series) -> dict:
+    """add the value counts `batch` to {value: count}, in time proportional to the batch"""
+    # new values go last, keeping first-appearance order as value_counts does for the whole column
+    for value, n in zip(batch.index.tolist(), batch.to_numpy().tolist()):
+        counts[value] = counts.get(value, 0) + n
+    return counts
+
+
+class _ColumnAccumulator:
+    """mergeable running summary of one column
+
+    Value counts are kept exactly in a dict, which reproduces the in-memory
+    summary and grows by each chunk's distinct values only, until the column has more than `exact_limit` distinct values. Past that
+    it falls back to sketches (HyperLogLog, KLL, Misra-Gries and an adaptive
+    histogram), so its memory is bounded by `exact_limit` rather than by rows.
+    """
+
+    def __init__(self, max_level: int = 10, exact_limit: int = 100_000):
+        self.max_level = max_level
+        self.exact_limit = exact_limit
+        self.dtype = None
+        self.kind = None
+        self.n_rows = 0
+        self.n_missing = 0
+        self._counts = {}
+        self.sketches = None
+        self.moments = Moments()
+        self.vmin = np.nan
+        self.vmax = np.nan
+        self._typed = False
+
+    @property
+    def exact(self) -> bool:
+        return self.sketches is None
+
+    @property
+    def counts(self) -> pd.Series:
+        """exact value counts in order of first appearance, None once sketched"""
+        if self._counts is None:
+            return None
+        return pd.Series(list(self._counts.values()), index=list(self._counts), dtype='int64')
+
+    def _set_kind(self, kind: str, dtype, typed: bool = True):
+        if self.kind is None:
+            self.kind, self.dtype, self._typed = kind, dtype, typed
+            return
+        if not typed:
+            # an all-missing chunk says nothing about the column's type
+            return
+        if not self._typed:
+            # missing values are never counted as levels
+            self._counts = {}
+            self.kind, self.dtype, self._typed = kind, dtype, True
+            return
+        self.dtype = _promote(self.dtype, dtype)
+        if kind == self.kind or self.kind == 'cat':
+            return
+        if self.kind == 'num' and kind == 'cat' and self.exact:
+            # mixed numbers and text: count everything as text, like an object column
+            self._counts = _add_counts({}, self._num_labels(as_text=True))
+            self.kind = 'cat'
+            return
+        raise ValueError(f"column changed from {self.kind!r} to {kind!r} values between chunks; "
+                         "pass `dtype=` to the reader to fix its type")
+
+    def update(self, s: pd.Series):
+        n_missing = int(s.isna().sum())
+        self._set_kind(_column_kind(s.dtype), s.dtype, typed=n_missing < len(s))
+        self.n_rows += len(s)
+        self.n_missing += n_missing
+        if self.kind == 'cat':
+            self._add_level_counts(s[s.notna()].astype(str).value_counts(sort=False))
+        elif self.kind == 'num':
+            values = s.to_numpy(dtype=float, na_value=np.nan)
+            values = values[~np.isnan(values)]
+            self.moments.update(values)
+            self._add_values(values)
+        elif self.kind == 'date':
+            self._add_values(_date_ns(s))
+        return self
+
+    def _add_values(self, values: np.ndarray):
+        if len(values) == 0:
+            return
+        self.vmin = np.fmin(self.vmin, values.min())
+        self.vmax = np.fmax(self.vmax, values.max())
+        if self.exact:
+            _add_counts(self._counts, pd.Series(values).value_counts(sort=False))
+            if len(self._counts) > self.exact_limit:
+                self._to_sketches()
+        else:
+            self._update_sketches(values)
+
+    def _add_level_counts(self, batch: pd.Series):
+        if self.exact:
+            _add_counts(self._counts, batch)
+            if len(self._counts) > self.exact_limit:
+                self._to_sketches()
+        else:
+            self.sketches['items'].update_counts(batch)
+
+    def _to_sketches(self):
+        counts = self.counts
+        if self.kind == 'cat':
+            self.sketches = {'items': FrequentItems(capacity=max(8 * self.max_level, 64)).update_counts(counts)}
+        else:
+            self.sketches = {'distinct': HyperLogLog(), 'quantiles': KLLSketch(), 'hist': Histogram()}
+            self._update_sketches(counts.index.to_numpy(), counts.to_numpy())
+        self._counts = None
+
+    def _update_sketches(self, values: np.ndarray, weights=None):
+        self.sketches['distinct'].update(values)
+        if self.kind == 'num':
+            self.sketches['quantiles'].update(values, weights)
+            self.sketches['hist'].update(values, weights)
+        else:
+            self.sketches['hist'].update(values / _DAY_NS, weights)
+
+    def merge(self, other: '_ColumnAccumulator'):
+        if other.kind is None:
+            return self
+        self._set_kind(other.kind, other.dtype, other._typed)
+        if not other._typed:
+            other_counts = pd.Series(dtype='int64')
+        elif self.kind == 'cat' and other.kind == 'num':
+            if not other.exact:
+                raise ValueError("cannot merge a sketched numeric column into a categorical one; "
+                                 "pass `dtype=` to the reader to fix its type")
+            other_counts = other._num_labels(as_text=True)
+        else:
+            other_counts = other.counts
+        self.n_rows += other.n_rows
+        self.n_missing += other.n_missing
+        self.moments.merge(other.moments)
+        self.vmin = np.fmin(self.vmin, other.vmin)
+        self.vmax = np.fmax(self.vmax, other.vmax)
+        if self.exact and other.exact:
+            _add_counts(self._counts, other_counts)
+            if len(self._counts) > self.exact_limit:
+                self._to_sketches()
+            return self
+        if self.exact:
+            self._to_sketches()
+        if other.exact and self.kind == 'cat':
+            self.sketches['items'].update_counts(other_counts)
+        elif other.exact:
+            self._update_sketches(other_counts.index.to_numpy(), other_counts.to_numpy())
+        else:
+            for key, sketch in self.sketches.items():
+                sketch.merge(other.sketches[key])
+        return self
+
+    def _num_labels(self, as_text: bool = False) -> pd.Series:
+        """numeric value counts relabelled as the strings `astype(str)` would give
+
+        With `as_text`, integral values are labelled as integers, which is how
+        they were written in a text file whose other chunks hold text.
+        """
+        keys = np.array(list(self._counts))
+        if self.dtype.kind in 'iu' or as_text:
+            labels = [str(int(v)) if float(v).is_integer() else str(v) for v in keys]
+        else:
+            labels = [str(v) for v in keys]
+        out = pd.Series(list(self._counts.values()), index=labels)
+        return out.groupby(level=0, sort=False).sum()
+
+    def _num_stats(self) -> dict:
+        """`_num_stats`-style results computed from exact value counts"""
+        counts = self.counts
+        order = np.argsort(counts.index.to_numpy(dtype=float))
+        keys = counts.index.to_numpy(dtype=float)[order]
+        weights = counts.to_numpy()[order]
+        n = int(weights.sum())
+        cum = np.cumsum(weights)
+        pos = np.asarray(_QUANTILES) * (n - 1)
+        lo, hi = np.floor(pos), np.ceil(pos)
+        v_lo, v_hi = keys[np.searchsorted(cum, lo, side='right')], keys[np.searchsorted(cum, hi, side='right')]
+        q25, med, q75 = v_lo + (v_hi - v_lo) * (pos - lo)
+
+        finite = np.isfinite(keys)
+        fmin, fmax = (keys[finite][0], keys[finite][-1]) if finite.any() else (0.0, 1.0)
+        if fmin == fmax:
+            fmin, fmax = fmin - 0.5, fmax + 0.5
+        edges = np.linspace(fmin, fmax, 11)
+        hist = np.histogram(keys[finite], bins=edges, weights=weights[finite])[0].astype(np.int64)
+
+        return {'n': n, 'mean': self.moments.mean, 'std': self.moments.std, 'min': keys[0],
+                'q25': q25, 'median': med, 'q75': q75, 'max': keys[-1], 'n_distinct': len(keys),
+                'hist': hist, 'edges': edges}
+
+    def summarize(self, show_graph: bool = True, graph_backend: str = 'svg') -> dict:
+        """the column's `_summarize_col` dict"""
+        if self.kind not in ('num', 'date', 'cat'):
+            return {'Stats / Values': f'not supported dtype {self.dtype}'}
+
+        if self.kind == 'cat':
+            if not self.exact:
+                return _fmt_cat_sketch(self.sketches['items'], self.max_level, show_graph, graph_backend)
+            return _stats_cat_col(None, self.max_level, show_graph, graph_backend,
+                                  value_counts=self.counts)
+
+        if self.exact and len(self._counts) == 0:
+            empty = pd.Series([np.nan] * max(self.n_rows, 1), dtype=float if self.kind == 'num' else 'datetime64[ns]')
+            return _summarize_col(empty.astype(self.dtype), self.max_level, show_graph=show_graph,
+                                  graph_backend=graph_backend)
+
+        if self.kind == 'date':
+            vmin, vmax = pd.Timestamp(int(self.vmin)), pd.Timestamp(int(self.vmax))
+            if self.exact:
+                counts = self.counts
+                days = (counts.index.to_numpy() - int(self.vmin)) // _DAY_NS
+                counts, edges = np.histogram(days, bins=10, weights=counts.to_numpy())
+                return _fmt_date_stats(vmin, vmax, len(self._counts), counts.astype(np.int64), edges,
+                                       show_graph, graph_backend)
+            edges = np.linspace(self.vmin / _DAY_NS, self.vmax / _DAY_NS, 11)
+            out = _fmt_date_stats(vmin, vmax, 0, self.sketches['hist'].rebin(edges), edges,
+                                  show_graph, graph_backend)
+            out['Freqs / (% of Valid)'] = _fmt_distinct_sketch(self.sketches['distinct'])
+            return out
+
+        probe = pd.Series([], dtype=self.dtype)
+        if self.exact and _is_categorical(probe, len(self._counts), self.max_level):
+            return _stats_cat_col(None, self.max_level, show_graph, graph_backend, value_counts=self._num_labels())
+        if self.exact:
+            return _stats_num_col(None, show_graph, graph_backend, num_stats=self._num_stats())
+
+        hist = self.sketches['hist']
+        lo, hi = (self.vmin, self.vmax) if np.isfinite([self.vmin, self.vmax]).all() else (0.0, 1.0)
+        edges = np.histogram_bin_edges([], bins=10, range=(lo, hi))
+        return _fmt_num_sketch(self.moments, self.sketches['quantiles'], self.sketches['distinct'],
+                               hist.rebin(edges), edges, show_graph, graph_backend)
+
+
+class SummaryState:
+    """mergeable summary of a data frame whose rows arrive in pieces
+
+    Every column keeps its missing count and exact value counts, falling
+    back to sketches (moments, min/max, histogram bins, quantiles, frequent
+    levels and a distinct count) once it has more than `exact_limit`
+    distinct values. Duplicate rows are counted from 64-bit row digests, kept
+    exactly up to 10 million distinct rows (80 MB) and estimated with
+    HyperLogLog past that, so memory does not grow with the number of rows.
+    `update` and `merge` cost time proportional to what they add, and
+    `render` draws the same table as `dfSummary` on all rows seen so far.
+
+    Args:
+        max_level (int, optional): [max level of categorical variable to be shown]. Defaults to 10.
+        exact_limit (int, optional): [distinct values per column kept exactly before falling back to sketches]. Defaults to 100_000.
+        count_duplicates (bool, optional): [count duplicated rows for the caption, keeping 8 bytes per distinct row up to 10 million rows and estimating it past that]. Defaults to True.
+        name (str, optional): [table name shown in the caption]. Defaults to 'df'.
+
+    Examples:
+    ```
+    from summarytools import dfSummary
+    state = dfSummary(day1, return_state = True)
+    state.update(day2)              # summarizes only the rows of day2
+    state.merge(other_state)        # e.g. a state built on another worker
+    state.render()                  # Styler, like dfSummary(pd.concat([day1, day2, ...]))
+    ```
+    """
+
+    def __init__(self, max_level: int = 10, exact_limit: int = 100_000, count_duplicates: bool = True,
+                 name: str = 'df'):
+        self.max_level = max_level
+        self.exact_limit = exact_limit
+        self.name = name
+        self.columns = None
+        self.accumulators = []
+        self.n_rows = 0
+        self.duplicates = _DuplicateCounter(by_value=True) if count_duplicates else None
+
+    def update(self, chunk: pd.DataFrame):
+        if self.columns is None:
+            self.columns = chunk.columns
+            self.accumulators = [_ColumnAccumulator(self.max_level, self.exact_limit) for _ in chunk.columns]
+        elif not chunk.columns.equals(self.columns):
+            raise ValueError("all chunks must have the same columns")
+        self.n_rows += len(chunk)
+        if self.duplicates is not None:
+            self.duplicates.update(chunk)
+        for i, acc in enumerate(self.accumulators):
+            acc.update(chunk.iloc[:, i])
+        return self
+
+    def merge(self, other: 'SummaryState'):
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self.columns = other.columns
+            self.accumulators = [_ColumnAccumulator(self.max_level, self.exact_limit) for _ in other.columns]
+        elif not other.columns.equals(self.columns):
+            raise ValueError("cannot merge summaries of frames with different columns")
+        self.n_rows += other.n_rows
+        if other.duplicates is None:
+            self.duplicates = None
+        elif self.duplicates is not None:
+            self.duplicates.merge(other.duplicates)
+        for acc, other_acc in zip(self.accumulators, other.accumulators):
+            acc.merge(other_acc)
+        return self
+
+    @property
+    def exact(self) -> bool:
+        return all(acc.exact for acc in self.accumulators)
+
+    def render(self, tbl_name: str = None, show_graph: bool = True, is_collapsible: bool = False,
+               graph_backend: str = 'svg', output: str = 'styler'):
+        """the summary table of all rows seen so far, as returned by `dfSummary` ('styler' or 'html' `output`)"""
+        _check_output(output)
+        if output == 'data':
+            raise ValueError("`output` of a SummaryState must be 'styler' or 'html'")
+        tbl_name = self.name if tbl_name is None else tbl_name
+        if show_graph:
+            _get_backend(graph_backend)
+        columns = self.columns if self.columns is not None else pd.Index([])
+        n_dups = self.duplicates.n_dups if self.duplicates is not None else None
+        tbl_caption = _summary_caption(tbl_name, self.n_rows, len(columns), n_dups,
+                                       self.duplicates is not None and self.duplicates.approx)
+        if not self.exact:
+            tbl_caption += "<br>(approximate: ~ values are estimated from sketches)"
+        stats = [{**acc.summarize(show_graph, graph_backend), 'n_missing': acc.n_missing}
+                 for acc in self.accumulators]
+        dtypes = [acc.dtype for acc in self.accumulators]
+        out = _summary_table(columns, dtypes, stats, self.n_rows)
+        return _style_summary(out, tbl_caption, tbl_name, show_graph, is_collapsible, output)
+
+    def _repr_html_(self):
+        return self.render().to_html()
+
+
+def _read_chunks(path, chunksize: int, **read_kwargs):
+    if Path(path).suffix.lower() in ('.parquet', '.pq'):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("reading Parquet files requires pyarrow") from None
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, **read_kwargs):
+            yield batch.to_pandas()
+    else:
+        with pd.read_csv(path, chunksize=chunksize, **read_kwargs) as reader:
+            yield from reader
+
+
+def dfSummary_from_file(path, chunksize: int = 100_000, max_level: int = 10,
+                        show_graph: bool = True, is_collapsible=False,
+                        graph_backend: str = 'svg', exact_limit: int = 100_000, count_duplicates: bool = True,
+                        **read_kwargs):
+    """generate HTML data summary of a CSV or Parquet file, reading it in chunks
+
+    Args:
+        path (str or Path): [CSV file, or Parquet file with a .parquet/.pq suffix (requires pyarrow)]
+        chunksize (int, optional): [rows read per chunk]. Defaults to 100_000.
+        max_level (int, optional): [max level of categorical variable to be shown]. Defaults to 10.
+        show_graph (bool, optional): [flag to show Graph column]. Defaults to True.
+        is_collapsible (bool, optional): [flag for collapsible page]. Defaults to False.
+        graph_backend (str, optional): [graph renderer, 'svg' or 'matplotlib']. Defaults to 'svg'.
+        exact_limit (int, optional): [distinct values per column kept exactly before falling back to sketches]. Defaults to 100_000.
+        count_duplicates (bool, optional): [count duplicated rows for the caption, keeping 8 bytes per distinct row up to 10 million rows and estimating it past that]. Defaults to True.
+        **read_kwargs: [passed to pd.read_csv, or to ParquetFile.iter_batches]
+
+    Returns:
+        [Pandas.Styler]: if is_collapsible = False
+        [HTML]: if is_collapsible = True
+
+    Examples:
+    ```
+    from summarytools import dfSummary_from_file
+    dfSummary_from_file('./your-data-path.csv', chunksize=500_000, parse_dates=['date'])
+    ```
+    """
+    acc = SummaryState(max_level, exact_limit, count_duplicates)
+    for chunk in _read_chunks(path, chunksize, **read_kwargs):
+        acc.update(chunk)
+    return acc.render(Path(path).name, show_graph, is_collapsible, graph_backend)
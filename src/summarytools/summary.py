@@ -1,39 +1,71 @@
-import multiprocessing as mp
-from pathlib import Path
-
 import numpy as np
 import pandas as pd
-from IPython.display import HTML
-
-from .htmlwidgets import collapsible
-from .summarytools import _get_stats, _summarize_col, _var_name
 
+from .cache import _cached_stats, _resolve_cache
+from .duplicates import _DuplicateCounter
+from .graphs import _DeferredGraph, _get_backend
+from .htmlwidgets import tabset
+from .parallel import _get_stats_parallel, _get_stats_threaded, _resolve_executor
+from .render import _HTML_TAIL, _check_output, _html_head, _html_rows, _reject_options, _render_table, _wrap_collapsible
+from .summarytools import _NUM_BLOCK_SIZE, _get_stats, _stats_data, _var_name
 
-def get_stats(df, num_proc: int, max_level: int = 10, tbl_name: str = 'df', show_graph: bool = True, tmp_dir: str ='./tmp'):
-    tmp_dir = Path(tmp_dir)
-    data = [(df[col], max_level, tbl_name, i, show_graph, tmp_dir) for i, col in enumerate(df.columns)]
 
-    with mp.Pool(num_proc) as pool:
-        results = pool.starmap(_summarize_col, data)
+def get_stats(df, num_proc: int, max_level: int = 10, tbl_name: str = 'df', show_graph: bool = True, tmp_dir: str = None,
+              graph_backend: str = 'svg', approx: bool = False, batch_size: int = None):
+    """column stats computed on a persistent pool of `num_proc` processes
 
-    return results
+    Numeric columns reach the workers through shared memory and columns are
+    sent in batches of `batch_size` (by default about four batches per process).
+    `tbl_name` and `tmp_dir` are unused and kept for backward compatibility.
+    """
+    return _get_stats_parallel(df, num_proc, max_level, show_graph, graph_backend, approx, batch_size)
 
 
 def dfSummary(data: pd.DataFrame, max_level: int = 10,
-              show_graph: bool = True, tmp_dir: str = './tmp',
-              is_collapsible=False, num_proc = 1):
+              show_graph: bool = True, tmp_dir: str = None,
+              is_collapsible=False, num_proc = 1, graph_backend: str = 'svg',
+              approx: bool = False, name: str = None, executor: str = 'auto', num_workers: int = None,
+              count_duplicates: bool = True, cache=False, return_state: bool = False, output: str = 'styler',
+              page_size: int = None, stream: bool = False):
     """generate HTML data summary
 
     Args:
         data (pd.DataFrame): [input dataframe]
         max_level (int, optional): [max level of categorical variable to be shown]. Defaults to 10.
         show_graph (bool, optional): [flag to show Graph column]. Defaults to True.
-        tmp_dir (str, optional): [directory for temporary images]. Defaults to './tmp'.
+        tmp_dir (str, optional): [unused, graphs are rendered in memory; kept for backward compatibility]. Defaults to None.
         is_collapsible (bool, optional): [flag for collapsible page]. Defaults to False.
+        num_proc (int, optional): [number of processes used to compute column stats; same as executor='process', num_workers=num_proc]. Defaults to 1.
+        graph_backend (str, optional): [graph renderer, 'svg' for inline vector sparklines or 'matplotlib' for PNG images]. Defaults to 'svg'.
+        approx (bool, optional): [estimate distinct counts, quantiles and top levels with mergeable sketches, reporting their error bounds]. Defaults to False.
+        name (str, optional): [table name shown in the caption; looked up from the caller's variables when None]. Defaults to None.
+        executor (str, optional): [how column stats are computed: 'serial', 'thread', 'process', or 'auto' for threads on large frames]. Defaults to 'auto'.
+        num_workers (int, optional): [number of threads or processes]. Defaults to the number of CPUs.
+        count_duplicates (bool, optional): [count duplicated rows for the caption, from 64-bit row hashes; estimated when approx = True]. Defaults to True.
+        cache (bool or SummaryCache, optional): [reuse summaries of columns whose content has not changed; True for a shared in-memory cache]. Defaults to False.
+        return_state (bool, optional): [return a mergeable SummaryState to update with new rows and render later;
+                                        rendering options then go to its `render`]. Defaults to False.
+        output (str, optional): ['styler', 'html' for an HTML string written without Styler or IPython,
+                                 or 'data' for the unformatted exact stats, which take no approx, cache or executor
+                                 options]. Defaults to 'styler'.
+        page_size (int, optional): [split the summary into pages of this many columns, as HTML strings (requires
+                                    output = 'html'), each summarized when first read; only the first page is
+                                    computed up front, and the duplicate count, which reads every column, is shown
+                                    on the last page]. Defaults to None.
+        stream (bool, optional): [return a generator of HTML pieces (requires output = 'html'): the table head,
+                                  the rows of each batch of `page_size` columns, by default 64 as in the numeric
+                                  kernel, as soon as they are summarized, then the table end, with the duplicate
+                                  count in its footer]. Defaults to False.
 
     Returns:
         [Pandas.Styler]: if is_collapsible = False
         [HTML]: if is_collapisbile = True
+        [str]: if output = 'html'
+        [dict]: {'name', 'n_rows', 'n_cols', 'n_duplicates', 'columns': pd.DataFrame of exact stats per column}
+                if output = 'data'
+        [SummaryState]: if return_state = True
+        [SummaryPages]: pages of HTML if page_size is given
+        [generator]: of HTML strings if stream = True
 
     Examples:
     ```
@@ -51,65 +83,220 @@ def dfSummary(data: pd.DataFrame, max_level: int = 10,
     ```
     """
 
-    tbl_name = _var_name(data)
-    tbl_dups = f"Duplicates: {data.duplicated().sum():,}"
-    tbl_dims = "Dimensions: {:,} x {:,}".format(*data.shape)
+    _check_output(output)
+    if page_size is not None and page_size < 1:
+        raise ValueError("`page_size` must be a positive number of columns")
+    if page_size is not None and not stream and output != 'html':
+        raise ValueError("pages are HTML strings: `page_size` needs output = 'html'")
+    if stream and output != 'html':
+        raise ValueError("streamed pieces are HTML strings: `stream` needs output = 'html'")
+    if stream:
+        _reject_options('stream = True', is_collapsible=is_collapsible)
+    # num_proc only stands for executor = 'process'
+    _reject_options(f"executor = {executor!r}", num_proc=num_proc > 1 and executor not in ('auto', 'process'))
+    tbl_name = _var_name(data) if name is None else name
+    if return_state:
+        _reject_options('return_state = True', approx=approx, cache=cache is not False,
+                        executor=executor != 'auto', num_proc=num_proc != 1, num_workers=num_workers is not None,
+                        show_graph=not show_graph, graph_backend=graph_backend != 'svg',
+                        is_collapsible=is_collapsible, output=output != 'styler',
+                        page_size=page_size is not None, stream=stream)
+        # imported here: streaming builds on this module's table helpers
+        from .streaming import SummaryState
+        return SummaryState(max_level, count_duplicates=count_duplicates, name=tbl_name).update(data)
+
+    def duplicates():
+        duplicates = _DuplicateCounter(approx).update(data)
+        return duplicates.n_dups, duplicates.approx
+
+    if output == 'data':
+        # the plain stats are always exact and computed in this process
+        _reject_options("output = 'data'", approx=approx, cache=cache is not False,
+                        executor=executor != 'auto', num_proc=num_proc != 1, num_workers=num_workers is not None,
+                        is_collapsible=is_collapsible)
+        return {'name': tbl_name, 'n_rows': data.shape[0], 'n_cols': data.shape[1],
+                'n_duplicates': duplicates()[0] if count_duplicates else None,
+                'columns': _stats_data(data, max_level)}
+
+    def caption(with_duplicates: bool) -> str:
+        tbl_caption = _summary_caption(tbl_name, *data.shape, *(duplicates() if with_duplicates else ()))
+        if approx:
+            tbl_caption += "<br>(approximate: ~ values are estimated from sketches)"
+        return tbl_caption
+
+    if show_graph:
+        _get_backend(graph_backend)
+
+    # Stats / Freqs / Graphs
+    if num_proc > 1 and executor in ('auto', 'process'):
+        executor, num_workers = 'process', num_workers or num_proc
+    executor, num_workers = _resolve_executor(data, executor, num_workers)
+
+    def compute(frame):
+        if executor == 'process':
+            return get_stats(frame, num_workers, max_level, tbl_name, show_graph, tmp_dir, graph_backend, approx)
+        if executor == 'thread':
+            return _get_stats_threaded(frame, num_workers, max_level, show_graph, graph_backend, approx)
+        return _get_stats(frame, max_level, tbl_name, show_graph, tmp_dir, graph_backend, approx)
+
+    cache = _resolve_cache(cache)
+
+    def summarize(frame):
+        if cache is None:
+            return compute(frame)
+        return _cached_stats(frame, cache, (max_level, show_graph, graph_backend, approx), compute)
+
+    if stream:
+        # the head goes out before any column is read: the duplicate count ends the stream
+        return _stream_summary(data, summarize, caption(False), show_graph, page_size or _NUM_BLOCK_SIZE,
+                               duplicates if count_duplicates else None)
+
+    if page_size is not None:
+        def render_page(start, stop):
+            frame = data.iloc[:, start:stop]
+            out = _summary_table(frame.columns, frame.dtypes, summarize(frame), len(data), start + 1)
+            # the duplicate count reads every column: only the last page shows it
+            page_caption = caption(count_duplicates and stop == data.shape[1])
+            page_caption += f"<br>Columns: {start + 1:,}-{stop:,} of {data.shape[1]:,}"
+            return _style_summary(out, page_caption, tbl_name, show_graph, is_collapsible, 'html')
+
+        return SummaryPages(render_page, data.shape[1], page_size)
+
+    out = _summary_table(data.columns, data.dtypes, summarize(data), len(data))
+    return _style_summary(out, caption(count_duplicates), tbl_name, show_graph, is_collapsible, output)
+
+
+class SummaryPages:
+    """dfSummary split into pages of `page_size` columns, as HTML strings
+
+    The first page is rendered up front and the others when first read, by
+    index or by iterating, so the time to the first page does not grow with
+    the number of columns. The duplicate count reads every column, so only
+    the last page's caption carries it. Rendered pages are kept.
+
+    Examples:
+    ```
+    pages = dfSummary(data, page_size = 50, output = 'html')
+    pages            # first page
+    pages[3]         # columns 151-200, summarized now
+    for page in pages:
+        display(HTML(page))
+    pages.tabset()   # every page, one tab each
+    ```
+    """
+
+    def __init__(self, render_page, n_cols: int, page_size: int):
+        self.n_cols = n_cols
+        self.page_size = page_size
+        self._render_page = render_page
+        self._pages = {}
+        self[0]
+
+    def __len__(self):
+        return max(1, -(-self.n_cols // self.page_size))
+
+    def _bounds(self, i: int):
+        return i * self.page_size, min((i + 1) * self.page_size, self.n_cols)
+
+    def __getitem__(self, i: int) -> str:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("page index out of range")
+        if i not in self._pages:
+            self._pages[i] = self._render_page(*self._bounds(i))
+        return self._pages[i]
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def tabset(self, display: bool = True):
+        """every page in the `tabset` widget, one tab per page labelled by its columns"""
+        tabs = {}
+        for i, page in enumerate(self):
+            start, stop = self._bounds(i)
+            tabs[f'{start + 1}-{stop}'] = page
+        return tabset(tabs, display)
+
+    def _repr_html_(self):
+        return self[0]
+
+
+def _summary_caption(tbl_name: str, nrows: int, ncols: int, n_dups: int = None, approx: bool = False) -> str:
+    """caption with the table name, dimensions and, unless `n_dups` is None, the duplicate count"""
+    tbl_dims = f"Dimensions: {nrows:,} x {ncols:,}"
     tbl_caption = "<strong>Data Frame Summary</strong><br>"
-    tbl_caption += tbl_name + "<br>" + tbl_dims + "<br>" + tbl_dups
+    tbl_caption += tbl_name + "<br>" + tbl_dims
+    if n_dups is not None:
+        tbl_caption += "<br>" + _duplicates_note(n_dups, approx)
+    return tbl_caption
+
+
+def _duplicates_note(n_dups: int, approx: bool = False) -> str:
+    return "Duplicates: " + ("~" if approx else "") + f"{n_dups:,}"
 
-    _nrows, ncols = data.shape
-    _num_uniques = data.apply(pd.Series.nunique)
 
-    variable = data.columns.values.astype(str)
+def _summary_table(columns, dtypes, stats: list, nrows: int, start: int = 1) -> pd.DataFrame:
+    """assemble the summary rows from per-column `stats` dicts, numbered from `start`
+
+    Each dict holds the cells of its column and its missing count under 'n_missing'.
+    """
+    variable = np.asarray(columns).astype(str)
     variable = [f'<strong>{i}</strong>' for i in variable]
-    no = np.arange(1, ncols + 1)
-    dtype = [f'<br>[{i}]' for i in data.dtypes.astype(str)]
+    no = np.arange(start, start + len(variable))
+    dtype = [f'<br>[{i}]' for i in pd.Series(dtypes).astype(str)]
     variable = [name + type_name for name, type_name in zip(variable, dtype)]
     out = pd.DataFrame({'No': no, 'Variable': variable})
 
-    tmp_dir = Path(tmp_dir)
-    if show_graph:
-        tmp_dir.mkdir(exist_ok=True, parents=True)
-
-    # Stats / Freqs / Graphs
-    if num_proc > 1:
-        stats = get_stats(data, num_proc, max_level, tbl_name, show_graph, tmp_dir)
-    else:
-        stats = _get_stats(data, max_level, tbl_name, show_graph, tmp_dir)
+    assert not any(isinstance(out.get('Graph'), _DeferredGraph) for out in stats), "deferred graphs left unrendered"
     stats = pd.DataFrame(stats)
+    n_missing = stats.pop('n_missing').to_numpy() if 'n_missing' in stats else np.zeros(0, dtype=int)
     out = pd.concat([out, stats], axis=1)
 
     # Missing
-    missing = [f'{i:,}' for i in data.isna().sum()]
-    missing_pct = [f'<br>({i:.1%})' for i in data.isna().mean()]
+    missing = [f'{i:,}' for i in n_missing]
+    missing_pct = [f'<br>({i:.1%})' for i in n_missing / nrows]
     out['Missing'] = [count + pct for count, pct in zip(missing, missing_pct)]
+    return out
 
-    # styles
-    out = (out.style
-           .set_properties(**{'text-align': 'left',
-                'font-size':'12px',
-                'vertical-align':'middle'})
-           .set_table_styles([{'selector':'thead>tr>th', 'props': 'text-align : left'}])
-           .set_properties(subset=['No'], **{'width':'5%', 
-                'max-width':'50px', 
-                'min-width':'20px'})
-           .set_properties(subset=['Variable'], **{'width':'15%',
-                'max-width':'200px',
-                'min-width':'100px',
-                'word-break':'break-word'})
-           .set_properties(subset=['Stats / Values'], **{'width':'30%', 
-                'min-width':'100px'})
-           .set_properties(subset=['Freqs / (% of Valid)'], **{'width':'25%',
-                'min-width':'100px'})\
-           .set_properties(subset=['Missing'], width='10%') \
-           .hide(axis='index')\
-           .set_caption(tbl_caption))
-    if show_graph:
-        out = out.set_properties(subset=['Graph'], **{'width':'20%', 'min-width':'150px'})
 
-    if is_collapsible:
-        out = out.to_html()
-        out = collapsible(out, tbl_name)
-        return HTML(out)
+# CSS of the summary cells, shared by all columns and by column (in table order)
+_SUMMARY_TABLE_STYLES = [{'selector': 'thead>tr>th', 'props': 'text-align: left'}]
+_SUMMARY_CELL_CSS = 'text-align: left; font-size: 12px; vertical-align: middle'
+_SUMMARY_COLUMN_CSS = {
+    'No': 'width: 5%; max-width: 50px; min-width: 20px',
+    'Variable': 'width: 15%; max-width: 200px; min-width: 100px; word-break: break-word',
+    'Stats / Values': 'width: 30%; min-width: 100px',
+    'Freqs / (% of Valid)': 'width: 25%; min-width: 100px',
+    'Graph': 'width: 20%; min-width: 150px',
+    'Missing': 'width: 10%'}
 
-    return out
+
+def _style_summary(out: pd.DataFrame, tbl_caption: str, tbl_name: str,
+                   show_graph: bool, is_collapsible: bool, output: str = 'styler'):
+    out = _render_table(out, output, tbl_caption, _SUMMARY_CELL_CSS,
+                        {col: css for col, css in _SUMMARY_COLUMN_CSS.items() if col in out.columns},
+                        _SUMMARY_TABLE_STYLES)
+    return _wrap_collapsible(out, output, tbl_name) if is_collapsible else out
+
+
+def _stream_summary(data: pd.DataFrame, summarize, tbl_caption: str, show_graph: bool, batch_size: int,
+                    duplicates=None):
+    """the summary table as HTML pieces: its head, the rows of each `batch_size` columns once summarized, its end
+
+    Only one batch of column summaries is held at a time. The duplicate count
+    reads every column, so `duplicates`, unless None, is only called after the
+    last batch and its count goes in a footer of the end piece.
+    """
+    columns = [col for col in _SUMMARY_COLUMN_CSS if show_graph or col != 'Graph']
+    yield _html_head(pd.Index(columns), tbl_caption, _SUMMARY_CELL_CSS,
+                     {col: _SUMMARY_COLUMN_CSS[col] for col in columns}, _SUMMARY_TABLE_STYLES)
+    for start in range(0, data.shape[1], batch_size):
+        frame = data.iloc[:, start:start + batch_size]
+        out = _summary_table(frame.columns, frame.dtypes, summarize(frame), len(data), start + 1)
+        yield _html_rows(out.reindex(columns=columns))
+    if duplicates is None:
+        yield _HTML_TAIL
+    else:
+        yield (f'</tbody>\n<tfoot>\n<tr><td colspan="{len(columns)}">{_duplicates_note(*duplicates())}</td></tr>\n'
+               '</tfoot>\n</table>\n')
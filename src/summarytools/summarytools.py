@@ -1,167 +1,561 @@
-import base64
-import inspect
+import sys
 
+import numpy as np
 import pandas as pd
-from matplotlib import pyplot as plt
 from pandas.api.types import is_datetime64_any_dtype as _is_datetime
 from pandas.api.types import is_numeric_dtype as _is_numerical
 
+from .graphs import _render_barh, _render_hist
+from .sketches import FrequentItems, HyperLogLog, KLLSketch, Moments
 
-def _is_categorical(x: pd.Series, num_unique, max_level):
-    try:
-        if x.dtype == 'category':
-            return True
-    except Exception:   #noqa
-        pass
-    if x.dtype in ['object', 'str']:
-        return True
-    return bool(x.dtype in ['int', 'float'] and num_unique <= max_level)
+_QUANTILES = [0.25, 0.5, 0.75]
 
-def _is_bool(x: pd.Series):
-    return x.dtype == bool
 
-def encode_img_base64(img):
-    with open(img, "rb") as image_file:
-        x = image_file.read()
-        encoded_string = base64.b64encode(x).decode()
-    src = f"data:image/png;base64, {encoded_string}"
-    return src
+KINDS = ('categorical', 'datetime', 'bool', 'numeric', 'unsupported')
 
-def _graph_cat_col(stats, filename, figsize):
-    fig = plt.figure(figsize=figsize)
-    pct = stats / stats.sum()
-    plt.barh(pct.index, pct, color='gray', alpha=0.3, edgecolor='black')
-    plt.gca().invert_yaxis()
-    plt.xlim(0, 1)
-    plt.axis('off')
-    fig.savefig(filename, bbox_inches='tight', pad_inches=0, transparent=True)
-    plt.close()
-    base64str = encode_img_base64(filename)
-    return f'<img src = "{base64str}"></img>'
-
-
-def _graph_num_col(x, filename, figsize):
-    fig = plt.figure(figsize=figsize)
-    x = x[~x.isna()]
-    _ = plt.hist(x, bins=10, color='gray', edgecolor='black', alpha=0.3)
-    plt.axis('off')
-    plt.tight_layout()
-    fig.savefig(filename, bbox_inches='tight', pad_inches=0, transparent=True)
-    plt.close()
-    base64str = encode_img_base64(filename)
-    return f'<img src = "{base64str}"></img>'
+
+def _dtype_kind(dtype) -> str:
+    """how columns of `dtype` are summarized, one of `KINDS`
+
+    Numeric columns of any width, NumPy or nullable, are summarized by level
+    instead when they have at most `max_level` distinct values.
+    """
+    if isinstance(dtype, (pd.CategoricalDtype, pd.StringDtype)) or dtype == object:
+        return 'categorical'
+    if _is_datetime(dtype):
+        return 'datetime'
+    if pd.api.types.is_bool_dtype(dtype):
+        return 'bool'
+    if _is_numerical(dtype) and not pd.api.types.is_complex_dtype(dtype):
+        return 'numeric'
+    return 'unsupported'
 
 
-def _graph_date_col(x: pd.Series, filename, figsize):
-    freqs = (x - x.min()).map(lambda x: x.days)
-    fig = plt.figure(figsize=figsize)
-    plt.hist(freqs, bins=10, color='gray', alpha=0.3, ec='black')
-    plt.axis('off')
-    fig.savefig(filename, bbox_inches='tight', pad_inches=0, transparent=True)
-    plt.close()
-    base64str = encode_img_base64(filename)
-    return f'<img src = "{base64str}"></img>'
+def summary_plan(data: pd.DataFrame) -> pd.DataFrame:
+    """how dfSummary will summarize each column of `data`, from its dtype
 
+    Every distinct dtype is classified once. Columns of the same kind are
+    summarized together, e.g. numeric ones in blocks by one NumPy kernel.
 
-def _stats_date_col(x: pd.Series, show_graph: bool, filename: str):
+    Args:
+        data (pd.DataFrame): [input dataframe]
 
-    stats = f"Min: {x.min().strftime('%Y-%m-%d')}<br>"
-    stats += f"Max: {x.max().strftime('%Y-%m-%d')}<br>"
-    stats += f"Duration: {(x.max() - x.min()).days:,} days"
+    Returns:
+        [pd.DataFrame]: [one row per column with its 'column', 'dtype' and 'kind'; 'numeric' columns
+                         with at most max_level distinct values are shown by level]
 
-    freqs = f"{x.nunique()} distinct values"
+    Examples:
+    ```
+    from summarytools import summary_plan
+    summary_plan(data).groupby('kind').size()
+    ```
+    """
+    dtypes = data.dtypes
+    kinds = {dtype: _dtype_kind(dtype) for dtype in dict.fromkeys(dtypes)}
+    return pd.DataFrame({'column': data.columns, 'dtype': dtypes.to_numpy(),
+                         'kind': [kinds[dtype] for dtype in dtypes]})
+
+
+def _is_categorical(x: pd.Series, num_unique, max_level):
+    kind = _dtype_kind(x.dtype)
+    return kind == 'categorical' or bool(kind == 'numeric' and num_unique <= max_level)
+
+def _is_bool(x: pd.Series):
+    return _dtype_kind(x.dtype) == 'bool'
+
+def _graph_cat_col(stats, graph_backend='svg'):
+    pct = stats / stats.sum()
+    return _render_barh(pct.to_numpy(), graph_backend)
+
+
+def _fmt_date_stats(vmin: pd.Timestamp, vmax: pd.Timestamp, n_distinct, counts, edges,
+                    show_graph: bool, graph_backend: str = 'svg') -> dict:
+    stats = f"Min: {vmin.strftime('%Y-%m-%d')}<br>"
+    stats += f"Max: {vmax.strftime('%Y-%m-%d')}<br>"
+    stats += f"Duration: {(vmax - vmin).days:,} days"
+
+    freqs = f"{n_distinct} distinct values"
 
     out = {
         'Stats / Values': stats,
         'Freqs / (% of Valid)': freqs}
 
     if show_graph:
-        graph = _graph_date_col(x, filename, figsize=(2, 1))
+        graph = _render_hist(counts, edges, graph_backend)
         out['Graph'] = graph
 
     return out
 
 
-def _stats_cat_col(x: pd.Series, max_level: int, show_graph: bool, filename: str, max_str_len=30):
+def _stats_date_col(x: pd.Series, show_graph: bool, graph_backend: str = 'svg', n_distinct: int = None):
+    if n_distinct is None:
+        n_distinct = x.nunique()
+    x = x[~x.isna()]
+    counts, edges = np.histogram((x - x.min()).dt.days, bins=10)
+    return _fmt_date_stats(x.min(), x.max(), n_distinct, counts, edges, show_graph, graph_backend)
 
-    stats = x.astype(str).value_counts()
-    values = [f'{i+1}. {v[:max_str_len]}' for i, v in enumerate(stats.index)]
-    total = stats.values.sum()
-    freqs = stats.map(lambda i: f"{i:,} ({i/total:.1%})")
 
-    if len(stats) > max_level:
-        values = [f'{i+1}. {v[:max_str_len]}' for i,
-                  v in enumerate(stats.index[:max_level])]
-        values += [f'{max_level + 1}. other']
-        freqs = stats[:max_level].map(
-            lambda i: f"{i:,} ({i/total:.1%})").to_list()
-        freqs += [f"{stats[max_level:].sum():,} ({stats[max_level:].sum()/total:.1%})"]
-        stats = pd.concat([stats.head(max_level), 
-            pd.Series({'other': stats[max_level:].sum()})])
+def _fmt_cat_stats(top: pd.Series, other, total, show_graph: bool, graph_backend: str = 'svg',
+                   max_str_len=30) -> dict:
+    """format the most frequent levels `top`, plus an `other` bucket unless it is None"""
+    values = [f'{i+1}. {str(v)[:max_str_len]}' for i, v in enumerate(top.index)]
+    freqs = [f"{i:,} ({i/total:.1%})" for i in top]
+    stats = top
+    if other is not None:
+        values += [f'{len(top) + 1}. other']
+        freqs += [f"{other:,} ({other/total:.1%})"]
+        stats = pd.concat([top, pd.Series({'other': other})])
 
     out = {
         'Stats / Values': '<br>'.join(values),
         'Freqs / (% of Valid)': '<br>'.join(freqs)}
 
     if show_graph:
-        graph = _graph_cat_col(stats, filename, figsize=(2, 0.3 * len(stats)))
+        graph = _graph_cat_col(stats, graph_backend)
         out['Graph'] = graph
 
     return out
 
 
-def _stats_num_col(x: pd.Series, show_graph: bool, filename: str) -> dict:
+def _top_k(counts: pd.Series, k: int):
+    """the `k` largest counts in descending order and the sum of the others (None if there are none)
+
+    Selects with a partition in O(n) and only sorts the `k` survivors; ties
+    keep their order in `counts`, as a stable descending sort would.
+    """
+    n = len(counts)
+    if k is None or n <= k:
+        return counts.sort_values(ascending=False, kind='stable'), None
+    values = counts.to_numpy()
+    if k <= 0:
+        return counts.iloc[:0], values.sum()
+    kth = np.partition(values, n - k)[n - k]
+    above = np.flatnonzero(values > kth)
+    ties = np.flatnonzero(values == kth)[:k - len(above)]
+    keep = np.zeros(n, dtype=bool)
+    keep[above] = keep[ties] = True
+    top = counts[keep].sort_values(ascending=False, kind='stable')
+    return top, values[~keep].sum()
+
+
+def _factorize(x: pd.Series):
+    """codes (-1 for missing) and distinct values of `x`, in order of first appearance"""
+    if isinstance(x.dtype, np.dtype) and x.dtype.kind == 'f':
+        # factorize equates -0.0 with 0.0, which print differently: factorize the bit patterns
+        values = x.to_numpy(dtype=np.float64, copy=True)
+        values[np.isnan(values)] = np.nan
+        codes, uniques = pd.factorize(values.view(np.int64))
+        uniques = uniques.view(np.float64)
+        missing = np.flatnonzero(np.isnan(uniques))
+        if len(missing) > 0:
+            codes[codes == missing[0]] = -1
+            codes[codes > missing[0]] -= 1
+            uniques = np.delete(uniques, missing[0])
+        return codes, uniques.astype(x.dtype)
+    return pd.factorize(x)
+
+
+def _value_counts(x: pd.Series) -> pd.Series:
+    """counts of the non-missing values of `x` labelled as `astype(str)` prints them,
+    without converting every row to a string
+
+    Values are counted on their codes; integer and boolean labels stay
+    native, as str() renders them the same way, and other columns only turn
+    their distinct values into strings, merging any that print alike.
+    Object columns holding more than strings are still converted row by row.
+    Missing values are left out in both cases, whether or not the installed
+    pandas keeps them missing in `astype(str)`.
+    """
+    codes, uniques = _factorize(x)
+    if x.dtype == object and pd.api.types.infer_dtype(uniques) != 'string':
+        # factorize equates 1, 1.0 and True, which print differently
+        return x[x.notna()].astype(str).value_counts(sort=False)
+    counts = np.bincount(codes[codes >= 0] if (codes < 0).any() else codes, minlength=len(uniques))
+    if x.dtype.kind in 'iub' or isinstance(x.dtype, pd.StringDtype):
+        return pd.Series(counts, index=uniques, name='count')
+    labels = pd.Series(uniques, dtype=x.dtype).astype(str)
+    counts = pd.Series(counts, index=pd.Index(labels), name='count')
+    if counts.index.has_duplicates:
+        counts = counts.groupby(level=0, sort=False).sum()
+    return counts
+
+
+def _stats_cat_col(x: pd.Series, max_level: int, show_graph: bool, graph_backend: str = 'svg', max_str_len=30,
+                   value_counts: pd.Series = None):
+
+    stats = _value_counts(x) if value_counts is None else value_counts
+    top, other = _top_k(stats, max_level)
+    return _fmt_cat_stats(top, other, stats.values.sum(), show_graph, graph_backend, max_str_len)
+
+
+def _num_stats(block: np.ndarray, bins: int = 10) -> dict:
+    """column-wise numeric stats of a 2-D float block (rows x columns)
+
+    NaNs are treated as missing. One sort per column yields min, max,
+    quartiles, distinct counts and histogram counts (via searchsorted on the
+    bin edges); moments are taken over the NaN-free prefix of the sorted rows.
+    """
+    block = np.asarray(block, dtype=float)
+    if block.ndim == 1:
+        block = block[:, None]
+    nrows, ncols = block.shape
+
+    # one contiguous row per column, NaNs sort last: valid values of column j are srt[j, :n[j]]
+    srt = np.array(block.T, order='C')
+    if nrows == 0:
+        srt = np.full((ncols, 1), np.nan)
+    srt.sort(axis=1)
+    isnan = np.isnan(srt)
+    n = srt.shape[1] - isnan.sum(axis=1)
+    empty = n == 0
+    last = np.maximum(n - 1, 0)
+    rows = np.arange(ncols)
+
+    vmin = np.where(empty, np.nan, srt[rows, 0])
+    vmax = np.where(empty, np.nan, srt[rows, last])
+
+    # linear interpolation, as in pd.Series.quantile
+    pos = np.multiply.outer(np.asarray(_QUANTILES), last)
+    lo = np.floor(pos).astype(int)
+    hi = np.ceil(pos).astype(int)
+    q = srt[rows, lo] + (srt[rows, hi] - srt[rows, lo]) * (pos - lo)
+    q25, med, q75 = np.where(empty, np.nan, q)
+
+    changes = (srt[:, 1:] != srt[:, :-1]) & ~isnan[:, 1:]
+    n_distinct = np.where(empty, 0, changes.sum(axis=1) + 1)
+
+    mean = np.full(ncols, np.nan)
+    std = np.full(ncols, np.nan)
+    hist = np.zeros((ncols, bins), dtype=np.int64)
+    edges = np.empty((ncols, bins + 1))
+    buf = np.empty(srt.shape[1])
+    for j in range(ncols):
+        row = srt[j, :n[j]]
+
+        # two-pass moments over the NaN-free prefix, reusing one scratch buffer
+        if n[j] > 0:
+            with np.errstate(invalid='ignore'):
+                mean[j] = row.sum() / n[j]
+                dev = np.subtract(row, mean[j], out=buf[:n[j]])
+                if n[j] > 1:
+                    std[j] = np.sqrt(dev @ dev / (n[j] - 1))
+
+        # equal-width bins over the finite range, with np.histogram's half-open bins
+        finite = row[np.searchsorted(row, -np.inf, side='right'):np.searchsorted(row, np.inf)]
+        fmin, fmax = (finite[0], finite[-1]) if len(finite) > 0 else (0.0, 1.0)
+        if fmin == fmax:
+            fmin, fmax = fmin - 0.5, fmax + 0.5
+        edges[j] = np.linspace(fmin, fmax, bins + 1)
+        cuts = np.searchsorted(finite, edges[j, 1:-1])
+        hist[j] = np.diff(np.concatenate([[0], cuts, [len(finite)]]))
+
+    return {'n': n, 'mean': mean, 'std': std, 'min': vmin, 'q25': q25, 'median': med,
+            'q75': q75, 'max': vmax, 'n_distinct': n_distinct, 'hist': hist, 'edges': edges}
+
+
+def _is_num_kernel_dtype(dtype) -> bool:
+    return _dtype_kind(dtype) == 'numeric'
+
+
+# integers of at least this magnitude may not survive the float64 kernel
+_FLOAT_EXACT_INT = 2 ** 53
+
+
+def _exact_int_stats(x: pd.Series, stats: dict) -> dict:
+    """`stats` of column `x`, with distinct count, min and max recomputed on the integers themselves
+    when `x` holds integers too large for float64 to tell apart"""
+    if x.dtype.kind not in 'iu' or stats['n'] == 0:
+        return stats
+    if max(abs(stats['min']), abs(stats['max'])) < _FLOAT_EXACT_INT:
+        return stats
+    values = x.dropna().to_numpy(dtype=getattr(x.dtype, 'numpy_dtype', x.dtype))
+    return {**stats, 'n_distinct': len(np.unique(values)), 'min': values.min(), 'max': values.max()}
+
+
+# numeric columns converted to one float block at a time by `_num_stats_frame`
+_NUM_BLOCK_SIZE = 64
+
+
+def _num_stats_frame(data: pd.DataFrame, block_size: int = _NUM_BLOCK_SIZE, kinds: list = None) -> dict:
+    """`_num_stats` for every numeric column of `data`, keyed by column position"""
+    if kinds is None:
+        kinds = summary_plan(data)['kind']
+    positions = [i for i, kind in enumerate(kinds) if kind == 'numeric']
+    out = {}
+    for start in range(0, len(positions), block_size):
+        chunk = positions[start:start + block_size]
+        block = data.iloc[:, chunk].to_numpy(dtype=float, na_value=np.nan)
+        stats = _num_stats(block)
+        for j, i in enumerate(chunk):
+            out[i] = _exact_int_stats(data.iloc[:, i], {k: v[j] for k, v in stats.items()})
+    return out
+
+
+def _num_stats_col(x: pd.Series) -> dict:
+    stats = _num_stats(x.to_numpy(dtype=float, na_value=np.nan))
+    return _exact_int_stats(x, {k: v[0] for k, v in stats.items()})
 
-    stats = f"Mean (sd) : {x.mean():.1f} ({x.std():.1f})"
+
+def _stats_num_col(x: pd.Series, show_graph: bool, graph_backend: str = 'svg',
+                   num_stats: dict = None) -> dict:
+    s = _num_stats_col(x) if num_stats is None else num_stats
+
+    stats = f"Mean (sd) : {s['mean']:.1f} ({s['std']:.1f})"
     stats += "<br>min < med < max:"
-    stats += f"<br>{x.min():.1f} < {x.median():.1f} < {x.max():.1f}"
-    stats += f"<br>IQR (CV) : {x.quantile(0.75) - x.quantile(0.25):.1f} ({x.mean()/x.std():.1f})"
+    stats += f"<br>{s['min']:.1f} < {s['median']:.1f} < {s['max']:.1f}"
+    stats += f"<br>IQR (CV) : {s['q75'] - s['q25']:.1f} ({s['mean']/s['std']:.1f})"
 
-    values = f"{x.nunique():,} distinct values"
+    values = f"{s['n_distinct']:,} distinct values"
 
     out = {
         'Stats / Values': stats,
         'Freqs / (% of Valid)': values}
 
     if show_graph:
-        graph = _graph_num_col(x, filename, figsize=(2, 1))
+        graph = _render_hist(s['hist'], s['edges'], graph_backend)
         out['Graph'] = graph
 
     return out
 
 
-def _var_name(var):
-    lcls = inspect.stack()[2][0].f_locals
-    for name in lcls:
-        if id(var) == id(lcls[name]):
-            return name
-    return ""
+def _var_name(var, depth: int = 2):
+    """name bound to `var` in the caller of the public function, without loading the call stack's source"""
+    try:
+        frame = sys._getframe(depth)
+    except ValueError:
+        return ""
+    try:
+        for name, value in frame.f_locals.items():
+            if value is var:
+                return name
+        return ""
+    finally:
+        del frame
     
+def _profile_col(x: pd.Series, num_stats: dict = None, kind: str = None) -> dict:
+    """distinct count, null count and value counts of a column, computed once
+
+    Numeric columns reuse their `_num_stats`; value counts are only built for
+    columns that are always summarized by level (category, object, bool).
+    """
+    if num_stats is not None:
+        return {'n_distinct': int(num_stats['n_distinct']),
+                'n_missing': len(x) - int(num_stats['n']),
+                'value_counts': None}
+    n_missing = int(x.isna().sum())
+    kind = _dtype_kind(x.dtype) if kind is None else kind
+    if kind in ('categorical', 'bool'):
+        value_counts = _value_counts(x)
+        n_distinct = len(value_counts)
+    else:
+        value_counts = None
+        n_distinct = x.nunique()
+    return {'n_distinct': n_distinct, 'n_missing': n_missing, 'value_counts': value_counts}
+
+
 def _summarize_col(series: pd.Series, max_level: int = 10, tbl_name: str = 'df', i:str=0,
-              show_graph: bool = True, tmp_dir: str = './tmp') -> dict:
-    filename = tmp_dir.joinpath(f'{tbl_name}_{i:03d}.png')
-    num_uniq = series.nunique()
-    if _is_categorical(series, num_uniq, max_level):
-        return _stats_cat_col(series, max_level, show_graph, filename)
-    elif _is_datetime(series):
-        return _stats_date_col(series, show_graph, filename)
-    elif _is_bool(series):
-        return _stats_cat_col(series, max_level, show_graph, filename)
-    elif _is_numerical(series):
-        return _stats_num_col(series, show_graph, filename)
+              show_graph: bool = True, tmp_dir: str = None,
+              graph_backend: str = 'svg', num_stats: dict = None, profile: dict = None,
+              kind: str = None) -> dict:
+    """summary cells of one column, plus its missing count under 'n_missing' (taken from its profile)"""
+    kind = _dtype_kind(series.dtype) if kind is None else kind
+    if num_stats is None and kind == 'numeric':
+        num_stats = _num_stats_col(series)
+    if kind == 'unsupported':
+        return {'Stats / Values': f'not supported dtype {series.dtype}', 'n_missing': int(series.isna().sum())}
+    if profile is None:
+        profile = _profile_col(series, num_stats, kind)
+    # dates with no valid value have no range to show: they get the empty level summary of an all-missing number
+    if kind in ('categorical', 'bool') or kind == 'numeric' and profile['n_distinct'] <= max_level \
+            or kind == 'datetime' and profile['n_distinct'] == 0:
+        out = _stats_cat_col(series, max_level, show_graph, graph_backend,
+                             value_counts=profile['value_counts'])
+    elif kind == 'datetime':
+        out = _stats_date_col(series, show_graph, graph_backend, profile['n_distinct'])
     else:
-        return {'Stats / Values': f'not supported dtype {series.dtype}'}
+        out = _stats_num_col(series, show_graph, graph_backend, num_stats)
+    out['n_missing'] = profile['n_missing']
+    return out
     
-def _summarize_col_2(x, max_level, tbl_name, show_graph, tmp_dir):
-    series, i = x
-    return _summarize_col(series, max_level, tbl_name, i, show_graph, tmp_dir)
+def _chunks(series: pd.Series, chunk_rows: int):
+    """consecutive slices of `series` of at most `chunk_rows` rows, as views"""
+    for start in range(0, len(series), chunk_rows):
+        yield series.iloc[start:start + chunk_rows]
+
+
+def _summarize_col_approx(series: pd.Series, max_level: int = 10, show_graph: bool = True,
+                          graph_backend: str = 'svg', chunk_rows: int = 1_000_000) -> dict:
+    """`_summarize_col` from mergeable sketches, reading the column in slices of `chunk_rows`
+
+    Distinct counts come from HyperLogLog, quantiles from a KLL sketch and the
+    top levels from a Misra-Gries summary; mean, sd, min and max stay exact.
+    Each slice is converted and stripped of missing values on its own, so
+    no full-length copy of the column is made. The reported error bounds are
+    appended to the cells, and the missing count is kept under 'n_missing'
+    as in `_summarize_col`.
+    """
+    is_num = _is_num_kernel_dtype(series.dtype)
+    is_date = _is_datetime(series)
+    if not (is_num or is_date or _is_bool(series) or _is_categorical(series, np.inf, 0)):
+        return {'Stats / Values': f'not supported dtype {series.dtype}', 'n_missing': int(series.isna().sum())}
+
+    def valid(chunk: pd.Series):
+        # the values of a slice without missing ones: floats for numbers, a Series for dates
+        if is_date:
+            return chunk[chunk.notna()]
+        values = chunk.to_numpy(dtype=float, na_value=np.nan)
+        return values[~np.isnan(values)]
+
+    n_missing = 0
+    hll = None
+    if is_num or is_date:
+        hll = HyperLogLog()
+        vmin = vmax = None
+        for chunk in _chunks(series, chunk_rows):
+            values = valid(chunk)
+            n_missing += len(chunk) - len(values)
+            hll.update(values.to_numpy() if is_date else values)
+            if is_date and len(values) > 0:
+                vmin = values.min() if vmin is None else min(vmin, values.min())
+                vmax = values.max() if vmax is None else max(vmax, values.max())
+
+    # a date column holding only missing values has no range: summarize it by level, like an empty number column
+    if not (is_num or is_date) or _is_categorical(series, hll.count(), max_level) or is_date and vmin is None:
+        items = FrequentItems(capacity=max(8 * max_level, 64))
+        n_missing = 0
+        for chunk in _chunks(series, chunk_rows):
+            valid_values = chunk[chunk.notna()]
+            items.update(valid_values.to_numpy())
+            n_missing += len(chunk) - len(valid_values)
+        out = _fmt_cat_sketch(items, max_level, show_graph, graph_backend)
+        out['n_missing'] = n_missing
+        return out
+
+    if is_date:
+        # day bins over the whole range, as `_stats_date_col` draws them
+        counts, edges = np.zeros(10, dtype=np.int64), np.histogram_bin_edges([0, (vmax - vmin).days], bins=10)
+        for chunk in _chunks(series, chunk_rows):
+            counts += np.histogram((valid(chunk) - vmin).dt.days, bins=edges)[0]
+        out = _fmt_date_stats(vmin, vmax, 0, counts, edges, show_graph, graph_backend)
+        out['Freqs / (% of Valid)'] = _fmt_distinct_sketch(hll)
+        out['n_missing'] = n_missing
+        return out
+
+    moments = Moments()
+    quantiles = KLLSketch()
+    lo, hi = np.inf, -np.inf
+    for chunk in _chunks(series, chunk_rows):
+        values = valid(chunk)
+        moments.update(values)
+        quantiles.update(values)
+        finite = values[np.isfinite(values)]
+        if len(finite) > 0:
+            lo, hi = min(lo, finite.min()), max(hi, finite.max())
+
+    counts, edges = np.zeros(10, dtype=np.int64), None
+    if show_graph:
+        if lo > hi:
+            lo, hi = 0.0, 1.0
+        edges = np.histogram_bin_edges([], bins=10, range=(lo, hi))
+        for chunk in _chunks(series, chunk_rows):
+            values = valid(chunk)
+            counts += np.histogram(values[np.isfinite(values)], bins=edges)[0]
+
+    out = _fmt_num_sketch(moments, quantiles, hll, counts, edges, show_graph, graph_backend)
+    out['n_missing'] = n_missing
+    return out
+
+
+def _fmt_distinct_sketch(hll: HyperLogLog) -> str:
+    return f"~{hll.count():,.0f} distinct values<br>(&plusmn;{hll.relative_error:.1%})"
+
+
+def _fmt_cat_sketch(items: FrequentItems, max_level: int, show_graph: bool, graph_backend: str = 'svg') -> dict:
+    top = items.top(max_level)
+    other = items.n - int(top.sum())
+    out = _fmt_cat_stats(top, other if len(items.counts) > max_level or other > 0 else None,
+                         items.n, show_graph, graph_backend)
+    if items.error > 0:
+        out['Freqs / (% of Valid)'] += f"<br>(counts may be low by up to {items.error:,})"
+    return out
+
+
+def _fmt_num_sketch(moments: Moments, quantiles: KLLSketch, hll: HyperLogLog, counts, edges,
+                    show_graph: bool, graph_backend: str = 'svg') -> dict:
+    mean, std = (moments.mean, moments.std) if moments.n > 0 else (np.nan, np.nan)
+    vmin, vmax = (quantiles.min, quantiles.max) if quantiles.n > 0 else (np.nan, np.nan)
+    q25, med, q75 = quantiles.quantile(_QUANTILES)
+
+    stats = f"Mean (sd) : {mean:.1f} ({std:.1f})"
+    stats += "<br>min < med < max:"
+    stats += f"<br>{vmin:.1f} < ~{med:.1f} < {vmax:.1f}"
+    stats += f"<br>IQR (CV) : ~{q75 - q25:.1f} ({mean/std:.1f})"
+    if quantiles.rank_error > 0:
+        stats += f"<br>(quantile rank error &le; {quantiles.relative_rank_error:.2%})"
 
-def _get_stats(data: pd.DataFrame, max_level: int, tbl_name: str, show_graph: bool, tmp_dir: str):
+    out = {
+        'Stats / Values': stats,
+        'Freqs / (% of Valid)': _fmt_distinct_sketch(hll)}
+
+    if show_graph:
+        graph = _render_hist(counts, edges, graph_backend)
+        out['Graph'] = graph
+
+    return out
+
+
+def _summarize_col_2(x, max_level, tbl_name, show_graph, tmp_dir, graph_backend='svg'):
+    series, i = x
+    return _summarize_col(series, max_level, tbl_name, i, show_graph, tmp_dir, graph_backend)
+
+def _get_stats(data: pd.DataFrame, max_level: int, tbl_name: str, show_graph: bool, tmp_dir: str = None,
+               graph_backend: str = 'svg', approx: bool = False):
+    if approx:
+        return [_summarize_col_approx(data.iloc[:, i], max_level, show_graph, graph_backend)
+                for i in range(data.shape[1])]
+    kinds = summary_plan(data)['kind'].tolist()
+    num_stats = _num_stats_frame(data, kinds=kinds)
     stats = []
-    for i, v in enumerate(data.columns):
-        stats += [_summarize_col(data[v], max_level, tbl_name, i, show_graph, tmp_dir)]
+    for i, kind in enumerate(kinds):
+        stats += [_summarize_col(data.iloc[:, i], max_level, tbl_name, i, show_graph, tmp_dir,
+                                 graph_backend, num_stats.get(i), kind=kind)]
     return stats
 
+
+def _stats_data(data: pd.DataFrame, max_level: int) -> pd.DataFrame:
+    """the numbers behind each summary row, one row per column, without formatting or graphs
+
+    'top' holds {level: count} of the `max_level` most frequent levels of the
+    columns summarized by level, and 'n_other' the count of the other levels.
+    """
+    kinds = summary_plan(data)['kind'].tolist()
+    num_stats = _num_stats_frame(data, kinds=kinds)
+    rows = []
+    for i, kind in enumerate(kinds):
+        x = data.iloc[:, i]
+        row = {'column': data.columns[i], 'dtype': str(x.dtype), 'kind': kind}
+        if kind == 'unsupported':
+            rows.append(row)
+            continue
+        s = num_stats.get(i)
+        profile = _profile_col(x, s, kind)
+        row.update(n_valid=len(x) - profile['n_missing'], n_missing=profile['n_missing'],
+                   n_distinct=int(profile['n_distinct']))
+        if kind == 'numeric':
+            row.update({'mean': s['mean'], 'std': s['std'], 'min': s['min'], 'q1': s['q25'],
+                        'median': s['median'], 'q3': s['q75'], 'max': s['max']})
+        elif kind == 'datetime':
+            row.update({'min': x.min(), 'max': x.max()})
+        if kind in ('categorical', 'bool') or kind == 'numeric' and profile['n_distinct'] <= max_level:
+            counts = profile['value_counts'] if profile['value_counts'] is not None else _value_counts(x)
+            top, other = _top_k(counts, max_level)
+            row['top'] = dict(zip(top.index.tolist(), top.to_numpy().tolist()))
+            row['n_other'] = int(other or 0)
+        rows.append(row)
+    columns = ['column', 'dtype', 'kind', 'n_valid', 'n_missing', 'n_distinct',
+               'mean', 'std', 'min', 'q1', 'median', 'q3', 'max', 'top', 'n_other']
+    return pd.DataFrame(rows, columns=columns)
+
 def _fmt_freq(v):
     if pd.isna(v):
         return ''
@@ -170,4 +564,10 @@ def _fmt_freq(v):
 def _fmt_pct(v, digits):
     if pd.isna(v):
         return ''
-    return f'{v:.{digits}f}%'
\ No newline at end of file
+    return f'{v:.{digits}f}%'
+
+def _fmt_array(values: np.ndarray, fmt) -> np.ndarray:
+    """apply a scalar formatter such as `_fmt_freq` to an array, formatting each distinct value once"""
+    uniq, inverse = np.unique(values, return_inverse=True)
+    labels = np.array([fmt(v) for v in uniq], dtype=str)
+    return labels[inverse].reshape(np.shape(values))
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import summarytools.summarytools as st
+from summarytools import SummaryCache, dfSummary
+
+
+def _frame(n_rows=300, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "number": rng.normal(size=n_rows),
+        "count": rng.integers(0, 5, size=n_rows),
+        "label": rng.choice(["a", "b", "c"], size=n_rows),
+    })
+
+
+@pytest.fixture
+def summarized(monkeypatch):
+    names = []
+    summarize_col = st._summarize_col
+
+    def counting(series, *args, **kwargs):
+        names.append(series.name)
+        return summarize_col(series, *args, **kwargs)
+
+    monkeypatch.setattr(st, "_summarize_col", counting)
+    return names
+
+
+def test_cache_only_recomputes_changed_columns(summarized):
+    frame = _frame()
+    cache = SummaryCache()
+
+    first = dfSummary(frame, cache=cache)
+    frame["number"] = frame["number"] * 2
+    second = dfSummary(frame, cache=cache)
+
+    assert summarized == ["number", "count", "label", "number"]
+    assert cache.hits == 2
+    pd.testing.assert_frame_equal(second.data, dfSummary(frame).data)
+    assert first.data.loc[1:, "Stats / Values"].tolist() == second.data.loc[1:, "Stats / Values"].tolist()
+
+
+def test_cache_keys_include_summary_options(summarized):
+    frame = _frame()
+    cache = SummaryCache()
+
+    dfSummary(frame, cache=cache)
+    dfSummary(frame, cache=cache, show_graph=False)
+
+    assert len(summarized) == 6
+
+
+def test_cache_evicts_least_recently_used():
+    cache = SummaryCache(maxsize=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, ({"Stats / Values": key}, 0))
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("c") == ({"Stats / Values": "c"}, 0)
+
+
+def test_cache_persists_to_disk(tmp_path, summarized):
+    frame = _frame()
+    dfSummary(frame, cache=SummaryCache(path=tmp_path))
+
+    cache = SummaryCache(path=tmp_path)
+    result = dfSummary(frame, cache=cache)
+
+    assert len(summarized) == 3
+    assert cache.hits == 3
+    pd.testing.assert_frame_equal(result.data, dfSummary(frame).data)
+
+    cache.clear()
+    assert not list(tmp_path.glob("*.pkl"))
@@ -127,3 +127,63 @@ def test_ctable_accepts_equally_named_series():
     result = ctable(x, y, prop="none", chisq=False)
 
     assert result.data.loc["Total", "Total"] == "2"
+
+
+def test_ctable_uses_explicit_name_in_title():
+    data = pd.DataFrame({"x": ["a", "b"], "y": ["c", "d"]})
+
+    result = ctable("x", "y", data=data, is_collapsible=True, name="survey")
+
+    assert "survey: x * y" in result.data
+
+
+def test_ctable_plain_data_rejects_is_collapsible():
+    data = pd.DataFrame({"x": ["a", "b"], "y": ["c", "d"]})
+
+    with pytest.raises(ValueError, match="output = 'data' does not take `is_collapsible`"):
+        ctable("x", "y", data=data, is_collapsible=True, output="data")
+
+
+def test_fmt_array_matches_scalar_formatter():
+    import numpy as np
+
+    from summarytools.summarytools import _fmt_array, _fmt_freq
+
+    values = np.array([[1234.0, np.nan], [0.0, 1234.0]])
+
+    assert _fmt_array(values, _fmt_freq).tolist() == [["1,234", ""], ["0", "1,234"]]
+
+
+def test_ctable_counts_missing_dates_and_keeps_mixed_labels_apart():
+    data = pd.DataFrame({
+        "day": pd.to_datetime(["2021-01-01", None, "2021-01-01"]),
+        "code": [1, 1.0, "1"],
+    })
+
+    result = ctable("day", "code", data=data, prop="none", chisq=False, totals=False)
+
+    assert result.data.index.tolist() == ["2021-01-01", "NaN"]
+    assert result.data.columns.tolist() == ["1", "1.0"]
+    assert result.data.loc["NaN"].tolist() == ["0", "1"]
+
+
+def test_ctable_pairs_series_with_reordered_indexes_by_label():
+    x = pd.Series(["a", "b", "b"], index=[10, 20, 30], name="x")
+    y = pd.Series(["no", "yes", "yes"], index=[30, 20, 10], name="y")
+
+    result = ctable(x, y, prop="none", chisq=False, totals=False)
+
+    assert result.data.loc["a"].tolist() == ["0", "1"]
+    assert result.data.loc["b"].tolist() == ["1", "1"]
+
+
+def test_ctable_outputs_numeric_tables_and_html_string():
+    data = pd.DataFrame({"x": ["a", "a", "b", "b"], "y": ["u", "v", "v", "v"]})
+
+    result = ctable("x", "y", data=data, output="data", chisq=False)
+    html = ctable("x", "y", data=data, output="html", chisq=False)
+
+    assert result["counts"].loc["b"].tolist() == [0.0, 2.0, 2.0]
+    assert result["proportions"].loc["a"].tolist() == [50.0, 50.0, 100.0]
+    assert result["chisq"] is None
+    assert '<th class="row_heading">a</th><td class="col0">1 (50.00%)</td>' in html
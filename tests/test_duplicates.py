@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from summarytools import dfSummary
+from summarytools.duplicates import _DuplicateCounter, _row_hashes
+
+
+def _frame(n_rows=5_000, seed=0):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({f"flag{i}": rng.integers(0, 2, size=n_rows) for i in range(12)})
+    frame["number"] = rng.choice([0.0, -0.0, 1.5, np.nan], size=n_rows)
+    frame["mixed"] = pd.Series(rng.choice([1, "1", True, None, "x"], size=n_rows), dtype=object)
+    frame["label"] = pd.Categorical(rng.choice(["a", "b", None], size=n_rows))
+    frame["date"] = pd.to_datetime(rng.choice(["2021-01-01", None], size=n_rows))
+    return frame
+
+
+def test_duplicate_counter_agrees_with_pandas():
+    frame = _frame()
+
+    for columns in (["number", "label"], ["mixed", "date"], list(frame.columns)):
+        assert _DuplicateCounter().update(frame[columns]).n_dups == frame[columns].duplicated().sum()
+
+
+def test_approximate_duplicate_counter_merges_chunks():
+    frame = _frame(n_rows=20_000).iloc[:, :14]
+    expected = frame.duplicated().sum()
+
+    parts = [_DuplicateCounter(approx=True).update(frame.iloc[start:start + 5_000]) for start in range(0, 20_000, 5_000)]
+    merged = parts[0].merge(parts[1]).merge(parts[2]).merge(parts[3])
+
+    assert merged.n_rows == len(frame)
+    assert abs(merged.n_dups - expected) <= 0.03 * (len(frame) - expected)
+
+
+def test_df_summary_duplicates_caption():
+    frame = _frame(n_rows=500)
+
+    assert f"Duplicates: {frame.duplicated().sum():,}" in dfSummary(frame, show_graph=False).caption
+    assert "Duplicates: ~" in dfSummary(frame, show_graph=False, approx=True).caption
+    assert "Duplicates" not in dfSummary(frame, show_graph=False, count_duplicates=False).caption
+
+
+def test_duplicate_counter_falls_back_to_estimate_past_limit():
+    frame = pd.DataFrame({"x": np.arange(10_000) % 3_000})
+
+    counter = _DuplicateCounter(exact_limit=1_000).update(frame.iloc[:500]).update(frame.iloc[500:])
+
+    assert counter.approx and not counter.runs
+    assert abs(counter.n_dups - 7_000) <= 0.03 * 3_000
+    assert _DuplicateCounter().merge(counter).approx
+
+
+def test_value_hashes_keep_large_integers_apart():
+    ints = pd.DataFrame({"x": [2**53, 2**53 + 1, 2**60, 2**60 + 1, 1]})
+    floats = pd.DataFrame({"x": [2.0**53, 2.0**60, 1.0]})
+
+    digests = _row_hashes(ints, by_value=True)
+
+    assert len(set(digests)) == 5
+    assert set(_row_hashes(floats, by_value=True)) <= set(digests)
@@ -24,6 +24,7 @@ def test_freq_limits_levels_and_orders_by_frequency():
     assert result["category"].tolist() == ["c", "b", "(other)"]
     assert result["Freq"].tolist() == [3.0, 2.0, 1.0]
     assert "% Total" not in result.columns
+    assert freq(series, max_level=0, output="data")["category"].tolist() == ["(other)", "NaN", "Total"]
 
 
 def test_freq_accepts_a_dataframe_column():
@@ -49,3 +50,63 @@ def test_freq_can_return_collapsible_html():
     assert isinstance(result, HTML)
     assert "Frequency Table" in result.data
     assert "st-collapsible" in result.data
+
+
+def test_freq_plain_data_rejects_is_collapsible():
+    with pytest.raises(ValueError, match="output = 'data' does not take `is_collapsible`"):
+        freq(pd.Series([1, 1, 2], name="value"), is_collapsible=True, output="data")
+
+
+def test_freq_uses_caller_variable_or_explicit_name_in_title():
+    survey = pd.DataFrame({"answer": ["yes", "no"]})
+
+    assert "survey: answer" in freq(survey, var="answer", is_collapsible=True).data
+    assert "poll: answer" in freq(survey, var="answer", is_collapsible=True, name="poll").data
+
+
+def test_freq_weights_by_column_name_or_array():
+    survey = pd.DataFrame({"answer": ["yes", "no", "yes", None], "w": [2.0, 1.0, 0.5, 1.5]})
+
+    by_name = freq(survey, var="answer", weights="w", order="freq").data
+    by_array = freq(survey["answer"], weights=survey["w"].to_numpy(), order="freq").data
+
+    assert by_name["answer"].tolist() == ["yes", "no", "NaN", "Total"]
+    assert by_name["Freq"].tolist() == [2.5, 1.0, 1.5, 5.0]
+    assert by_name["% Valid"].iloc[0] == pytest.approx(2.5 / 3.5 * 100)
+    pd.testing.assert_frame_equal(by_array, by_name)
+
+    with pytest.raises(ValueError, match="one value per row"):
+        freq(survey, var="answer", weights=[1.0])
+
+
+def test_freq_many_matches_freq_per_column():
+    from summarytools import freq_many
+
+    data = pd.DataFrame({"a": ["x", "y", "x"], "b": [1, None, 1], "w": [1.0, 2.0, 3.0]})
+
+    tables = freq_many(data, weights="w", num_workers=2)
+
+    assert list(tables) == ["a", "b"]
+    for var, table in tables.items():
+        expected = freq(data, var=var, weights="w")
+        pd.testing.assert_frame_equal(table.data, expected.data)
+        assert table.caption == expected.caption
+
+    bundle = freq_many(data, vars=["a", "b"], as_tabset=True)
+    assert isinstance(bundle, HTML)
+    assert "Frequency Table" in bundle.data and "tablinks" in bundle.data
+
+
+def test_freq_outputs_plain_table_and_html_string():
+    data = pd.DataFrame({"a": ["x", "y", "x", None]})
+
+    table = freq(data, var="a", output="data")
+    html = freq(data, var="a", output="html")
+
+    pd.testing.assert_frame_equal(table, freq(data, var="a").data)
+    assert html.count("<tr>") == len(table) + 1
+    assert '<td class="col1">2</td><td class="col2">66.67%</td>' in html
+    assert html.count("min-width: 60px") == 1
+
+    with pytest.raises(ValueError, match="`output`"):
+        freq(data, var="a", output="json")
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY = ("matplotlib", "IPython", "scipy")
+
+
+def _import_times(statement: str) -> dict:
+    """self time in microseconds of every module imported by `statement`, from `python -X importtime`"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            self_us, _, name = line[len("import time:"):].split("|")
+            if self_us.strip().isdigit():
+                times[name.strip()] = int(self_us)
+    return times
+
+
+def test_bare_import_loads_no_dependencies():
+    times = _import_times("import summarytools")
+
+    assert "summarytools" in times
+    assert not {"pandas", "numpy", *HEAVY} & set(times)
+
+
+@pytest.mark.parametrize("statement", [
+    "from summarytools import dfSummary, freq, ctable, tabset",
+    "from summarytools import *",
+])
+def test_public_functions_import_without_plotting_or_notebook_packages(statement):
+    times = _import_times(statement)
+
+    assert not [name for name in times if name.split(".")[0] in HEAVY]
+    own = sum(us for name, us in times.items() if name.split(".")[0] == "summarytools")
+    assert own < 200_000, f"summarytools modules took {own / 1000:.0f} ms to import"
+
+
+def test_html_and_data_outputs_run_without_notebook_packages():
+    statement = "; ".join([
+        "import sys, pandas as pd",
+        "from summarytools import dfSummary, freq, ctable, tabset",
+        "df = pd.DataFrame({'a': [1.5, 2.5, None], 'b': ['x', 'y', 'x']})",
+        "tabset({'summary': dfSummary(df, output='html'), 'freq': freq(df, 'b', output='html'),"
+        " 'ctable': ctable('a', 'b', data=df, output='html', chisq=False)}, display=False)",
+        "dfSummary(df, output='data')",
+        "assert 'IPython' not in sys.modules",
+    ])
+    subprocess.run([sys.executable, "-c", statement], check=True)
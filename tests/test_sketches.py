@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from summarytools.sketches import FrequentItems, HyperLogLog, KLLSketch, Moments
+
+
+def test_hyperloglog_estimates_distinct_counts_within_error():
+    values = np.random.default_rng(0).integers(0, 50_000, size=200_000)
+    sketch = HyperLogLog()
+
+    for chunk in np.array_split(values, 4):
+        sketch.update(chunk)
+
+    exact = len(np.unique(values))
+    assert sketch.count() == pytest.approx(exact, rel=4 * sketch.relative_error)
+
+
+def test_hyperloglog_merge_matches_single_pass():
+    left, right = np.arange(0, 3_000), np.arange(2_000, 6_000)
+
+    merged = HyperLogLog().update(left).merge(HyperLogLog().update(right))
+
+    assert merged.count() == HyperLogLog().update(np.concatenate([left, right])).count()
+
+
+def test_kll_quantiles_are_exact_for_small_inputs():
+    sketch = KLLSketch(k=64).update([4.0, 1.0, np.nan, 3.0, 2.0])
+
+    assert sketch.quantile([0.25, 0.5, 0.75]).tolist() == [1.75, 2.5, 3.25]
+    assert sketch.rank_error == 0
+
+
+def test_kll_quantile_rank_error_stays_within_bound():
+    values = np.random.default_rng(1).normal(size=300_000)
+    parts = [KLLSketch(k=256, seed=i).update(chunk) for i, chunk in enumerate(np.array_split(values, 3))]
+    sketch = parts[0].merge(parts[1]).merge(parts[2])
+
+    estimates = sketch.quantile([0.1, 0.5, 0.9])
+
+    ranks = np.searchsorted(np.sort(values), estimates) / len(values)
+    assert np.abs(ranks - [0.1, 0.5, 0.9]).max() <= sketch.relative_rank_error
+    assert sum(len(level) for level in sketch.levels) < 256 * len(sketch.levels)
+
+
+def test_frequent_items_finds_heavy_hitters_with_bounded_undercount():
+    values = np.random.default_rng(2).zipf(1.6, size=100_000)
+    sketch = FrequentItems(capacity=32)
+
+    for chunk in np.array_split(values, 10):
+        sketch.update(chunk)
+
+    exact = pd.Series(values).value_counts()
+    top = sketch.top(3)
+    assert top.index.tolist() == exact.index[:3].tolist()
+    assert ((exact[top.index] - top).between(0, sketch.error)).all()
+    assert sketch.error <= len(values) / 33
+
+
+def test_moments_merge_matches_numpy():
+    values = np.random.default_rng(3).normal(5, 2, size=1_000)
+
+    moments = Moments()
+    for chunk in np.array_split(values, 7):
+        moments.update(chunk)
+
+    assert moments.mean == pytest.approx(values.mean())
+    assert moments.std == pytest.approx(values.std(ddof=1))
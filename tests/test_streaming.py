@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from summarytools import dfSummary, dfSummary_from_file
+from summarytools.duplicates import _DuplicateCounter
+from summarytools.streaming import SummaryState
+
+
+def _frame(n_rows=500, seed=0):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({
+        "number": rng.normal(size=n_rows).round(2),
+        "count": rng.integers(0, 5, size=n_rows),
+        "label": rng.choice(["a", "b", "c", None], size=n_rows),
+        "date": pd.Timestamp("2021-01-01") + pd.to_timedelta(rng.integers(0, 90, size=n_rows), unit="D"),
+    })
+    frame.loc[::7, "number"] = np.nan
+    return pd.concat([frame, frame.head(20)], ignore_index=True)
+
+
+def test_summary_from_file_matches_in_memory_summary(tmp_path):
+    path = tmp_path / "frame.csv"
+    _frame().to_csv(path, index=False)
+
+    expected = dfSummary(pd.read_csv(path, parse_dates=["date"]), max_level=5)
+    result = dfSummary_from_file(path, chunksize=64, max_level=5, parse_dates=["date"])
+
+    pd.testing.assert_frame_equal(result.data, expected.data)
+    assert "frame.csv" in result.caption
+    assert result.caption.endswith(expected.caption.split("<br>", 2)[-1])
+
+
+def test_summary_from_file_types_columns_from_non_missing_chunks(tmp_path):
+    path = tmp_path / "mixed.csv"
+    pd.DataFrame({"code": [None] * 10 + ["1", "2", "x"] * 10}).to_csv(path, index=False)
+
+    expected = dfSummary(pd.read_csv(path), show_graph=False)
+    result = dfSummary_from_file(path, chunksize=4, show_graph=False)
+
+    pd.testing.assert_frame_equal(result.data, expected.data)
+
+
+def test_summary_from_file_falls_back_to_sketches(tmp_path):
+    path = tmp_path / "wide.csv"
+    _frame(n_rows=2_000).to_csv(path, index=False)
+
+    result = dfSummary_from_file(path, chunksize=300, exact_limit=50, parse_dates=["date"])
+
+    assert "approximate" in result.caption
+    assert result.data.loc[0, "Freqs / (% of Valid)"].startswith("~")
+    assert result.data.loc[1, "Stats / Values"].startswith("1. ")
+
+
+def test_frame_accumulators_merge_like_a_single_pass():
+    frame = _frame()
+    parts = [SummaryState(max_level=5).update(chunk) for chunk in (frame.iloc[:200], frame.iloc[200:350], frame.iloc[350:])]
+    merged = parts[0].merge(parts[1]).merge(parts[2])
+
+    single = SummaryState(max_level=5).update(frame)
+
+    pd.testing.assert_frame_equal(merged.render("frame").data, single.render("frame").data)
+
+
+def test_duplicate_counter_matches_pandas():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({"a": rng.integers(0, 20, size=3_000), "b": rng.choice(["x", "y"], size=3_000)})
+
+    counter = _DuplicateCounter()
+    for start in range(0, len(frame), 300):
+        chunk = frame.iloc[start:start + 300]
+        counter.update(chunk)
+
+    assert counter.n_dups == frame.duplicated().sum()
+
+
+def test_summary_from_parquet_file(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "frame.parquet"
+    _frame().to_parquet(path)
+
+    result = dfSummary_from_file(path, chunksize=64, max_level=5)
+
+    pd.testing.assert_frame_equal(result.data, dfSummary(_frame(), max_level=5).data)
+
+
+def test_summary_state_updates_with_new_rows():
+    frame = _frame()
+    days = [frame.iloc[:150], frame.iloc[150:300], frame.iloc[300:]]
+
+    state = dfSummary(days[0], max_level=5, return_state=True, name="frame")
+    state.update(days[1]).merge(dfSummary(days[2], max_level=5, return_state=True))
+
+    expected = dfSummary(frame, max_level=5, name="frame")
+    pd.testing.assert_frame_equal(state.render().data, expected.data)
+    assert state.render().caption == expected.caption
+    assert "Data Frame Summary" in state._repr_html_()
+    assert isinstance(state.render(output="html"), str)
+    for output in ("data", "bogus"):
+        with pytest.raises(ValueError, match="`output`"):
+            state.render(output=output)
+
+
+def test_summary_state_rejects_options_it_would_ignore():
+    frame = _frame()
+
+    for options in ({"approx": True}, {"cache": True}, {"executor": "thread"}, {"show_graph": False},
+                    {"graph_backend": "matplotlib"}, {"output": "html"}):
+        with pytest.raises(ValueError, match="return_state = True does not take"):
+            dfSummary(frame, return_state=True, **options)
+
+
+def test_summary_state_keeps_counts_of_distinct_values_across_updates():
+    frame = pd.DataFrame({"x": np.arange(300) % 7, "label": np.array(list("abcab"))[np.arange(300) % 5]})
+
+    state = dfSummary(frame.iloc[:100], return_state=True)
+    for start in range(100, 300, 50):
+        state.update(frame.iloc[start:start + 50])
+
+    assert [acc.counts.to_dict() for acc in state.accumulators] == [
+        frame["x"].value_counts(sort=False).to_dict(), frame["label"].value_counts(sort=False).to_dict()]
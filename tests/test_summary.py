@@ -1,9 +1,13 @@
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pytest
 from IPython.display import HTML
 
-from summarytools import _summarize_col, dfSummary
+from summarytools import _summarize_col, dfSummary, summary_plan
+from summarytools.graphs import _svg_barh, _svg_hist
+from summarytools.summarytools import _num_stats_frame, _summarize_col_approx, _top_k, _value_counts
 
 
 def test_summarize_numeric_column_without_graph(tmp_path):
@@ -31,6 +35,12 @@ def test_summarize_categorical_column_groups_extra_levels(tmp_path):
     assert result["Freqs / (% of Valid)"] == "2 (50.0%)<br>1 (25.0%)<br>1 (25.0%)"
 
 
+def test_summarize_col_reports_missing_count_from_its_profile():
+    assert _summarize_col(pd.Series([1.0, None, 3.0]), show_graph=False)["n_missing"] == 1
+    assert _summarize_col(pd.Series(["a", None, None]), show_graph=False)["n_missing"] == 2
+    assert _summarize_col(pd.Series([1 + 1j, None]), show_graph=False)["n_missing"] == 1
+
+
 def test_summarize_datetime_column(tmp_path):
     result = _summarize_col(
         pd.Series(pd.to_datetime(["2024-01-01", "2024-01-03"])),
@@ -63,8 +73,22 @@ def test_df_summary_generates_graphs(tmp_path):
 
     result = dfSummary(frame, max_level=1, show_graph=True, tmp_dir=tmp_path)
 
-    assert "data:image/png;base64" in result.data.loc[0, "Graph"]
-    assert list(Path(tmp_path).glob("*.png"))
+    assert result.data.loc[0, "Graph"].startswith("<svg")
+    assert not list(Path(tmp_path).glob("*.png"))
+
+
+def test_df_summary_graphs_do_not_require_tmp_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    frame = pd.DataFrame({
+        "number": [1.0, 2.0, 3.0],
+        "label": ["a", "b", "a"],
+        "date": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-05"]),
+    })
+
+    result = dfSummary(frame, max_level=5, show_graph=True, graph_backend="matplotlib")
+
+    assert all("data:image/png;base64" in g for g in result.data["Graph"])
+    assert not list(tmp_path.iterdir())
 
 
 def test_df_summary_can_return_collapsible_html():
@@ -78,3 +102,364 @@ def test_df_summary_can_return_collapsible_html():
     assert isinstance(result, HTML)
     assert "Data Frame Summary" in result.data
     assert "st-collapsible" in result.data
+
+
+def test_svg_sparklines_scale_to_precomputed_counts():
+    hist = _svg_hist([0, 5, 10], width=30, height=10)
+    bars = _svg_barh([0.5, 1.0], width=100, row_height=10)
+
+    assert hist.count("<rect") == 3
+    assert 'y="0.0" width="10.0" height="10.0"' in hist
+    assert 'width="50.0"' in bars and 'width="100.0"' in bars
+
+
+def test_df_summary_rejects_unknown_graph_backend():
+    with pytest.raises(ValueError, match="graph_backend"):
+        dfSummary(pd.DataFrame({"value": [1, 2]}), graph_backend="ascii")
+
+
+def test_num_stats_kernel_matches_pandas_per_column():
+    frame = pd.DataFrame({
+        "normal": np.random.default_rng(0).normal(size=200),
+        "ints": np.arange(200) % 7,
+        "sparse": [1.5, None, 3.0, 3.0] * 50,
+        "empty": [None] * 200,
+    }, dtype=float)
+
+    stats = _num_stats_frame(frame)
+
+    for i, col in enumerate(frame.columns):
+        x = frame[col]
+        expected = [x.mean(), x.std(), x.min(), x.quantile(0.25), x.median(),
+                    x.quantile(0.75), x.max(), x.nunique()]
+        result = [stats[i][k] for k in ("mean", "std", "min", "q25", "median", "q75", "max", "n_distinct")]
+        assert result == pytest.approx(expected, nan_ok=True)
+        if x.notna().any():
+            assert stats[i]["hist"].tolist() == np.histogram(x.dropna(), bins=10)[0].tolist()
+
+
+def test_num_stats_keep_integers_beyond_float_precision_apart():
+    big = 2 ** 53
+    frame = pd.DataFrame({
+        "int64": np.array([big, big + 1, big + 2]),
+        "nullable": pd.array([big, big + 1, None], dtype="Int64"),
+    })
+
+    stats = _num_stats_frame(frame)
+
+    assert (stats[0]["n_distinct"], stats[0]["min"], stats[0]["max"]) == (3, big, big + 2)
+    assert (stats[1]["n_distinct"], stats[1]["max"]) == (2, big + 1)
+    assert dfSummary(frame, output="data")["columns"]["n_distinct"].tolist() == [3, 2]
+
+
+def test_complex_columns_are_not_supported():
+    frame = pd.DataFrame({"z": [1 + 1j, 2 + 0j]})
+
+    assert summary_plan(frame)["kind"].tolist() == ["unsupported"]
+    assert dfSummary(frame, show_graph=False).data.iloc[0, 2] == "not supported dtype complex128"
+
+
+def test_top_k_matches_a_stable_full_sort():
+    rng = np.random.default_rng(0)
+    counts = pd.Series(rng.integers(0, 20, size=1_000), index=[f"v{i}" for i in range(1_000)])
+
+    for k in (0, 1, 10, 999, 1_000):
+        top, other = _top_k(counts, k)
+        expected = counts.sort_values(ascending=False, kind="stable")
+        pd.testing.assert_series_equal(top, expected.iloc[:k])
+        assert other == (expected.iloc[k:].sum() if k < len(counts) else None)
+
+
+@pytest.mark.parametrize("values", [
+    pd.Categorical(["b", "a", None, "b"], categories=["a", "b", "z"]),
+    [3, 1, 3, 2],
+    [True, False, True, True],
+    [0.0, -0.0, np.nan, 1.5],
+    pd.array([1, None, 1], dtype="Int64"),
+    pd.Series([1, "1", True, "True", None], dtype=object),
+    pd.Series([1, "1", np.nan, 1.0, None, np.nan], dtype=object),
+])
+def test_value_counts_match_counts_of_strings(values):
+    x = pd.Series(values)
+    expected = x[x.notna()].astype(str).value_counts(sort=False)
+
+    result = _value_counts(x)
+
+    assert [str(v) for v in result.index] == list(expected.index)
+    assert result.tolist() == expected.tolist()
+    assert result.sum() == x.notna().sum()
+
+
+def test_df_summary_does_not_recount_distinct_values(monkeypatch):
+    frame = pd.DataFrame({
+        "number": [1.5, 2.5, 3.5, None],
+        "small_int": [1, 2, 1, 2],
+        "label": ["a", "b", "a", None],
+        "flag": [True, False, True, True],
+    })
+
+    def fail(*args, **kwargs):
+        raise AssertionError("nunique should come from the column profile")
+
+    monkeypatch.setattr(pd.Series, "nunique", fail)
+    monkeypatch.setattr(pd.DataFrame, "nunique", fail)
+
+    result = dfSummary(frame, max_level=2, show_graph=True)
+
+    assert result.data.loc[0, "Freqs / (% of Valid)"] == "3 distinct values"
+    assert result.data.loc[1, "Stats / Values"] == "1. 1<br>2. 2"
+
+
+def test_df_summary_approx_mode_reports_estimates():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({
+        "number": rng.normal(size=5_000),
+        "label": rng.choice(["a", "b", "c"], size=5_000),
+    })
+
+    result = dfSummary(frame, max_level=2, approx=True)
+
+    assert "approximate" in result.caption
+    assert "distinct values<br>(&plusmn;" in result.data.loc[0, "Freqs / (% of Valid)"]
+    assert result.data.loc[1, "Stats / Values"].endswith("3. other")
+    assert result.data.loc[0, "Graph"].startswith("<svg")
+
+
+def test_approx_column_is_read_in_slices():
+    rng = np.random.default_rng(0)
+    number = pd.Series(rng.normal(size=1_000))
+    number[::7] = np.nan
+    number[[3, 5]] = [np.inf, -np.inf]
+    dates = pd.Series(pd.date_range("2020-01-01", periods=1_000, freq="7h", tz="UTC"))
+    dates[::9] = pd.NaT
+
+    for series in (number, dates):
+        whole = _summarize_col_approx(series)
+        assert _summarize_col_approx(series, chunk_rows=37) == whole
+        assert whole["n_missing"] == series.isna().sum()
+
+
+def test_approx_levels_leave_out_missing_values_like_exact_ones():
+    for series in (pd.Series(["a", "b", None, None, None, "a"] * 10), pd.Series([1.5, 2.5, np.nan, np.nan, 1.5] * 10)):
+        exact, approx = _summarize_col(series), _summarize_col_approx(series)
+
+        for key in ("Stats / Values", "Freqs / (% of Valid)", "n_missing"):
+            assert approx[key] == exact[key]
+        assert "nan" not in approx["Stats / Values"]
+
+
+def test_all_missing_dates_are_summarized_without_a_range():
+    dates = pd.Series([pd.NaT] * 3, dtype="datetime64[ns]")
+
+    exact = _summarize_col(dates)
+
+    assert exact["Stats / Values"] == "" and exact["n_missing"] == 3
+    assert _summarize_col_approx(dates, chunk_rows=2) == exact
+
+
+def test_df_summary_names_table_without_inspecting_the_stack(monkeypatch):
+    import inspect
+    monkeypatch.setattr(inspect, "stack", lambda *args, **kwargs: pytest.fail("inspect.stack called"))
+    titanic = pd.DataFrame({"age": [22.0, 38.0, 26.0]})
+
+    assert "<br>titanic<br>" in dfSummary(titanic, show_graph=False).caption
+    assert "<br>passengers<br>" in dfSummary(titanic, show_graph=False, name="passengers").caption
+
+
+def test_df_summary_process_pool_matches_serial_and_is_reused():
+    from summarytools import parallel
+
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({
+        "number": rng.normal(size=200),
+        "count": rng.integers(0, 3, size=200).astype("int32"),
+        "label": rng.choice(["a", "b"], size=200),
+        "date": pd.Timestamp("2021-01-01") + pd.to_timedelta(rng.integers(0, 9, size=200), unit="D"),
+    }, index=rng.permutation(200))
+
+    expected = dfSummary(frame).data
+    pd.testing.assert_frame_equal(dfSummary(frame, num_proc=2).data, expected)
+    pool = parallel._POOLS[2]
+    pd.testing.assert_frame_equal(dfSummary(frame, num_proc=2).data, expected)
+    assert parallel._POOLS[2] is pool
+
+
+def test_df_summary_thread_executor_matches_serial():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({f"x{i}": rng.normal(size=100) for i in range(6)})
+    frame["label"] = rng.choice(["a", "b"], size=100)
+
+    expected = dfSummary(frame, executor="serial").data
+    result = dfSummary(frame, executor="thread", num_workers=3).data
+
+    pd.testing.assert_frame_equal(result, expected)
+    for executor in ("thread", "serial"):
+        with pytest.raises(ValueError, match="does not take `num_proc`"):
+            dfSummary(frame, executor=executor, num_proc=2)
+
+
+def test_deferred_graphs_must_be_rendered_before_the_table():
+    from summarytools.graphs import _DEFERRED, _render_deferred
+    from summarytools.summary import _summary_table
+
+    stats = [_summarize_col(pd.Series([1.0, 2.0, 2.0]), graph_backend=_DEFERRED)]
+
+    with pytest.raises(AssertionError, match="deferred graphs"):
+        _summary_table(["x"], ["float64"], stats, 3)
+    assert _render_deferred(stats)[0]["Graph"].startswith("<svg")
+
+
+def test_executor_is_validated_and_chosen_from_frame_shape():
+    from summarytools.parallel import _resolve_executor
+
+    with pytest.raises(ValueError, match="`executor` must be one of"):
+        dfSummary(pd.DataFrame({"a": [1]}), executor="gpu")
+
+    small = pd.DataFrame({"a": range(10), "b": range(10)})
+    large = pd.DataFrame(np.zeros((500_000, 2)))
+    assert _resolve_executor(small, "auto", 4) == ("serial", 4)
+    assert _resolve_executor(large, "auto", 4) == ("thread", 4)
+    assert _resolve_executor(large, "auto", 1) == ("serial", 1)
+    assert _resolve_executor(large, "process", 2) == ("process", 2)
+
+
+def test_summary_plan_classifies_dtypes():
+    frame = pd.DataFrame({
+        "i32": np.arange(4, dtype="int32"),
+        "f32": np.zeros(4, dtype="float32"),
+        "nullable": pd.array([1, None, 2, 3], dtype="Int64"),
+        "flag": pd.array([True, None, False, True], dtype="boolean"),
+        "text": pd.Series(list("abcd"), dtype="string"),
+        "level": pd.Categorical(list("abab")),
+        "when": pd.date_range("2021-01-01", periods=4),
+        "span": pd.to_timedelta(np.arange(4), unit="D"),
+    })
+
+    plan = summary_plan(frame)
+
+    assert plan["column"].tolist() == list(frame.columns)
+    assert plan["kind"].tolist() == ["numeric", "numeric", "numeric", "bool", "categorical", "categorical",
+                                     "datetime", "unsupported"]
+
+
+@pytest.mark.parametrize("dtype", ["int32", "uint8", "float32", "Int64"])
+def test_low_cardinality_numbers_of_any_width_are_shown_by_level(dtype):
+    x = pd.Series([1, 2, 2, 3] * 5, dtype=dtype)
+
+    result = _summarize_col(x, max_level=10, show_graph=False)
+
+    assert result["Stats / Values"].startswith("1. 2")
+    assert "min < med < max" not in result["Stats / Values"]
+
+
+def test_dfsummary_outputs_plain_stats():
+    data = pd.DataFrame({"x": [1.0, 2.0, 3.0, None], "g": ["a", "b", "a", "a"]})
+
+    result = dfSummary(data, output="data", max_level=1)
+    cols = result["columns"].set_index("column")
+
+    assert (result["n_rows"], result["n_cols"], result["n_duplicates"]) == (4, 2, 0)
+    assert cols.loc["x", "kind"] == "numeric" and cols.loc["x", "n_missing"] == 1
+    assert cols.loc["x", ["mean", "min", "median", "max"]].tolist() == [2.0, 1.0, 2.0, 3.0]
+    assert cols.loc["g", "top"] == {"a": 3} and cols.loc["g", "n_other"] == 1
+
+
+def test_dfsummary_plain_stats_reject_options_they_ignore():
+    data = pd.DataFrame({"x": [1.0, 2.0, 3.0, None]})
+
+    for options in ({"approx": True}, {"cache": True}, {"executor": "thread"}, {"num_workers": 2}):
+        with pytest.raises(ValueError, match="output = 'data' does not take"):
+            dfSummary(data, output="data", **options)
+    with pytest.raises(ValueError, match="return_state = True does not take `output`"):
+        dfSummary(data, output="data", return_state=True)
+
+
+def test_dfsummary_html_output_matches_styler_rows():
+    data = pd.DataFrame({"x": [1.0, 2.0, 3.0, None], "g": ["a", "b", "a", "a"]})
+
+    html = dfSummary(data, output="html", name="data")
+    styler = dfSummary(data, name="data")
+
+    assert isinstance(html, str)
+    assert html.count("<tr>") == len(styler.data) + 1
+    for cell in styler.data.iloc[:, 1:].to_numpy().ravel():
+        assert cell in html
+    assert styler.caption in html
+
+
+def test_dfsummary_styles_columns_once_instead_of_every_cell():
+    data = pd.DataFrame({f"c{i}": [i, i + 1, i + 2] for i in range(20)})
+
+    html = dfSummary(data, name="data").to_html()
+
+    assert "_row" not in html
+    assert html.count("td.col1 {") == 1
+    assert html.count("min-width: 150px") == 1
+
+
+def test_dfsummary_pages_are_rendered_on_demand():
+    data = pd.DataFrame({f"c{i}": [i, i + 1, i + 1] for i in range(5)})
+
+    pages = dfSummary(data, page_size=2, name="data", output="html")
+
+    assert len(pages) == 3
+    assert list(pages._pages) == [0]
+    assert "Columns: 3-4 of 5" in pages[1] and "<strong>c2</strong>" in pages[1]
+    assert "Duplicates" not in pages[0] and "Duplicates" not in pages[1]
+    assert '<td class="col0">5</td>' in pages[-1] and "Duplicates: 1" in pages[-1]
+    assert sorted(pages._pages) == [0, 1, 2]
+    assert pages.tabset(display=False).count("tablinks") >= 3
+    with pytest.raises(IndexError):
+        pages[3]
+    with pytest.raises(ValueError, match="page_size"):
+        dfSummary(data, page_size=0)
+    for output in ("styler", "data"):
+        with pytest.raises(ValueError, match="output = 'html'"):
+            dfSummary(data, page_size=2, output=output)
+
+
+def test_dfsummary_first_page_does_not_count_duplicates(monkeypatch):
+    import summarytools.summary as summary
+
+    data = pd.DataFrame({f"c{i}": [i, i + 1, i + 1] for i in range(5)})
+    monkeypatch.setattr(summary, "_DuplicateCounter", lambda *args: pytest.fail("duplicates counted"))
+
+    assert "Columns: 1-2 of 5" in dfSummary(data, page_size=2, output="html")[0]
+
+
+def test_dfsummary_stream_yields_rows_as_columns_are_summarized(monkeypatch):
+    import re
+
+    import summarytools.summary as summary
+
+    data = pd.DataFrame({"x": [1.0, 2.0, 3.0, None], "g": ["a", "b", "a", "a"], "y": [4, 5, 6, 7]})
+    calls = []
+    get_stats = summary._get_stats
+    monkeypatch.setattr(summary, "_get_stats", lambda frame, *args: calls.append(frame.shape[1]) or
+                        get_stats(frame, *args))
+    counter = summary._DuplicateCounter
+    monkeypatch.setattr(summary, "_DuplicateCounter", lambda *args: calls.append("duplicates") or counter(*args))
+
+    pieces = dfSummary(data, name="data", stream=True, output="html", executor="serial", page_size=1)
+    head = next(pieces)
+    assert "<thead>" in head and "Duplicates" not in head and calls == []
+    first_row = next(pieces)
+    assert first_row.count("<tr>") == 1 and calls == [1]
+    html = head + first_row + "".join(pieces)
+    assert calls == [1, 1, 1, "duplicates"]
+
+    calls.clear()
+    batched = "".join(dfSummary(data, name="data", stream=True, output="html", executor="serial"))
+    assert calls == [3, "duplicates"]
+
+    footer = '<tfoot>\n<tr><td colspan="6">Duplicates: 0</td></tr>\n</tfoot>\n'
+    expected = dfSummary(data, name="data", output="html", count_duplicates=False)
+    expected = expected.replace("</table>", footer + "</table>")
+    assert re.sub("T_st[0-9a-f]+", "", html) == re.sub("T_st[0-9a-f]+", "", expected)
+    assert re.sub("T_st[0-9a-f]+", "", batched) == re.sub("T_st[0-9a-f]+", "", expected)
+    calls.clear()
+    "".join(dfSummary(data, stream=True, output="html", executor="serial", count_duplicates=False))
+    assert calls == [3]
+    for options in ({}, {"output": "data"}, {"output": "html", "is_collapsible": True}):
+        with pytest.raises(ValueError, match="stream"):
+            dfSummary(data, stream=True, **options)